@@ -0,0 +1,104 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:05
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0013_add_fields_to_community_initiative'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='financialdocument',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name='Tamaño (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='financialdocument',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Páginas'),
+        ),
+        migrations.AddField(
+            model_name='financialdocument',
+            name='page_height',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Alto de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='financialdocument',
+            name='page_width',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Ancho de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='financialdocument',
+            name='preview_image',
+            field=models.ImageField(blank=True, editable=False, help_text='Miniatura de la primera página (se genera automáticamente)', upload_to=core.models.preview_upload_to, verbose_name='Vista previa'),
+        ),
+        migrations.AddField(
+            model_name='financialdocument',
+            name='preview_source',
+            field=models.CharField(blank=True, editable=False, help_text='Archivo a partir del cual se generó la vista previa', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name='Tamaño (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Páginas'),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='page_height',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Alto de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='page_width',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Ancho de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='preview_image',
+            field=models.ImageField(blank=True, editable=False, help_text='Miniatura de la primera página (se genera automáticamente)', upload_to=core.models.preview_upload_to, verbose_name='Vista previa'),
+        ),
+        migrations.AddField(
+            model_name='memorydocument',
+            name='preview_source',
+            field=models.CharField(blank=True, editable=False, help_text='Archivo a partir del cual se generó la vista previa', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name='Tamaño (bytes)'),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Páginas'),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='page_height',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Alto de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='page_width',
+            field=models.FloatField(blank=True, editable=False, null=True, verbose_name='Ancho de página (pt)'),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='preview_image',
+            field=models.ImageField(blank=True, editable=False, help_text='Miniatura de la primera página (se genera automáticamente)', upload_to=core.models.preview_upload_to, verbose_name='Vista previa'),
+        ),
+        migrations.AddField(
+            model_name='policydocument',
+            name='preview_source',
+            field=models.CharField(blank=True, editable=False, help_text='Archivo a partir del cual se generó la vista previa', max_length=255),
+        ),
+    ]
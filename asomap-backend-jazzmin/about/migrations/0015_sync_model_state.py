@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0014_pdf_preview'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='communitycategory',
+            name='icon',
+            field=models.CharField(help_text='Nombre del icono de React Icons (ej: FaHeart, FaStar, FaUser). Consulta https://react-icons.github.io/react-icons/ para encontrar el icono correcto.', max_length=50, verbose_name='Icono'),
+        ),
+    ]
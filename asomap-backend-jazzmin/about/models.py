@@ -2,6 +2,8 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
+from core.models import PdfPreviewModel
+
 class Hero(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
@@ -240,7 +242,7 @@ class CommunitySupport(models.Model):
     def __str__(self):
         return self.title
 
-class FinancialDocument(models.Model):
+class FinancialDocument(PdfPreviewModel):
     """
     Modelo para documentos financieros (auditados y trimestrales)
     """
@@ -323,7 +325,7 @@ class FinancialStatementsConfig(models.Model):
             FinancialStatementsConfig.objects.exclude(pk=self.pk).update(is_active=False)
         super().save(*args, **kwargs)
 
-class MemoryDocument(models.Model):
+class MemoryDocument(PdfPreviewModel):
     """
     Modelo para documentos de memoria anual
     """
@@ -384,7 +386,7 @@ class MemoryConfig(models.Model):
             MemoryConfig.objects.exclude(pk=self.pk).update(is_active=False)
         super().save(*args, **kwargs)
 
-class PolicyDocument(models.Model):
+class PolicyDocument(PdfPreviewModel):
     """
     Modelo para documentos de políticas individuales
     """
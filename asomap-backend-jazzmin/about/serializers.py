@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.serializers import PdfPreviewField, ResponsiveImageField
 from .models import (
     FinancialDocument, FinancialStatementsConfig, Hero, QuienesSomos, NuestraHistoria, Mision, Vision, 
     Valor, Director, CommunitySupport, CommunityCategory, CommunityInitiative,
@@ -12,6 +13,7 @@ class HeroSerializer(serializers.ModelSerializer):
 
 class QuienesSomosSerializer(serializers.ModelSerializer):
     paragraphs = serializers.SerializerMethodField()
+    image_src_responsive = ResponsiveImageField(source='image_src')
     
     class Meta:
         model = QuienesSomos
@@ -48,6 +50,8 @@ class ValorSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 class DirectorSerializer(serializers.ModelSerializer):
+    image_src_responsive = ResponsiveImageField(source='image_src')
+
     class Meta:
         model = Director
         fields = '__all__'
@@ -107,10 +111,12 @@ class FinancialDocumentSerializer(serializers.ModelSerializer):
     """
     Serializer para documentos financieros individuales
     """
+    preview = PdfPreviewField()
+
     class Meta:
         model = FinancialDocument
         fields = [
-            'id', 'title', 'file', 'document_type', 'quarter',
+            'id', 'title', 'file', 'preview', 'document_type', 'quarter',
             'is_active', 'created_at', 'updated_at'
         ]
 
@@ -138,10 +144,12 @@ class MemoryDocumentSerializer(serializers.ModelSerializer):
     """
     Serializer para documentos de memoria individuales
     """
+    preview = PdfPreviewField()
+
     class Meta:
         model = MemoryDocument
         fields = [
-            'id', 'file', 'year',
+            'id', 'file', 'preview', 'year',
             'is_active', 'created_at', 'updated_at'
         ]
 
@@ -169,10 +177,12 @@ class PolicyDocumentSerializer(serializers.ModelSerializer):
     """
     Serializer para documentos de políticas individuales
     """
+    preview = PdfPreviewField()
+
     class Meta:
         model = PolicyDocument
         fields = [
-            'id', 'title', 'description', 'file', 'last_update',
+            'id', 'title', 'description', 'file', 'preview', 'last_update',
             'is_active', 'created_at', 'updated_at'
         ]
 
@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from about.models import PolicyCategory, PolicyConfig
+
+
+class CachedConditionalGetTests(TestCase):
+    """
+    Verifica que los endpoints con caché de respuestas siguen respondiendo
+    304 cuando la respuesta sale del caché, sin consultar la BD, y que el
+    ETag cambia al editar.
+    """
+
+    URL = '/api/about/policies/'
+
+    def setUp(self):
+        cache.clear()
+        self.config = PolicyConfig.objects.create(
+            title='Políticas', description='Descripción', download_text='Descargar',
+            last_update_text='Actualizado', all_policies_text='Todas'
+        )
+        PolicyCategory.objects.create(title='Crédito', icon='credit', description='Descripción')
+
+    def test_not_modified_after_cache_hit(self):
+        first = self.client.get(self.URL)
+        cached = self.client.get(self.URL)
+
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.json(), first.json())
+        self.assertEqual(cached['ETag'], first['ETag'])
+        self.assertIn('Last-Modified', cached)
+
+        # Entre ediciones la revalidación no consulta la BD
+        with self.assertNumQueries(0):
+            response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=cached['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        self.config.title = 'Políticas institucionales'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.config.save()
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=cached['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Políticas institucionales')
+        self.assertNotEqual(response['ETag'], cached['ETag'])
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False)
+    def test_validators_computed_without_shared_cache(self):
+        etag = self.client.get(self.URL)['ETag']
+
+        # Sin caché compartido los validadores se calculan en cada petición
+        # (una agregación por modelo)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.config.title = 'Políticas institucionales'
+        self.config.save()
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Políticas institucionales')
@@ -3,6 +3,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
+from core.cache import cached_response
+from core.documents import preview_data
+from core.mixins import ConditionalGetMixin, conditional_get
+from core.query_budget import query_budget
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 from .models import (
@@ -57,7 +61,7 @@ class AboutPagination(PageNumberPagination):
         tags=['about']
     )
 )
-class AboutViewSet(viewsets.ModelViewSet):
+class AboutViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     pagination_class = AboutPagination
     queryset = Hero.objects.all()
     serializer_class = HeroSerializer
@@ -123,6 +127,8 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='hero')
+    @conditional_get('about.Hero')
+    @cached_response('about:hero', models=['about.Hero'])
     def hero(self, request):
         """
         Obtener información del Hero Section
@@ -146,6 +152,8 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='quienes-somos')
+    @conditional_get('about.QuienesSomos')
+    @cached_response('about:quienes-somos', models=['about.QuienesSomos'])
     def quienes_somos(self, request):
         """
         Obtener información 'Quiénes Somos'
@@ -163,6 +171,8 @@ class AboutViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='nuestra-historia')
+    @conditional_get('about.NuestraHistoria')
+    @cached_response('about:nuestra-historia', models=['about.NuestraHistoria'])
     def nuestra_historia(self, request):
         """
         Obtener historia de la institución
@@ -184,6 +194,8 @@ class AboutViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='mision')
+    @conditional_get('about.Mision')
+    @cached_response('about:mision', models=['about.Mision'])
     def mision(self, request):
         """
         Obtener misión de la empresa
@@ -201,6 +213,8 @@ class AboutViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='vision')
+    @conditional_get('about.Vision')
+    @cached_response('about:vision', models=['about.Vision'])
     def vision(self, request):
         """
         Obtener visión de la empresa
@@ -218,6 +232,8 @@ class AboutViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='valores')
+    @conditional_get('about.Valor')
+    @cached_response('about:valores', models=['about.Valor'])
     def valores(self, request):
         """
         Obtener valores corporativos
@@ -238,7 +254,52 @@ class AboutViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
     
+    @extend_schema(
+        summary="Obtener página Nosotros completa",
+        description=(
+            "Retorna en una sola respuesta hero, quiénes somos, nuestra historia, "
+            "misión, visión, valores y consejo de directores. Las secciones sin "
+            "registro activo se retornan como null."
+        ),
+        responses={200: OpenApiTypes.OBJECT},
+        tags=['about']
+    )
+    @action(detail=False, methods=['get'], url_path='bundle')
+    @query_budget(7)
+    @cached_response('about:bundle', models=[
+        'about.Hero', 'about.QuienesSomos', 'about.NuestraHistoria',
+        'about.Mision', 'about.Vision', 'about.Valor', 'about.Director'
+    ])
+    def bundle(self, request):
+        """
+        Obtener todas las secciones de la página Nosotros
+        
+        Reemplaza las peticiones separadas a hero, quienes-somos,
+        nuestra-historia, mision, vision, valores y consejo-directores: una
+        consulta por sección y una sola entrada de caché para todo el bloque.
+        Las listas se retornan completas, sin paginar.
+        """
+        def single(model, serializer_class):
+            obj = model.objects.filter(is_active=True).first()
+            return serializer_class(obj).data if obj else None
+        
+        def many(model, serializer_class):
+            queryset = model.objects.filter(is_active=True).order_by('-created_at')
+            return serializer_class(queryset, many=True).data
+        
+        return Response({
+            'hero': single(Hero, HeroSerializer),
+            'quienesSomos': single(QuienesSomos, QuienesSomosSerializer),
+            'nuestraHistoria': many(NuestraHistoria, NuestraHistoriaSerializer),
+            'mision': single(Mision, MisionSerializer),
+            'vision': single(Vision, VisionSerializer),
+            'valores': many(Valor, ValorSerializer),
+            'consejoDirectores': many(Director, DirectorSerializer),
+        })
+    
     @action(detail=False, methods=['get'], url_path='consejo-directores')
+    @conditional_get('about.Director')
+    @cached_response('about:consejo-directores', models=['about.Director'])
     def consejo_directores(self, request):
         """
         Obtener consejo directivo
@@ -266,6 +327,8 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='community-categories')
+    @conditional_get('about.CommunityCategory')
+    @cached_response('about:community-categories', models=['about.CommunityCategory'])
     def community_categories(self, request):
         """
         Obtener categorías de apoyo comunitario
@@ -293,6 +356,11 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='community-initiatives')
+    @conditional_get('about.CommunityInitiative', 'about.CommunityCategory')
+    @cached_response('about:community-initiatives', models=[
+        'about.CommunityInitiative',
+        'about.CommunityCategory',
+    ])
     def community_initiatives(self, request):
         """
         Obtener iniciativas de apoyo comunitario
@@ -320,6 +388,12 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='community-support')
+    @conditional_get('about.CommunitySupport', 'about.CommunityCategory', 'about.CommunityInitiative')
+    @cached_response('about:community-support', models=[
+        'about.CommunitySupport',
+        'about.CommunityCategory',
+        'about.CommunityInitiative',
+    ])
     def community_support(self, request):
         """
         Obtener información completa de apoyo comunitario
@@ -360,6 +434,11 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='financial-statements')
+    @conditional_get('about.FinancialDocument', 'about.FinancialStatementsConfig')
+    @cached_response('about:financial-statements', models=[
+        'about.FinancialDocument',
+        'about.FinancialStatementsConfig',
+    ])
     def financial_statements(self, request):
         """
         Obtener información completa de estados financieros
@@ -405,7 +484,8 @@ class AboutViewSet(viewsets.ModelViewSet):
                 
                 doc_data = {
                     'title': doc.title,
-                    'url': doc.file.url if doc.file else None
+                    'url': doc.file.url if doc.file else None,
+                    'preview': preview_data(doc)
                 }
                 
                 if doc.document_type == 'quarterly' and doc.quarter:
@@ -446,6 +526,8 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='memories')
+    @conditional_get('about.MemoryDocument', 'about.MemoryConfig')
+    @cached_response('about:memories', models=['about.MemoryDocument', 'about.MemoryConfig'])
     def memories(self, request):
         """
         Obtener información completa de memorias anuales
@@ -488,7 +570,8 @@ class AboutViewSet(viewsets.ModelViewSet):
                 
                 # Agregar documento al año correspondiente
                 years_dict[year]['documents'].append({
-                    'url': doc.file.url if doc.file else None
+                    'url': doc.file.url if doc.file else None,
+                    'preview': preview_data(doc)
                 })
             
             # Convertir a lista y ordenar por año descendente
@@ -522,6 +605,12 @@ class AboutViewSet(viewsets.ModelViewSet):
         tags=['about']
     )
     @action(detail=False, methods=['get'], url_path='policies')
+    @conditional_get('about.PolicyDocument', 'about.PolicyCategory', 'about.PolicyConfig')
+    @cached_response('about:policies', models=[
+        'about.PolicyDocument',
+        'about.PolicyCategory',
+        'about.PolicyConfig',
+    ])
     def policies(self, request):
         """
         Obtener información completa de políticas organizacionales
@@ -570,6 +659,7 @@ class AboutViewSet(viewsets.ModelViewSet):
                         'title': doc.title,
                         'description': doc.description,
                         'url': doc.file.url if doc.file else None,
+                        'preview': preview_data(doc),
                         'lastUpdate': doc.last_update.strftime('%Y-%m-%d') if doc.last_update else None
                     }
                     category_data['documents'].append(document_data)
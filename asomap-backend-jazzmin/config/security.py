@@ -34,15 +34,18 @@ class SecurityMiddleware:
             client_ip = self.get_client_ip(request)
             cache_key = f"rate_limit_{client_ip}"
             
-            # Obtener intentos actuales
-            attempts = cache.get(cache_key, 0)
+            # Incrementar contador de forma atómica (consistente entre workers)
+            cache.add(cache_key, 0, 60)
+            try:
+                attempts = cache.incr(cache_key)
+            except ValueError:
+                # La clave expiró entre add() e incr()
+                cache.set(cache_key, 1, 60)
+                attempts = 1
             
             # Límite: 100 requests por minuto
-            if attempts >= 100:
+            if attempts > 100:
                 return False
-            
-            # Incrementar contador
-            cache.set(cache_key, attempts + 1, 60)
         
         return True
     
@@ -21,6 +21,7 @@ from django.conf.urls.static import static
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
 from django.http import JsonResponse
+from core.views import metrics_view
 
 def health_check(request):
     """Healthcheck mínimo: siempre 200 sin tocar BD ni inicializar nada extra."""
@@ -30,6 +31,8 @@ urlpatterns = [
     # Healthcheck endpoints - MÁXIMA PRIORIDAD
     path('health/', health_check, name='health_check'),
     path('healthcheck/', health_check, name='health_check_alt'),
+    # Métricas Prometheus (protegido con METRICS_TOKEN o usuario staff)
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # Servir archivos de media PRIMERO (antes de las APIs)
@@ -47,6 +50,8 @@ urlpatterns += [
     path('api/financial-guidance/', include('educacionfinanciera.urls')),
     path('api/', include('prousuario.urls')),
     path('api/', include('service.urls')),
+    path('api/', include('search.urls')),
+    path('api/', include('uploads.urls')),
     
     # API Documentation (Swagger/OpenAPI)
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import EmailConfiguration, EmailLog
+from .models import EmailConfiguration, EmailLog, Job, MediaBlob
 
 
 @admin.register(EmailConfiguration)
@@ -169,34 +169,37 @@ class EmailLogAdmin(admin.ModelAdmin):
     actions = ['resend_failed_emails', 'export_email_logs']
     
     def resend_failed_emails(self, request, queryset):
-        """Reenviar emails fallidos"""
-        failed_emails = queryset.filter(status='failed')
-        count = 0
+        """
+        Reenviar emails fallidos
+
+        Todos los emails se envían por una sola conexión SMTP autenticada
+        (un único handshake) usando la configuración activa.
+        """
+        from core.email_backends import config_connection
+        from core.email_utils import get_active_email_config, send_pending_email
         
-        for email_log in failed_emails:
-            try:
-                # Intentar reenviar
-                from core.email_utils import send_email_with_db_config
-                result = send_email_with_db_config(
-                    subject=email_log.subject,
-                    message=email_log.message,
-                    recipient_list=[email_log.to_email],
-                    html_message=email_log.html_message,
-                    fail_silently=True
-                )
-                
-                if result:
-                    email_log.status = 'sent'
-                    email_log.save()
-                    count += 1
-                    
-            except Exception as e:
-                email_log.error_message = str(e)
-                email_log.save()
+        failed_emails = list(queryset.filter(status='failed'))
+        config = get_active_email_config()
+        if not config or not config.is_configured:
+            self.message_user(request, '❌ No hay configuración de email válida', level='ERROR')
+            return
+        
+        count = 0
+        try:
+            with config_connection(config) as connection:
+                for email_log in failed_emails:
+                    email_log.email_config = config
+                    email_log.attempts += 1
+                    email_log.save(update_fields=['email_config', 'attempts'])
+                    if send_pending_email(email_log, connection=connection, retry=False):
+                        count += 1
+        except Exception as e:
+            self.message_user(request, f'❌ Error conectando al servidor SMTP: {e}', level='ERROR')
+            return
         
         self.message_user(
             request,
-            f'✅ {count} emails reenviados exitosamente de {failed_emails.count()} fallidos'
+            f'✅ {count} emails reenviados exitosamente de {len(failed_emails)} fallidos'
         )
     
     resend_failed_emails.short_description = "Reenviar emails fallidos"
@@ -229,12 +232,118 @@ class EmailLogAdmin(admin.ModelAdmin):
     export_email_logs.short_description = "Exportar logs a CSV"
 
 
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Admin para las tareas en segundo plano - Solo lectura"""
+    
+    list_display = [
+        'task', 'object_label', 'status', 'attempts',
+        'created_at', 'finished_at', 'duration'
+    ]
+    
+    list_filter = ['status', 'task', 'created_at']
+    
+    search_fields = ['task', 'error_message']
+    
+    readonly_fields = [
+        'task', 'payload', 'status', 'attempts', 'next_attempt_at',
+        'result', 'error_message', 'created_at', 'started_at',
+        'finished_at', 'duration'
+    ]
+    
+    fieldsets = (
+        ('Tarea', {
+            'fields': ('task', 'payload')
+        }),
+        ('Estado y Seguimiento', {
+            'fields': ('status', 'attempts', 'next_attempt_at', 'error_message', 'result')
+        }),
+        ('Tiempos', {
+            'fields': ('created_at', 'started_at', 'finished_at', 'duration')
+        }),
+    )
+    
+    ordering = ['-created_at']
+    
+    actions = ['retry_jobs']
+    
+    def has_add_permission(self, request):
+        """Las tareas solo se crean desde el código"""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """No permitir editar tareas desde el admin"""
+        return False
+    
+    def object_label(self, obj):
+        """Muestra el objeto procesado (modelo #pk) si la tarea lo indica"""
+        if 'model' in obj.payload and 'pk' in obj.payload:
+            return f"{obj.payload['model']} #{obj.payload['pk']}"
+        return '-'
+    object_label.short_description = 'Objeto'
+    
+    def duration(self, obj):
+        """Muestra la duración de la última ejecución"""
+        if obj.duration:
+            return f"{obj.duration.total_seconds():.2f} segundos"
+        return '-'
+    duration.short_description = 'Duración'
+    
+    def retry_jobs(self, request, queryset):
+        """Vuelve a encolar las tareas fallidas"""
+        from django.utils import timezone
+        
+        count = queryset.filter(status='failed').update(
+            status='pending',
+            attempts=0,
+            error_message=None,
+            next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f'✅ {count} tareas fallidas vueltas a encolar')
+    
+    retry_jobs.short_description = "Reintentar tareas fallidas"
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    """Admin para los archivos deduplicados - Solo lectura"""
+    
+    list_display = ['name', 'size_display', 'ref_count', 'created_at', 'updated_at']
+    
+    list_filter = ['created_at']
+    
+    search_fields = ['digest', 'name']
+    
+    readonly_fields = ['digest', 'name', 'size', 'ref_count', 'created_at', 'updated_at']
+    
+    ordering = ['-created_at']
+    
+    def has_add_permission(self, request):
+        """Los blobs solo se crean al subir archivos"""
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        """No permitir editar blobs desde el admin"""
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        """Los blobs sin referencias los elimina collect_media_garbage"""
+        return False
+    
+    def size_display(self, obj):
+        """Muestra el tamaño en KB"""
+        return f"{obj.size / 1024:.1f} KB"
+    size_display.short_description = 'Tamaño'
+
+
 # Configurar orden personalizado para los modelos de core
 def organize_core_admin_models():
     """Organiza los modelos del admin de core con numeración"""
     model_order = [
         (EmailConfiguration, "1. ⚙️ Configuraciones de Email"),
         (EmailLog, "2. 📧 Registros de Emails"),
+        (Job, "3. ⚙️ Tareas en Segundo Plano"),
+        (MediaBlob, "4. ♻️ Archivos Deduplicados"),
     ]
     
     for model, name in model_order:
@@ -2,4 +2,11 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'core' 
\ No newline at end of file
+    name = 'core'
+
+    def ready(self):
+        """Registra las señales, los checks de sistema y las tareas en segundo plano"""
+        from django.utils.module_loading import autodiscover_modules
+
+        from . import checks, signals  # noqa: F401
+        autodiscover_modules('tasks')
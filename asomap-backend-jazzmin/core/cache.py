@@ -0,0 +1,154 @@
+"""
+Caché de respuestas para los endpoints singleton del CMS
+
+Los endpoints como header-data, footer, hero o debit-card-promo devuelven
+prácticamente siempre el mismo contenido, pero se reconstruyen en cada
+petición. Este módulo guarda el `Response.data` serializado en el caché de
+Django, con una clave por endpoint y query string, y lo invalida mediante
+señales cuando cambia cualquiera de los modelos que alimentan el endpoint.
+"""
+import hashlib
+import logging
+from collections import defaultdict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = 'api-response'
+
+# Registro modelo -> endpoints que dependen de él (se llena con @cached_response)
+_model_dependencies = defaultdict(set)
+
+
+def get_response_cache_timeout():
+    """Retorna el tiempo de vida configurado para las respuestas cacheadas"""
+    return getattr(settings, 'API_RESPONSE_CACHE_TIMEOUT', 3600)
+
+
+def response_cache_enabled():
+    """
+    Indica si se pueden cachear respuestas y valores derivados de la BD
+
+    Es False con un caché por proceso (locmem) y varios workers, donde las
+    invalidaciones no llegan a los demás procesos (ver settings).
+    """
+    return getattr(settings, 'API_RESPONSE_CACHE_ENABLED', True)
+
+
+def _version_key(endpoint):
+    return f'{CACHE_KEY_PREFIX}:{endpoint}:version'
+
+
+def _get_version(endpoint):
+    """
+    Retorna la versión actual del endpoint
+
+    En lugar de borrar todas las variantes de query string de un endpoint,
+    se incrementa su versión y las claves anteriores quedan huérfanas hasta
+    que expiran.
+    """
+    version = cache.get(_version_key(endpoint))
+    if version is None:
+        version = 1
+        cache.add(_version_key(endpoint), version, None)
+    return version
+
+
+def build_cache_key(endpoint, request):
+    """Construye la clave de caché para un endpoint y su query string"""
+    query = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+    )
+    # El host forma parte de la clave porque la paginación genera URLs absolutas
+    raw = repr((request.get_host(), query)).encode('utf-8')
+    query_hash = hashlib.md5(raw).hexdigest()
+    return f'{CACHE_KEY_PREFIX}:{endpoint}:v{_get_version(endpoint)}:{query_hash}'
+
+
+def invalidate_endpoints(*endpoints):
+    """Invalida todas las respuestas cacheadas de los endpoints indicados"""
+    for endpoint in endpoints:
+        key = _version_key(endpoint)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, None)
+        logger.debug(f"Caché invalidado para el endpoint {endpoint}")
+
+
+def _model_version_key(label):
+    return f'{CACHE_KEY_PREFIX}:model:{label}:version'
+
+
+def get_model_versions(labels):
+    """
+    Versión actual de cada modelo ('app_label.model'), que se incrementa con
+    cada guardado o eliminación (ver invalidate_for_model). Permite cachear
+    valores derivados de la BD, como los validadores de core.mixins.
+    """
+    keys = {label: _model_version_key(label) for label in labels}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for label, key in keys.items():
+        if key not in found:
+            cache.add(key, 1, None)
+        versions[label] = found.get(key, 1)
+    return versions
+
+
+def invalidate_for_model(model):
+    """Invalida los endpoints y los valores cacheados que dependen del modelo indicado"""
+    key = _model_version_key(model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, None)
+
+    endpoints = _model_dependencies.get(model._meta.label_lower)
+    if endpoints:
+        invalidate_endpoints(*endpoints)
+
+
+def cached_response(endpoint, models=(), timeout=None):
+    """
+    Decorador para acciones GET de un ViewSet que cachea la respuesta
+
+    Args:
+        endpoint: Nombre único del endpoint (ej. 'header:header-data')
+        models: Modelos ('app_label.ModelName') cuyo cambio invalida el endpoint
+        timeout: Tiempo de vida en segundos (por defecto API_RESPONSE_CACHE_TIMEOUT)
+
+    Solo se cachean respuestas 200; los 404 con debug_info siempre se recalculan.
+    Con API_RESPONSE_CACHE_ENABLED=False la vista se ejecuta siempre.
+    """
+    for model in models:
+        _model_dependencies[model.lower()].add(endpoint)
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method != 'GET' or not response_cache_enabled():
+                return view_method(self, request, *args, **kwargs)
+
+            cache_key = build_cache_key(endpoint, request)
+            data = cache.get(cache_key)
+            if data is not None:
+                return Response(data)
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(
+                    cache_key,
+                    response.data,
+                    timeout if timeout is not None else get_response_cache_timeout()
+                )
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,219 @@
+"""
+Backend de caché basado en SQLite compartido entre procesos
+
+Pensado para instalaciones de un solo servidor sin Redis: todos los workers
+de Gunicorn comparten el mismo archivo, por lo que los contadores de
+throttling y rate limiting son consistentes y sobreviven al reciclaje de
+workers (max_requests). Solo usa la librería estándar.
+
+Configuración:
+    CACHES = {
+        'default': {
+            'BACKEND': 'core.cache_backends.SQLiteCache',
+            'LOCATION': '/ruta/a/cache.sqlite3',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache(BaseCache):
+    """Caché persistente en un archivo SQLite (modo WAL) con incr atómico"""
+
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._path = location
+        self._local = threading.local()
+
+    # Conexión ------------------------------------------------------------
+
+    def _connection(self):
+        """
+        Retorna la conexión del hilo actual
+
+        Se reabre si el proceso cambió (fork de Gunicorn con preload_app) para
+        no compartir el descriptor del proceso maestro entre workers. La
+        conexión se mantiene abierta entre peticiones (close() es no-op).
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache_entries ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS cache_entries_expires ON cache_entries (expires)'
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # Utilidades ----------------------------------------------------------
+
+    def _expiry(self, timeout):
+        """Convierte el timeout de Django en un timestamp absoluto (None = nunca)"""
+        return self.get_backend_timeout(timeout)
+
+    def _prepare_key(self, key, version):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return key
+
+    def _read(self, conn, key):
+        row = conn.execute(
+            'SELECT value, expires FROM cache_entries WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] <= time.time():
+            conn.execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+            return None
+        return row
+
+    def _cull(self, conn):
+        """Elimina entradas expiradas y, si se supera MAX_ENTRIES, las más antiguas"""
+        conn.execute(
+            'DELETE FROM cache_entries WHERE expires IS NOT NULL AND expires <= ?',
+            (time.time(),)
+        )
+        count = conn.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+        if count > self._max_entries:
+            to_delete = count // self._cull_frequency if self._cull_frequency else count
+            conn.execute(
+                'DELETE FROM cache_entries WHERE key IN ('
+                'SELECT key FROM cache_entries ORDER BY expires IS NULL, expires LIMIT ?)',
+                (to_delete,)
+            )
+
+    # API de Django -------------------------------------------------------
+
+    def get(self, key, default=None, version=None):
+        key = self._prepare_key(key, version)
+        row = self._read(self._connection(), key)
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._prepare_key(key, version)
+        conn = self._connection()
+        data = pickle.dumps(value, self.pickle_protocol)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._cull(conn)
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires) VALUES (?, ?, ?)',
+                (key, data, self._expiry(timeout))
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._prepare_key(key, version)
+        conn = self._connection()
+        data = pickle.dumps(value, self.pickle_protocol)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if self._read(conn, key) is not None:
+                conn.execute('COMMIT')
+                return False
+            conn.execute(
+                'INSERT INTO cache_entries (key, value, expires) VALUES (?, ?, ?)',
+                (key, data, self._expiry(timeout))
+            )
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._prepare_key(key, version)
+        conn = self._connection()
+        if self._read(conn, key) is None:
+            return False
+        conn.execute(
+            'UPDATE cache_entries SET expires = ? WHERE key = ?',
+            (self._expiry(timeout), key)
+        )
+        return True
+
+    def delete(self, key, version=None):
+        key = self._prepare_key(key, version)
+        cursor = self._connection().execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+        return cursor.rowcount > 0
+
+    def has_key(self, key, version=None):
+        key = self._prepare_key(key, version)
+        return self._read(self._connection(), key) is not None
+
+    def incr(self, key, delta=1, version=None):
+        """Incremento atómico entre procesos (transacción IMMEDIATE)"""
+        key = self._prepare_key(key, version)
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._read(conn, key)
+            if row is None:
+                raise ValueError(f"Key '{key}' not found")
+            new_value = pickle.loads(row[0]) + delta
+            conn.execute(
+                'UPDATE cache_entries SET value = ? WHERE key = ?',
+                (pickle.dumps(new_value, self.pickle_protocol), key)
+            )
+            conn.execute('COMMIT')
+            return new_value
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def clear(self):
+        self._connection().execute('DELETE FROM cache_entries')
+
+
+def verify_cache(alias='default'):
+    """
+    Verifica que el backend de caché responde (escritura, lectura e incr)
+
+    Se llama al iniciar cada worker de Gunicorn (ver gunicorn.conf.py) y desde
+    el comando health_check.
+
+    Returns:
+        bool: True si el caché funciona correctamente
+    """
+    from django.core.cache import caches
+
+    cache = caches[alias]
+    probe_key = f'cache-probe:{os.getpid()}'
+    try:
+        cache.set(probe_key, 0, 30)
+        cache.incr(probe_key)
+        ok = cache.get(probe_key) == 1
+        cache.delete(probe_key)
+    except Exception as e:
+        logger.error(f"❌ El caché '{alias}' ({cache.__class__.__name__}) no responde: {e}")
+        return False
+
+    if not ok:
+        logger.error(f"❌ El caché '{alias}' ({cache.__class__.__name__}) devolvió un valor inesperado")
+    return ok
@@ -0,0 +1,44 @@
+"""
+Checks de sistema de core
+
+Los que consultan la base de datos se registran con Tags.database, por lo
+que solo se ejecutan con manage.py check --database, migrate y los tests.
+"""
+from django.conf import settings
+from django.core.checks import Info, Tags, Warning, register
+from django.db import connections
+
+
+@register(Tags.database)
+def check_sqlite_pragmas(app_configs, databases=None, **kwargs):
+    """Informa los pragmas activos de cada base SQLite y avisa si alguno no se aplicó"""
+    if not getattr(settings, 'SQLITE_PRAGMAS', {}):
+        return []
+
+    from .sqlite import describe_pragmas, pragma_mismatches
+
+    messages = []
+    # Sin --database (check, runserver) Django pasa databases=None
+    for alias in databases or []:
+        connection = connections[alias]
+        if connection.vendor != 'sqlite':
+            continue
+        try:
+            summary = describe_pragmas(connection)
+            mismatches = pragma_mismatches(connection)
+        except Exception as e:
+            messages.append(Warning(
+                f"No se pudieron leer los pragmas de SQLite de '{alias}': {e}",
+                id='core.W001',
+            ))
+            continue
+
+        messages.append(Info(f"SQLite '{alias}': {summary}", id='core.I001'))
+        for name, expected, current in mismatches:
+            messages.append(Warning(
+                f"SQLite '{alias}': PRAGMA {name} es {current!r}, se configuró {expected!r}",
+                hint='Revise las variables SQLITE_* o que el sistema de archivos admita WAL '
+                     '(no funciona sobre volúmenes de red).',
+                id='core.W002',
+            ))
+    return messages
@@ -0,0 +1,164 @@
+"""
+Vista previa de los documentos PDF subidos
+
+Para los modelos que heredan de core.models.PdfPreviewModel se renderiza la
+primera página como miniatura (WebP, o JPEG si Pillow no tiene WebP) de
+PDF_PREVIEW_WIDTH píxeles de ancho y se guardan en el propio registro la
+cantidad de páginas, el tamaño de página y el peso del archivo. Así las
+páginas de listados muestran una tarjeta de unos pocos KB en lugar de
+descargar el PDF completo en el navegador.
+
+El renderizado lo hace la tarea documents.generate_preview (ver
+core.tasks) en el worker `manage.py run_jobs`, fuera de la petición.
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import features
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+POINTS_PER_MM = 72 / 25.4
+
+
+def enabled():
+    return pdfium is not None and getattr(settings, 'PDF_PREVIEWS_ENABLED', True)
+
+
+def preview_format():
+    """Formato de la miniatura: (extensión, formato de Pillow)"""
+    return ('webp', 'WEBP') if features.check('webp') else ('jpg', 'JPEG')
+
+
+def needs_preview(instance):
+    """Indica si el PDF del objeto cambió desde la última vista previa"""
+    field_file = getattr(instance, instance.pdf_field)
+    return (field_file.name or '') != instance.preview_source
+
+
+def render_preview(field_file):
+    """
+    Renderiza la primera página de un PDF y extrae sus metadatos
+
+    Returns:
+        dict: {'image': bytes, 'page_count', 'page_width', 'page_height'}
+            con el tamaño de página en puntos PDF
+    """
+    width = getattr(settings, 'PDF_PREVIEW_WIDTH', 320)
+    quality = getattr(settings, 'RESPONSIVE_IMAGE_QUALITY', 80)
+    _extension, pil_format = preview_format()
+
+    with field_file.storage.open(field_file.name, 'rb') as source:
+        document = pdfium.PdfDocument(source)
+        try:
+            page = document[0]
+            page_width, page_height = page.get_size()
+            bitmap = page.render(scale=width / page_width)
+            image = bitmap.to_pil().convert('RGB')
+            page.close()
+            page_count = len(document)
+        finally:
+            document.close()
+
+    buffer = BytesIO()
+    image.save(buffer, pil_format, quality=quality)
+    return {
+        'image': buffer.getvalue(),
+        'page_count': page_count,
+        'page_width': round(page_width, 2),
+        'page_height': round(page_height, 2),
+    }
+
+
+def generate_for_instance(instance):
+    """
+    Genera la miniatura y los metadatos del PDF de un objeto
+
+    Los valores se guardan con un UPDATE (sin disparar post_save) que
+    también actualiza updated_at, para que cambie el ETag de los endpoints.
+
+    Returns:
+        bool: True si se generó una vista previa
+    """
+    field_file = getattr(instance, instance.pdf_field)
+    previous = instance.preview_image.name
+    values = {
+        'preview_image': '', 'page_count': None, 'page_width': None,
+        'page_height': None, 'file_size': None,
+        'preview_source': field_file.name or '',
+    }
+
+    if field_file:
+        data = render_preview(field_file)
+        extension, _pil_format = preview_format()
+        root = os.path.splitext(os.path.basename(field_file.name))[0]
+        name = instance.preview_image.field.generate_filename(instance, f'{root}.{extension}')
+        values.update(
+            preview_image=instance.preview_image.storage.save(name, ContentFile(data['image'])),
+            page_count=data['page_count'],
+            page_width=data['page_width'],
+            page_height=data['page_height'],
+            file_size=field_file.size,
+        )
+
+    if 'updated_at' in {field.name for field in instance._meta.concrete_fields}:
+        values['updated_at'] = timezone.now()
+    instance.__class__._default_manager.filter(pk=instance.pk).update(**values)
+
+    if previous and previous != values['preview_image']:
+        delete_preview_file(instance.preview_image.storage, previous)
+    if field_file:
+        logger.info(f"📄 Vista previa generada para {field_file.name} ({values['page_count']} páginas)")
+    return bool(field_file)
+
+
+def delete_preview_file(storage, name):
+    try:
+        if storage.exists(name):
+            storage.delete(name)
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo eliminar la vista previa {name}: {e}")
+
+
+def preview_data(instance):
+    """
+    Representación de la vista previa para la API
+
+    Returns:
+        dict | None: {
+            'thumbnail': URL de la miniatura, 'width', 'height' (px),
+            'pages', 'file_size' (bytes), 'page_size_mm': [ancho, alto]
+        }
+        o None si todavía no se generó
+    """
+    if not instance.preview_image or not instance.page_width:
+        return None
+    width = getattr(settings, 'PDF_PREVIEW_WIDTH', 320)
+    return {
+        'thumbnail': instance.preview_image.url,
+        'width': width,
+        'height': round(width * instance.page_height / instance.page_width),
+        'pages': instance.page_count,
+        'file_size': instance.file_size,
+        'page_size_mm': [
+            round(instance.page_width / POINTS_PER_MM),
+            round(instance.page_height / POINTS_PER_MM),
+        ],
+    }
+
+
+def preview_models():
+    """Modelos con vista previa de PDF"""
+    from .models import PdfPreviewModel
+
+    return [model for model in apps.get_models() if issubclass(model, PdfPreviewModel)]
@@ -0,0 +1,137 @@
+"""
+Backends SMTP construidos desde una EmailConfiguration
+
+Cada backend se crea con los datos de la configuración (sin tocar
+django.conf.settings) y se cachea por hilo y por id de configuración, de
+modo que un lote de emails reutiliza una sola conexión autenticada. Si la
+configuración se edita en el admin (cambia updated_at) el backend se
+reconstruye.
+
+Uso:
+    with config_connection(config) as connection:
+        for email_log in logs:
+            send_pending_email(email_log, connection=connection)
+"""
+import logging
+import smtplib
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+
+logger = logging.getLogger(__name__)
+
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+_local = threading.local()
+_registry = []
+_registry_lock = threading.Lock()
+
+
+class ConfigurationEmailBackend(SMTPEmailBackend):
+    """Backend SMTP de Django configurado desde una EmailConfiguration"""
+
+    def __init__(self, config, **kwargs):
+        super().__init__(
+            host=config.host,
+            port=config.port,
+            username=config.username,
+            password=config.password,
+            use_tls=config.use_tls,
+            timeout=getattr(settings, 'EMAIL_TIMEOUT', None),
+            fail_silently=False,
+            **kwargs
+        )
+        self.config_id = config.pk
+        self.config_version = config.updated_at
+
+    def ensure_open(self):
+        """
+        Abre la conexión o verifica con NOOP que la existente siga viva
+
+        Los servidores SMTP cierran las conexiones inactivas; en ese caso se
+        reconecta en lugar de fallar el siguiente envío.
+        """
+        with self._lock:
+            if self.connection is not None:
+                try:
+                    if self.connection.noop()[0] == 250:
+                        return False
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self.close()
+            try:
+                return self.open()
+            except Exception:
+                # No dejar una conexión a medio abrir (p. ej. AUTH rechazado)
+                self.close()
+                raise
+
+
+def build_backend(config):
+    """
+    Crea el backend para una configuración
+
+    Si EMAIL_BACKEND no es SMTP (consola/locmem en desarrollo y pruebas) se
+    respeta el backend configurado.
+    """
+    if settings.EMAIL_BACKEND == SMTP_BACKEND:
+        return ConfigurationEmailBackend(config)
+    return get_connection(fail_silently=False)
+
+
+def get_backend_for_config(config):
+    """Retorna el backend del hilo actual para la configuración (cacheado por id)"""
+    backends = getattr(_local, 'backends', None)
+    if backends is None:
+        backends = _local.backends = {}
+
+    version, backend = backends.get(config.pk, (None, None))
+    if backend is not None and version == config.updated_at:
+        return backend
+
+    if backend is not None:
+        backend.close()
+        with _registry_lock:
+            _registry.remove(backend)
+    backend = build_backend(config)
+    backends[config.pk] = (config.updated_at, backend)
+    with _registry_lock:
+        _registry.append(backend)
+    return backend
+
+
+def open_connection(backend):
+    """Deja abierta la conexión del backend para reutilizarla en varios envíos"""
+    if isinstance(backend, ConfigurationEmailBackend):
+        return backend.ensure_open()
+    return backend.open()
+
+
+@contextmanager
+def config_connection(config):
+    """Una sola conexión SMTP autenticada para todos los envíos del bloque"""
+    backend = get_backend_for_config(config)
+    open_connection(backend)
+    try:
+        yield backend
+    finally:
+        backend.close()
+
+
+def close_email_connections():
+    """
+    Cierra las conexiones abiertas de todos los hilos
+
+    Solo debe llamarse cuando ningún hilo está enviando (por ejemplo, cuando
+    el worker de la cola queda inactivo).
+    """
+    with _registry_lock:
+        backends = list(_registry)
+    for backend in backends:
+        try:
+            backend.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error cerrando conexión de email: {e}")
@@ -1,7 +1,20 @@
-from django.core.mail import send_mail
+import logging
+import random
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives
 from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from .email_backends import get_backend_for_config, open_connection
 from .models import EmailConfiguration
 
+logger = logging.getLogger(__name__)
+
+# Tiempo que un email reclamado por el worker queda reservado; si el worker
+# muere a mitad del envío, el email vuelve a estar disponible al vencer
+CLAIM_LEASE_SECONDS = 300
+
 
 def get_active_email_config():
     """
@@ -26,11 +39,17 @@ def get_active_email_config():
         return None
 
 
-def send_email_with_db_config(subject, message, recipient_list, html_message=None, fail_silently=True, email_type='other', claim_request=None, fraud_report=None):
+def send_email_with_db_config(subject, message, recipient_list, html_message=None, fail_silently=True, email_type='other', claim_request=None, fraud_report=None, from_email=None, immediate=False):
     """
-    Envía email usando la configuración de la base de datos y registra el envío
+    Registra un email en la cola de salida (EmailLog 'pending')
+
+    El envío lo realiza el worker `manage.py process_email_outbox`, de modo
+    que la petición HTTP no espera la conexión SMTP. Con immediate=True o
+    EMAIL_ASYNC_SENDING=False el email se envía en el momento.
+
+    Returns:
+        bool: True si el email quedó en cola o se envió correctamente
     """
-    from django.utils import timezone
     from .models import EmailLog
     
     config = get_active_email_config()
@@ -39,14 +58,15 @@ def send_email_with_db_config(subject, message, recipient_list, html_message=Non
     email_log = EmailLog.objects.create(
         email_type=email_type,
         subject=subject,
-        from_email=config.from_email if config else '',
+        from_email=from_email or (config.from_email if config else ''),
         to_email=', '.join(recipient_list),
         message=message,
         html_message=html_message,
         claim_request=claim_request,
         fraud_report=fraud_report,
         email_config=config,
-        status='pending'
+        status='pending',
+        next_attempt_at=timezone.now()
     )
     
     if not config or not config.is_configured:
@@ -60,56 +80,138 @@ def send_email_with_db_config(subject, message, recipient_list, html_message=Non
         else:
             raise Exception("No hay configuración de email válida")
     
+    if not immediate and getattr(settings, 'EMAIL_ASYNC_SENDING', False):
+        logger.info(f"📨 Email #{email_log.pk} en cola para {email_log.to_email}")
+        return True
+    
+    # Envío inmediato: se reclama el registro para que el worker no lo tome
+    EmailLog.objects.filter(pk=email_log.pk).update(
+        attempts=F('attempts') + 1,
+        next_attempt_at=timezone.now() + timedelta(seconds=CLAIM_LEASE_SECONDS)
+    )
+    email_log.attempts += 1
+    result = send_pending_email(email_log, retry=False)
+    if not result and not fail_silently:
+        raise Exception(email_log.error_message)
+    return result
+
+
+def deliver_email_log(email_log, connection=None, keep_open=False):
+    """
+    Envía por SMTP el contenido de un EmailLog
+
+    Usa el backend de la EmailConfiguration del registro (ver
+    core.email_backends), sin modificar django.conf.settings. Si no se pasa
+    `connection` y el backend no tiene una conexión abierta, se abre y se
+    cierra solo para este email, salvo con keep_open=True (worker de la
+    cola). Lanza la excepción del backend si falla.
+    """
+    config = email_log.email_config
+    if not config or not config.is_configured:
+        raise ValueError("No hay configuración de email válida")
+    
+    if connection is None:
+        connection = get_backend_for_config(config)
+        if keep_open:
+            open_connection(connection)
+    
+    recipients = [email.strip() for email in email_log.to_email.split(',') if email.strip()]
+    email = EmailMultiAlternatives(
+        subject=email_log.subject,
+        body=email_log.message,
+        from_email=email_log.from_email or config.from_email,
+        to=recipients,
+        connection=connection,
+    )
+    if email_log.html_message:
+        email.attach_alternative(email_log.html_message, 'text/html')
+    return email.send()
+
+
+def retry_delay(attempts):
+    """Backoff exponencial con jitter para el intento número `attempts`"""
+    base = getattr(settings, 'EMAIL_OUTBOX_RETRY_DELAY', 30)
+    delay = min(base * 2 ** max(attempts - 1, 0), 3600)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def send_pending_email(email_log, connection=None, retry=True, keep_open=False):
+    """
+    Envía un EmailLog ya reclamado y actualiza su estado
+
+    Si falla y quedan intentos (EMAIL_OUTBOX_MAX_ATTEMPTS), se reprograma con
+    backoff exponencial; en caso contrario queda como 'failed'.
+
+    Returns:
+        bool: True si el email se envió
+    """
     try:
-        # Configurar temporalmente los settings de email
-        original_settings = {
-            'EMAIL_HOST': getattr(settings, 'EMAIL_HOST', ''),
-            'EMAIL_PORT': getattr(settings, 'EMAIL_PORT', 587),
-            'EMAIL_USE_TLS': getattr(settings, 'EMAIL_USE_TLS', True),
-            'EMAIL_HOST_USER': getattr(settings, 'EMAIL_HOST_USER', ''),
-            'EMAIL_HOST_PASSWORD': getattr(settings, 'EMAIL_HOST_PASSWORD', ''),
-            'DEFAULT_FROM_EMAIL': getattr(settings, 'DEFAULT_FROM_EMAIL', ''),
-        }
-        
-        # Aplicar configuración de la base de datos
-        settings.EMAIL_HOST = config.host
-        settings.EMAIL_PORT = config.port
-        settings.EMAIL_USE_TLS = config.use_tls
-        settings.EMAIL_HOST_USER = config.username
-        settings.EMAIL_HOST_PASSWORD = config.password
-        settings.DEFAULT_FROM_EMAIL = config.from_email
-        
-        # Enviar email
-        result = send_mail(
-            subject=subject,
-            message=message,
-            from_email=config.from_email,
-            recipient_list=recipient_list,
-            html_message=html_message,
-            fail_silently=fail_silently,
-        )
-        
-        # Actualizar registro
-        email_log.status = 'sent' if result else 'failed'
-        email_log.sent_at = timezone.now()
-        email_log.save()
-        
-        # Restaurar configuración original
-        for key, value in original_settings.items():
-            setattr(settings, key, value)
-        
-        return result
-        
+        sent = deliver_email_log(email_log, connection=connection, keep_open=keep_open)
+        if not sent:
+            raise Exception("El servidor SMTP no aceptó el mensaje")
     except Exception as e:
-        # Actualizar registro con error
-        email_log.status = 'failed'
+        max_attempts = getattr(settings, 'EMAIL_OUTBOX_MAX_ATTEMPTS', 5)
         email_log.error_message = str(e)
-        email_log.save()
-        
-        print(f"Error enviando email: {str(e)}")
-        if not fail_silently:
-            raise
+        if retry and email_log.attempts < max_attempts:
+            email_log.next_attempt_at = timezone.now() + retry_delay(email_log.attempts)
+            logger.warning(
+                f"⚠️ Email #{email_log.pk} falló (intento {email_log.attempts}/{max_attempts}), "
+                f"se reintentará: {e}"
+            )
+        else:
+            email_log.status = 'failed'
+            email_log.next_attempt_at = None
+            logger.error(f"❌ Email #{email_log.pk} falló definitivamente: {e}")
+        email_log.save(update_fields=['status', 'error_message', 'next_attempt_at'])
         return False
+    
+    email_log.status = 'sent'
+    email_log.sent_at = timezone.now()
+    email_log.next_attempt_at = None
+    email_log.error_message = None
+    email_log.save(update_fields=['status', 'sent_at', 'next_attempt_at', 'error_message'])
+    logger.info(f"✅ Email #{email_log.pk} enviado a {email_log.to_email}")
+    return True
+
+
+def claim_due_emails(limit=20):
+    """
+    Reserva hasta `limit` emails pendientes cuyo próximo intento ya venció
+
+    La reserva es un UPDATE condicional sobre el valor leído de
+    next_attempt_at, así que varios workers pueden correr a la vez sin
+    enviar dos veces el mismo email.
+
+    Returns:
+        list: EmailLog reservados, con el contador de intentos incrementado
+    """
+    from .models import EmailLog
+    
+    now = timezone.now()
+    due = (
+        EmailLog.objects
+        .filter(status='pending')
+        .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
+        .order_by('next_attempt_at', 'created_at')
+        .values_list('pk', 'next_attempt_at')[:limit]
+    )
+    
+    lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+    claimed = []
+    for pk, next_attempt_at in due:
+        queryset = EmailLog.objects.filter(pk=pk, status='pending')
+        if next_attempt_at is None:
+            queryset = queryset.filter(next_attempt_at__isnull=True)
+        else:
+            queryset = queryset.filter(next_attempt_at=next_attempt_at)
+        if queryset.update(next_attempt_at=lease_until, attempts=F('attempts') + 1):
+            claimed.append(pk)
+    
+    if not claimed:
+        return []
+    return list(
+        EmailLog.objects.select_related('email_config').filter(pk__in=claimed).order_by('created_at')
+    )
 
 
 def test_email_configuration(config_id=None):
@@ -134,7 +236,8 @@ def test_email_configuration(config_id=None):
             message='Esta es una prueba de la configuración de email.',
             recipient_list=[config.username],  # Enviar al email configurado
             fail_silently=False,
-            email_type='test'
+            email_type='test',
+            immediate=True
         )
         
         if result:
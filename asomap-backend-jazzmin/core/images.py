@@ -0,0 +1,306 @@
+"""
+Variantes responsive de las imágenes subidas
+
+Por cada imagen (ImageField o FileField con extensión de imagen) se generan
+versiones redimensionadas al ancho de cada breakpoint de
+settings.RESPONSIVE_BREAKPOINTS en los formatos de RESPONSIVE_IMAGE_FORMATS
+(AVIF si está instalado pillow-avif-plugin, WebP). Se guardan junto al
+original en el mismo storage:
+
+    products/accounts/banner.jpg
+    products/accounts/banner.360w.webp
+    products/accounts/banner.360w.avif
+    ...
+    products/accounts/banner.variants.json   (manifiesto)
+
+Nunca se amplía una imagen: si el original es más angosto que un
+breakpoint, esa variante queda con el ancho original y los breakpoints
+mayores se omiten.
+
+Los serializers leen el manifiesto con get_variants(), que lo guarda en el
+caché compartido para no tocar el storage en cada petición, y lo exponen con
+responsive_image_data() en un formato listo para srcset/<picture>.
+"""
+import json
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import models
+from PIL import Image, ImageOps, features
+
+try:
+    import pillow_avif  # noqa: F401  Registra el codificador AVIF en Pillow
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+RASTER_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+PIL_FORMATS = {'avif': 'AVIF', 'webp': 'WEBP'}
+MANIFEST_SUFFIX = '.variants.json'
+CACHE_PREFIX = 'images:variants:'
+# Las imágenes sin variantes se vuelven a consultar en el storage pasado este tiempo
+MISSING_CACHE_TIMEOUT = 300
+_MISSING = 'missing'
+
+
+def enabled():
+    return getattr(settings, 'RESPONSIVE_IMAGES_ENABLED', True)
+
+
+def output_formats():
+    """Formatos configurados que la instalación de Pillow puede codificar"""
+    Image.init()
+    formats = []
+    for fmt in getattr(settings, 'RESPONSIVE_IMAGE_FORMATS', ['avif', 'webp']):
+        fmt = fmt.strip().lower()
+        if fmt == 'webp' and not features.check('webp'):
+            continue
+        if fmt in PIL_FORMATS and PIL_FORMATS[fmt] in Image.SAVE:
+            formats.append(fmt)
+    return formats
+
+
+def is_raster_image(name):
+    return bool(name) and os.path.splitext(name)[1].lower() in RASTER_EXTENSIONS
+
+
+def variant_name(name, width, fmt):
+    """Nombre de la variante en el storage (ej. 'news/foto.640w.webp')"""
+    return f'{os.path.splitext(name)[0]}.{width}w.{fmt}'
+
+
+def manifest_name(name):
+    return f'{os.path.splitext(name)[0]}{MANIFEST_SUFFIX}'
+
+
+def _cache_key(name):
+    return f'{CACHE_PREFIX}{name}'
+
+
+def image_fields(model):
+    """
+    Campos de archivo del modelo que pueden contener imágenes
+
+    Se omiten los no editables (ej. miniaturas de PDF generadas por
+    core.documents), que ya se guardan con su tamaño final.
+    """
+    return [
+        field for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField) and field.editable
+    ]
+
+
+def _save(storage, name, content):
+    if storage.exists(name):
+        storage.delete(name)
+    return storage.save(name, ContentFile(content))
+
+
+def _encode(image, fmt):
+    buffer = BytesIO()
+    quality = getattr(settings, 'RESPONSIVE_IMAGE_QUALITY', 80)
+    image.save(buffer, PIL_FORMATS[fmt], quality=quality)
+    return buffer.getvalue()
+
+
+def generate_variants(name, storage=None):
+    """
+    Genera las variantes y el manifiesto de una imagen
+
+    Returns:
+        dict | None: Manifiesto, o None si el archivo no es una imagen válida
+    """
+    storage = storage or default_storage
+    formats = output_formats()
+    if not is_raster_image(name) or not formats:
+        return None
+
+    with storage.open(name, 'rb') as source:
+        image = Image.open(source)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+
+    width, height = image.size
+    variants = []
+    done_widths = set()
+    for target in sorted(settings.RESPONSIVE_BREAKPOINTS.values()):
+        target = min(target, width)
+        if target in done_widths:
+            continue
+        done_widths.add(target)
+        target_height = max(1, round(height * target / width))
+        resized = image if target == width else image.resize((target, target_height), Image.LANCZOS)
+        for fmt in formats:
+            content = _encode(resized, fmt)
+            variants.append({
+                'format': fmt,
+                'width': target,
+                'height': target_height,
+                'name': _save(storage, variant_name(name, target, fmt), content),
+                'size': len(content),
+            })
+
+    manifest = {'source': name, 'width': width, 'height': height, 'variants': variants}
+    _save(storage, manifest_name(name), json.dumps(manifest).encode())
+    cache.set(_cache_key(name), manifest, None)
+    logger.info(f"🖼️ {len(variants)} variantes generadas para {name}")
+    return manifest
+
+
+def delete_variants(name, storage=None):
+    """Elimina las variantes y el manifiesto de una imagen"""
+    storage = storage or default_storage
+    manifest = get_variants(name, storage)
+    for variant in (manifest or {}).get('variants', []):
+        if storage.exists(variant['name']):
+            storage.delete(variant['name'])
+    if storage.exists(manifest_name(name)):
+        storage.delete(manifest_name(name))
+    cache.delete(_cache_key(name))
+
+
+def get_variants(name, storage=None):
+    """
+    Manifiesto de variantes de una imagen (desde el caché o el storage)
+
+    Returns:
+        dict | None: Manifiesto, o None si todavía no se generaron
+    """
+    if not is_raster_image(name):
+        return None
+
+    manifest = cache.get(_cache_key(name))
+    if manifest is not None:
+        return None if manifest == _MISSING else manifest
+
+    storage = storage or default_storage
+    try:
+        with storage.open(manifest_name(name), 'rb') as handle:
+            manifest = json.loads(handle.read())
+    except (OSError, ValueError):
+        cache.set(_cache_key(name), _MISSING, MISSING_CACHE_TIMEOUT)
+        return None
+
+    cache.set(_cache_key(name), manifest, None)
+    return manifest
+
+
+def responsive_image_data(field_file):
+    """
+    Representación de una imagen para srcset / <picture>
+
+    Returns:
+        dict | None: {
+            'src': URL del original, 'width', 'height',
+            'srcset': srcset WebP (o del primer formato disponible),
+            'sources': [{'type': 'image/avif', 'srcset': ...}, ...]
+        }
+        o None si la imagen no tiene variantes
+    """
+    if not enabled() or not field_file:
+        return None
+
+    manifest = get_variants(field_file.name, field_file.storage)
+    if not manifest or not manifest.get('variants'):
+        return None
+
+    storage = field_file.storage
+    by_format = {}
+    for variant in manifest['variants']:
+        by_format.setdefault(variant['format'], []).append(
+            f"{storage.url(variant['name'])} {variant['width']}w"
+        )
+
+    sources = [
+        {'type': MIME_TYPES[fmt], 'srcset': ', '.join(candidates)}
+        for fmt, candidates in by_format.items()
+    ]
+    fallback = by_format.get('webp') or next(iter(by_format.values()))
+    return {
+        'src': field_file.url,
+        'width': manifest['width'],
+        'height': manifest['height'],
+        'srcset': ', '.join(fallback),
+        'sources': sources,
+    }
+
+
+def pending_images(instance):
+    """Nombres de las imágenes del objeto que todavía no tienen variantes"""
+    names = []
+    for field in image_fields(instance.__class__):
+        field_file = getattr(instance, field.attname)
+        if field_file and is_raster_image(field_file.name) and not get_variants(field_file.name, field_file.storage):
+            names.append(field_file.name)
+    return names
+
+
+def generate_for_instance(instance, force=False, seen=None, fail_silently=True):
+    """
+    Genera las variantes de las imágenes de un objeto que aún no las tienen
+
+    Args:
+        force: Regenera aunque ya existan variantes
+        seen: Conjunto de nombres ya procesados (para no repetir archivos
+            compartidos entre varios registros)
+        fail_silently: Con False se relanzan los errores de codificación
+            (la cola de tareas reintenta la tarea)
+
+    Returns:
+        int: Imágenes procesadas
+    """
+    processed = 0
+    for field in image_fields(instance.__class__):
+        field_file = getattr(instance, field.attname)
+        if not field_file or not is_raster_image(field_file.name):
+            continue
+        if seen is not None:
+            if field_file.name in seen:
+                continue
+            seen.add(field_file.name)
+        if not force and get_variants(field_file.name, field_file.storage):
+            continue
+        try:
+            if generate_variants(field_file.name, field_file.storage):
+                processed += 1
+        except FileNotFoundError:
+            logger.warning(f"⚠️ No existe el archivo {field_file.name}; no se generaron variantes")
+        except Exception as e:
+            if not fail_silently:
+                raise
+            logger.error(f"❌ No se pudieron generar las variantes de {field_file.name}: {e}")
+    return processed
+
+
+def delete_for_instance(instance):
+    """
+    Elimina las variantes de las imágenes de un objeto borrado
+
+    Se conservan si otro registro del mismo modelo apunta al mismo archivo.
+    Las de los archivos deduplicados (ver core.storage) se eliminan junto
+    con el blob en collect_media_garbage, ya que otros modelos pueden
+    compartirlo.
+    """
+    model = instance.__class__
+    for field in image_fields(model):
+        field_file = getattr(instance, field.attname)
+        if getattr(field_file.storage, 'content_addressed', False):
+            continue
+        if not field_file or not get_variants(field_file.name, field_file.storage):
+            continue
+        if model._default_manager.filter(**{field.name: field_file.name}).exists():
+            continue
+        try:
+            delete_variants(field_file.name, field_file.storage)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudieron eliminar las variantes de {field_file.name}: {e}")
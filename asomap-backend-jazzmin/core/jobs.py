@@ -0,0 +1,194 @@
+"""
+Cola de tareas en segundo plano sobre la base de datos
+
+Sin broker externo: cada tarea es un registro core.Job que el worker
+`manage.py run_jobs` reserva y ejecuta en un pool de procesos. Las tareas
+se registran con el decorador @task en el módulo `tasks.py` de cada app
+(se descubren al iniciar Django) y se encolan con enqueue(), que crea el
+registro solo cuando la transacción en curso se confirma:
+
+    @task('images.generate_variants')
+    def generate_image_variants(model, pk):
+        ...
+
+    enqueue('images.generate_variants', model='news.News', pk=news.pk)
+
+Los parámetros deben ser serializables a JSON. Con JOBS_ASYNC=False (por
+defecto, sin worker desplegado) la tarea se ejecuta en el mismo proceso al
+confirmar la transacción.
+"""
+import logging
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Tiempo que una tarea reclamada por el worker queda reservada; si el worker
+# muere a mitad de la ejecución, la tarea vuelve a estar disponible al vencer
+CLAIM_LEASE_SECONDS = 900
+
+TASKS = {}
+
+
+def task(name):
+    """Registra una función como tarea ejecutable por el worker"""
+    def decorator(func):
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, **payload):
+    """
+    Encola una tarea para después de confirmar la transacción en curso
+
+    No se crea un segundo registro si ya hay uno pendiente con la misma
+    tarea y parámetros (ej. varios guardados seguidos del mismo objeto).
+    """
+    if name not in TASKS:
+        raise ValueError(f"Tarea no registrada: {name}")
+    transaction.on_commit(lambda: _create_job(name, payload))
+
+
+def _create_job(name, payload):
+    from .models import Job
+
+    if Job.objects.filter(task=name, payload=payload, status='pending').exists():
+        return None
+
+    job = Job.objects.create(task=name, payload=payload, next_attempt_at=timezone.now())
+    if getattr(settings, 'JOBS_ASYNC', False):
+        logger.info(f"🗂️ Tarea {name} #{job.pk} en cola")
+        return job
+
+    # Ejecución inmediata: se reclama el registro para que el worker no lo tome
+    Job.objects.filter(pk=job.pk).update(
+        status='running',
+        attempts=F('attempts') + 1,
+        started_at=timezone.now(),
+        next_attempt_at=timezone.now() + timedelta(seconds=CLAIM_LEASE_SECONDS)
+    )
+    job.refresh_from_db()
+    run_job(job, retry=False)
+    return job
+
+
+def execute(name, payload):
+    """Ejecuta la función registrada de una tarea"""
+    return TASKS[name](**payload)
+
+
+def run_job(job, retry=True):
+    """Ejecuta una tarea ya reclamada en el proceso actual y registra el resultado"""
+    try:
+        result = execute(job.task, job.payload)
+    except Exception as e:
+        return finish_job(job, error=e, retry=retry)
+    return finish_job(job, result=result)
+
+
+def retry_delay(attempts):
+    """Backoff exponencial con jitter para el intento número `attempts`"""
+    base = getattr(settings, 'JOBS_RETRY_DELAY', 60)
+    delay = min(base * 2 ** max(attempts - 1, 0), 3600)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def finish_job(job, result=None, error=None, retry=True):
+    """
+    Registra el resultado de una tarea ejecutada
+
+    Si falló y quedan intentos (JOBS_MAX_ATTEMPTS), se reprograma con
+    backoff exponencial; en caso contrario queda como 'failed'.
+
+    Returns:
+        bool: True si la tarea terminó correctamente
+    """
+    job.finished_at = timezone.now()
+    if error is None:
+        job.status = 'done'
+        job.result = result
+        job.error_message = None
+        job.next_attempt_at = None
+        job.save(update_fields=['status', 'result', 'error_message', 'next_attempt_at', 'finished_at'])
+        logger.info(f"✅ Tarea {job.task} #{job.pk} completada")
+        return True
+
+    max_attempts = getattr(settings, 'JOBS_MAX_ATTEMPTS', 3)
+    job.error_message = f"{type(error).__name__}: {error}"
+    if retry and job.attempts < max_attempts:
+        job.status = 'pending'
+        job.next_attempt_at = timezone.now() + retry_delay(job.attempts)
+        logger.warning(
+            f"⚠️ Tarea {job.task} #{job.pk} falló (intento {job.attempts}/{max_attempts}), "
+            f"se reintentará: {error}"
+        )
+    else:
+        job.status = 'failed'
+        job.next_attempt_at = None
+        logger.error(f"❌ Tarea {job.task} #{job.pk} falló definitivamente: {error}")
+    job.save(update_fields=['status', 'error_message', 'next_attempt_at', 'finished_at'])
+    return False
+
+
+def claim_due_jobs(limit=10):
+    """
+    Reserva hasta `limit` tareas pendientes cuyo próximo intento ya venció
+
+    También recupera las tareas 'running' cuya reserva expiró (worker caído).
+    La reserva es un UPDATE condicional sobre el valor leído de
+    next_attempt_at, así que varios workers pueden correr a la vez sin
+    ejecutar dos veces la misma tarea.
+
+    Returns:
+        list: Job reservados, con el contador de intentos incrementado
+    """
+    from .models import Job
+
+    now = timezone.now()
+    due = (
+        Job.objects
+        .filter(
+            Q(status='pending', next_attempt_at__isnull=True)
+            | Q(status__in=['pending', 'running'], next_attempt_at__lte=now)
+        )
+        .order_by('next_attempt_at', 'created_at')
+        .values_list('pk', 'status', 'attempts', 'next_attempt_at')[:limit]
+    )
+
+    max_attempts = getattr(settings, 'JOBS_MAX_ATTEMPTS', 3)
+    lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+    claimed = []
+    for pk, status, attempts, next_attempt_at in due:
+        queryset = Job.objects.filter(pk=pk, status=status)
+        if next_attempt_at is None:
+            queryset = queryset.filter(next_attempt_at__isnull=True)
+        else:
+            queryset = queryset.filter(next_attempt_at=next_attempt_at)
+        if status == 'running' and attempts >= max_attempts:
+            # El proceso murió en cada intento (ej. sin memoria): no se reintenta más
+            queryset.update(
+                status='failed',
+                finished_at=now,
+                next_attempt_at=None,
+                error_message='La reserva expiró sin que el worker terminara la tarea'
+            )
+            continue
+        updated = queryset.update(
+            status='running',
+            started_at=now,
+            finished_at=None,
+            next_attempt_at=lease_until,
+            attempts=F('attempts') + 1
+        )
+        if updated:
+            claimed.append(pk)
+
+    if not claimed:
+        return []
+    return list(Job.objects.filter(pk__in=claimed).order_by('created_at'))
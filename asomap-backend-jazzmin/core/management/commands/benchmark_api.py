@@ -0,0 +1,385 @@
+"""
+Benchmark de los endpoints públicos de la API
+
+Recorre todas las rutas GET sin parámetros registradas en config/urls.py
+(api/... y health/) y mide por ruta la latencia (p50/p95/p99), las consultas
+a la BD por petición y el tamaño de la respuesta.
+
+Por defecto trabaja sobre una base de datos temporal (como los tests) que se
+llena con los comandos create_* del proyecto y, con --scale N, con los
+volúmenes de generate_load_dataset; de modo que no modifica los datos
+reales. Con --current-db se mide la base configurada tal como está y
+con --base-url se mide un servidor en ejecución (las consultas se leen del
+header X-DB-Queries, disponible cuando el servidor corre con DEBUG).
+
+Ejemplos:
+    python manage.py benchmark_api --output benchmark.json
+    python manage.py benchmark_api --scale 2 --routes news locations
+    python manage.py benchmark_api --baseline benchmark.json --fail-on-regression
+    python manage.py benchmark_api --base-url http://localhost:8000 --routes news
+"""
+import io
+import json
+import math
+import time
+from datetime import datetime
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.urls import URLResolver, get_resolver
+from django.urls.resolvers import RoutePattern
+from rest_framework.views import APIView
+
+from core.metrics import QueryCounter
+
+# Rutas incluidas en el benchmark (prefijos de config/urls.py)
+PUBLIC_PREFIXES = ('api/', 'health/')
+# La generación del esquema OpenAPI no es un endpoint del sitio
+EXCLUDED_PREFIXES = ('api/schema/',)
+
+# Comandos de datos de ejemplo usados para llenar la base temporal
+SEED_COMMANDS = (
+    'create_home_data',
+    'create_layout_data',
+    'create_about_data',
+    'create_financial_data',
+    'create_memory_data',
+    'create_policy_data',
+    'create_community_data',
+    'create_products',
+    'create_sample_accounts',
+    'create_sample_cards',
+    'create_loan_types',
+    'create_sample_loans',
+    'create_sample_certificates',
+    'create_banner_data',
+    'create_sample_news',
+    'create_sample_promotions',
+    'create_schedules',
+    'create_services',
+    'create_provinces',
+    'create_sample_contracts',
+    'create_sample_rights_and_duties',
+    'create_sample_service_rates',
+    'create_sample_abandoned_accounts',
+    'create_sample_services',
+    'create_sample_financial_guidance',
+)
+
+REGEX_SPECIAL_CHARS = set('()[]{}?*+|\\')
+
+
+def pattern_to_path(pattern):
+    """
+    Convierte el patrón de una URL a un path literal
+
+    Returns:
+        str | None: None si la ruta tiene parámetros (detalle, slug, formato)
+    """
+    if isinstance(pattern, RoutePattern):
+        route = str(pattern)
+        return None if '<' in route else route
+
+    regex = pattern._regex
+    if regex.startswith('^'):
+        regex = regex[1:]
+    if regex.endswith('$'):
+        regex = regex[:-1]
+    if REGEX_SPECIAL_CHARS & set(regex):
+        return None
+    return regex
+
+
+def discover_routes(patterns=None, prefix=''):
+    """Rutas sin parámetros de config/urls.py como (path, nombre)"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        path = pattern_to_path(pattern.pattern)
+        if path is None:
+            continue
+        if isinstance(pattern, URLResolver):
+            yield from discover_routes(pattern.url_patterns, prefix + path)
+        else:
+            yield prefix + path, pattern.name
+
+
+def public_routes(filters=()):
+    """Rutas públicas a medir, sin duplicados y en orden alfabético"""
+    routes = {}
+    for path, name in discover_routes():
+        if not path.startswith(PUBLIC_PREFIXES) or path.startswith(EXCLUDED_PREFIXES):
+            continue
+        if filters and not any(value in path for value in filters):
+            continue
+        routes.setdefault('/' + path, name)
+    return sorted(routes.items())
+
+
+def percentile(values, percent):
+    """Percentil por rango más cercano sobre una lista ordenada"""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class Command(BaseCommand):
+    help = 'Mide latencia (p50/p95/p99), consultas y tamaño de respuesta de los endpoints públicos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Peticiones medidas por ruta (por defecto: 20)'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=2,
+            help='Peticiones previas no medidas por ruta (por defecto: 2)'
+        )
+        parser.add_argument(
+            '--routes',
+            nargs='+',
+            default=(),
+            help='Solo mide las rutas que contienen alguno de estos textos'
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Limpia el caché antes de cada petición (mide sin caché de respuestas)'
+        )
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            help='Usa la base de datos configurada en lugar de una temporal'
+        )
+        parser.add_argument(
+            '--no-seed',
+            action='store_true',
+            help='No ejecuta los comandos create_* antes de medir'
+        )
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=0,
+            help='Agrega datos de volumen con generate_load_dataset --scale N (por defecto: 0)'
+        )
+        parser.add_argument(
+            '--base-url',
+            help='Mide un servidor en ejecución (ej: http://localhost:8000) en lugar del cliente de pruebas'
+        )
+        parser.add_argument(
+            '--output',
+            help='Archivo JSON donde guardar los resultados'
+        )
+        parser.add_argument(
+            '--baseline',
+            help='Archivo JSON de una ejecución anterior para comparar'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=20.0,
+            help='Porcentaje de aumento del p95 considerado regresión (por defecto: 20)'
+        )
+        parser.add_argument(
+            '--fail-on-regression',
+            action='store_true',
+            help='Termina con error si hay regresiones respecto al baseline'
+        )
+
+    def handle(self, *args, **options):
+        routes = public_routes(options['routes'])
+        if not routes:
+            raise CommandError('No hay rutas que coincidan con los filtros indicados')
+
+        self.stdout.write(self.style.SUCCESS(f'⏱️ Benchmark de {len(routes)} rutas'))
+
+        self.base_url = options['base_url']
+        if self.base_url:
+            results = self.run(routes, options, self.live_request)
+        else:
+            results = self.run_local(routes, options)
+
+        report = {
+            'generatedAt': datetime.now().isoformat(timespec='seconds'),
+            'target': options['base_url'] or 'test-client',
+            'iterations': options['iterations'],
+            'cold': options['cold'],
+            'routes': results,
+        }
+
+        self.print_results(results)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2, ensure_ascii=False)
+            self.stdout.write(self.style.SUCCESS(f"💾 Resultados guardados en {options['output']}"))
+
+        if options['baseline']:
+            regressions = self.compare(results, options['baseline'], options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{len(regressions)} rutas con regresiones: {", ".join(regressions)}')
+
+    def run_local(self, routes, options):
+        """Mide con el cliente de pruebas sobre una base temporal o la configurada"""
+        old_config = None
+        if not options['current_db']:
+            self.stdout.write('🗄️ Creando base de datos temporal...')
+            old_config = setup_databases(verbosity=0, interactive=False, serialized_aliases=set())
+
+        try:
+            if old_config is not None and not options['no_seed']:
+                self.seed()
+            if old_config is not None and options['scale']:
+                self.stdout.write(f"🏭 Generando datos de carga (escala {options['scale']})...")
+                call_command('generate_load_dataset', scale=options['scale'], seed=0, stdout=io.StringIO())
+
+            # Los errores de una vista se registran como 500 en lugar de detener el benchmark
+            self.client = Client(raise_request_exception=False)
+            # Sin throttling (100/hora para anónimos) y aceptando el host del cliente de pruebas
+            hosts = list(settings.ALLOWED_HOSTS) + ['testserver']
+            with override_settings(ALLOWED_HOSTS=hosts), \
+                    mock.patch.object(APIView, 'throttle_classes', []):
+                return self.run(routes, options, self.local_request)
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0)
+
+    def seed(self):
+        """Ejecuta los comandos de datos de ejemplo disponibles"""
+        self.stdout.write('🌱 Cargando datos de ejemplo...')
+        for command in SEED_COMMANDS:
+            try:
+                call_command(command, verbosity=0, stdout=io.StringIO())
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(f'  ⚠️ {command}: {e}'))
+
+    def run(self, routes, options, request):
+        """Ejecuta las peticiones de cada ruta y calcula las estadísticas"""
+        results = {}
+        for path, name in routes:
+            for _ in range(options['warmup']):
+                if options['cold']:
+                    cache.clear()
+                request(path)
+
+            durations, queries, sizes = [], [], []
+            status_code = None
+            for _ in range(options['iterations']):
+                if options['cold']:
+                    cache.clear()
+                status_code, duration, query_count, size = request(path)
+                durations.append(duration * 1000)
+                queries.append(query_count)
+                sizes.append(size)
+
+            durations.sort()
+            results[path] = {
+                'name': name,
+                'status': status_code,
+                'p50Ms': round(percentile(durations, 50), 2),
+                'p95Ms': round(percentile(durations, 95), 2),
+                'p99Ms': round(percentile(durations, 99), 2),
+                'meanMs': round(sum(durations) / len(durations), 2) if durations else 0.0,
+                'queries': max(queries, key=lambda value: value or 0) if queries else None,
+                'bytes': max(sizes) if sizes else 0,
+            }
+        return results
+
+    def local_request(self, path):
+        """Petición con el cliente de pruebas contando las consultas"""
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with counter.install():
+            response = self.client.get(path)
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+        duration = time.perf_counter() - start
+        return response.status_code, duration, counter.count, len(content)
+
+    def live_request(self, path):
+        """Petición HTTP al servidor indicado en --base-url"""
+        url = self.base_url.rstrip('/') + path
+        start = time.perf_counter()
+        try:
+            with urlopen(Request(url, headers={'Accept': 'application/json'}), timeout=30) as response:
+                content = response.read()
+                status_code, headers = response.status, response.headers
+        except HTTPError as e:
+            content = e.read()
+            status_code, headers = e.code, e.headers
+        duration = time.perf_counter() - start
+
+        queries = headers.get('X-DB-Queries')
+        return status_code, duration, int(queries) if queries else None, len(content)
+
+    def print_results(self, results):
+        """Tabla de resultados ordenada por p95"""
+        self.stdout.write('')
+        self.stdout.write(
+            f"{'Ruta':<55} {'Estado':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Consultas':>9} {'Bytes':>9}"
+        )
+        for path, result in sorted(results.items(), key=lambda item: -item[1]['p95Ms']):
+            queries = '-' if result['queries'] is None else result['queries']
+            line = (
+                f"{path:<55} {result['status']:>6} {result['p50Ms']:>8.2f} {result['p95Ms']:>8.2f} "
+                f"{result['p99Ms']:>8.2f} {queries:>9} {result['bytes']:>9}"
+            )
+            self.stdout.write(line if result['status'] < 400 else self.style.WARNING(line))
+
+    def compare(self, results, baseline_path, threshold):
+        """
+        Compara contra un baseline guardado con --output
+
+        Es regresión un p95 mayor al umbral porcentual o más consultas por
+        petición que en el baseline.
+        """
+        try:
+            with open(baseline_path, encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)['routes']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'No se pudo leer el baseline {baseline_path}: {e}')
+
+        self.stdout.write('')
+        self.stdout.write(f'📊 Comparación con {baseline_path} (umbral p95: +{threshold:.0f}%)')
+        regressions = []
+        for path, result in sorted(results.items()):
+            previous = baseline.get(path)
+            if previous is None:
+                self.stdout.write(f'  🆕 {path}')
+                continue
+
+            change = 0.0
+            if previous['p95Ms']:
+                change = (result['p95Ms'] - previous['p95Ms']) / previous['p95Ms'] * 100
+            more_queries = (
+                result['queries'] is not None and previous.get('queries') is not None
+                and result['queries'] > previous['queries']
+            )
+            if change > threshold or more_queries:
+                regressions.append(path)
+                self.stdout.write(self.style.ERROR(
+                    f"  ❌ {path}: p95 {previous['p95Ms']:.2f} → {result['p95Ms']:.2f} ms ({change:+.0f}%), "
+                    f"consultas {previous.get('queries')} → {result['queries']}"
+                ))
+            elif change < -threshold:
+                self.stdout.write(self.style.SUCCESS(
+                    f"  ✅ {path}: p95 {previous['p95Ms']:.2f} → {result['p95Ms']:.2f} ms ({change:+.0f}%)"
+                ))
+
+        if regressions:
+            self.stdout.write(self.style.ERROR(f'❌ {len(regressions)} rutas con regresiones'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✅ Sin regresiones respecto al baseline'))
+        return regressions
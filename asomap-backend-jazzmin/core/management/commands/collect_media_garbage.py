@@ -0,0 +1,117 @@
+"""
+Elimina los archivos deduplicados que ya no usa ningún registro
+
+Recalcula el contador de referencias de cada core.MediaBlob a partir de los
+campos de archivo de todos los modelos (corrige los desvíos de guardados
+que fallaron o de cambios hechos con update()) y elimina los blobs sin
+referencias desde hace más de MEDIA_GC_GRACE_HOURS horas, junto con sus
+variantes responsive, y los archivos de blobs/ sin registro.
+Pensado para ejecutarse periódicamente (cron).
+"""
+import os
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from core.images import delete_variants
+from core.models import MediaBlob
+from core.storage import BLOB_ROOT, blob_digest
+
+
+class Command(BaseCommand):
+    help = 'Recalcula las referencias de los archivos deduplicados y elimina los que no se usan'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Muestra lo que se eliminaría sin borrar nada'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        limit = timezone.now() - timedelta(hours=settings.MEDIA_GC_GRACE_HOURS)
+
+        references = self.count_references()
+        fixed = 0
+        orphans = []
+        for blob in MediaBlob.objects.all().iterator():
+            count = references.get(blob.digest, 0)
+            if count != blob.ref_count:
+                # El margen se cuenta desde la corrección del contador
+                fixed += 1
+                if not dry_run:
+                    MediaBlob.objects.filter(pk=blob.pk).update(ref_count=count, updated_at=timezone.now())
+            elif count == 0 and blob.updated_at < limit:
+                orphans.append(blob)
+
+        deleted = freed = 0
+        for blob in orphans:
+            if not dry_run:
+                # Condicional: se omite si otra subida reutilizó el blob mientras tanto
+                removed, _ = MediaBlob.objects.filter(pk=blob.pk, ref_count=0, updated_at=blob.updated_at).delete()
+                if not removed:
+                    continue
+                self.delete_blob_files(blob.name)
+            self.stdout.write(f'  🗑️ {blob.name} ({blob.size / 1024:.1f} KB)')
+            deleted += 1
+            freed += blob.size
+
+        strays = self.delete_stray_files(references, limit, dry_run)
+
+        prefix = '🔍 [simulación] ' if dry_run else '✅ '
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}{deleted} blobs sin referencias eliminados ({freed / (1024*1024):.2f} MB), '
+            f'{strays} archivos sin registro, {fixed} contadores corregidos'
+        ))
+
+    def count_references(self):
+        """Referencias por SHA-256 en todos los campos de archivo"""
+        references = Counter()
+        for model in apps.get_models():
+            for field in model._meta.concrete_fields:
+                if not isinstance(field, models.FileField):
+                    continue
+                names = model._default_manager.filter(
+                    **{f'{field.attname}__startswith': f'{BLOB_ROOT}/'}
+                ).values_list(field.attname, flat=True)
+                references.update(filter(None, map(blob_digest, names)))
+        return references
+
+    def delete_blob_files(self, name):
+        """Elimina el blob y los archivos derivados (variantes, manifiesto)"""
+        delete_variants(name, default_storage)
+        directory, filename = os.path.split(name)
+        digest = blob_digest(name)
+        _dirs, files = default_storage.listdir(directory)
+        for other in files:
+            if other == filename or other.startswith(f'{digest}.'):
+                default_storage.delete(f'{directory}/{other}')
+
+    def delete_stray_files(self, references, limit, dry_run):
+        """Blobs en disco sin registro MediaBlob (ej. el proceso murió al guardar)"""
+        if not default_storage.exists(BLOB_ROOT):
+            return 0
+        known = set(MediaBlob.objects.values_list('digest', flat=True))
+        count = 0
+        directories, _files = default_storage.listdir(BLOB_ROOT)
+        for directory in directories:
+            _dirs, files = default_storage.listdir(f'{BLOB_ROOT}/{directory}')
+            for filename in files:
+                name = f'{BLOB_ROOT}/{directory}/{filename}'
+                digest = filename.split('.')[0]
+                if digest in known or references.get(digest):
+                    continue
+                if default_storage.get_modified_time(name) >= limit:
+                    continue
+                self.stdout.write(f'  🗑️ {name} (sin registro)')
+                if not dry_run:
+                    default_storage.delete(name)
+                count += 1
+        return count
@@ -0,0 +1,62 @@
+"""
+Genera las variantes responsive (WebP/AVIF por breakpoint) de las imágenes
+ya subidas
+
+Las imágenes nuevas se procesan en segundo plano al guardarse (ver
+core.signals y `manage.py run_jobs`); este comando cubre las que existían
+antes o las que fallaron.
+
+Ejemplos:
+    python manage.py generate_image_variants
+    python manage.py generate_image_variants --model products.Account --force
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from core.images import generate_for_instance, image_fields, output_formats
+
+
+class Command(BaseCommand):
+    help = 'Genera las variantes responsive (WebP/AVIF) de las imágenes existentes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Modelo a procesar (app_label.Model); se puede repetir. Por defecto todos'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenera también las imágenes que ya tienen variantes'
+        )
+
+    def handle(self, *args, **options):
+        formats = output_formats()
+        if not formats:
+            raise CommandError('Pillow no puede codificar ninguno de RESPONSIVE_IMAGE_FORMATS')
+        self.stdout.write(self.style.SUCCESS(f"🖼️ Generando variantes ({', '.join(formats)})..."))
+
+        if options['models']:
+            try:
+                models = [apps.get_model(label) for label in options['models']]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+        else:
+            models = [model for model in apps.get_models() if image_fields(model)]
+
+        total = 0
+        seen = set()
+        for model in models:
+            names = [field.name for field in image_fields(model)]
+            if not names:
+                continue
+            processed = 0
+            for instance in model._default_manager.only('pk', *names).iterator():
+                processed += generate_for_instance(instance, force=options['force'], seen=seen)
+            if processed:
+                self.stdout.write(f'  📷 {model._meta.label}: {processed} imágenes')
+            total += processed
+
+        self.stdout.write(self.style.SUCCESS(f'✅ {total} imágenes procesadas'))
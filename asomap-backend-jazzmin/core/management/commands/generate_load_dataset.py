@@ -0,0 +1,359 @@
+"""
+Generador de datos sintéticos para pruebas de carga
+
+Crea volúmenes similares a producción con bulk_create por lotes, cada lote
+dentro de su propia transacción. Con --scale 1 se generan:
+
+- 1.000 noticias con 2 archivos de media cada una
+- 10.000 reclamos, 10.000 reportes de fraude y 10.000 sugerencias
+- 200 ubicaciones con 3 servicios cada una
+- 10 años de documentos financieros (auditado + 4 trimestres) y de
+  documentos anuales de cuentas abandonadas/inactivas
+
+Las filas generadas quedan marcadas (ver LOAD_MARKER) para poder
+eliminarlas con --clear sin tocar los datos reales. Como bulk_create no
+emite post_save, al terminar se invalida el caché de respuestas y el índice
+espacial de ubicaciones.
+
+Ejemplos:
+    python manage.py generate_load_dataset --scale 5
+    python manage.py generate_load_dataset --clear --scale 0
+"""
+import random
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from about.models import FinancialDocument
+from core.cache import invalidate_for_model
+from core.signals import _ensure_views_loaded
+from locations.geo import invalidate_index
+from locations.models import Location, Service
+from news.content import parse_structured_content
+from news.models import News, NewsMedia, Tag, split_tags
+from prousuario.models import (
+    AccountType, ClaimRequest, FraudReport, Province, SuggestionBox, YearlyDocument
+)
+from search.indexing import rebuild_index
+
+# Marca de las filas generadas
+LOAD_MARKER = 'Datos de carga'
+LOAD_EMAIL_DOMAIN = 'carga.asomap.test'
+
+# Volúmenes por unidad de --scale
+NEWS_PER_SCALE = 1000
+MEDIA_PER_NEWS = 2
+SUBMISSIONS_PER_SCALE = 10000
+LOCATIONS_PER_SCALE = 200
+SERVICES_PER_LOCATION = 3
+YEARS_PER_SCALE = 10
+OLDEST_YEAR = 1900
+
+# Rectángulo aproximado de República Dominicana
+LATITUDE_RANGE = (17.6, 19.9)
+LONGITUDE_RANGE = (-71.9, -68.4)
+
+CONTENT_TEMPLATE = (
+    '<h2>{title}</h2>'
+    '<p>{paragraph}</p>'
+    '<ul><li>Beneficio exclusivo para asociados</li><li>Disponible en todas las sucursales</li></ul>'
+    '<p>{paragraph}</p>'
+)
+NEWS_CATEGORIES = ('Institucional', 'Productos', 'Educación financiera', 'Comunidad', 'Tecnología')
+PRODUCT_TYPES = ('Cuenta de ahorro', 'Certificado financiero', 'Préstamo personal', 'Tarjeta de débito')
+CLAIM_TYPES = ('Cobro indebido', 'Transacción no reconocida', 'Atención al cliente', 'Error en estado de cuenta')
+CHANNELS = ('Sucursal', 'Banca en línea', 'Cajero automático', 'Centro de llamadas')
+FRAUD_CLASSIFICATIONS = ('Phishing', 'Fraude de Tarjeta', 'Robo de Identidad', 'Toma de Cuenta', 'Lavado de Dinero')
+SUGGESTION_CLASSIFICATIONS = ('Sugerencia', 'Queja', 'Felicitación', 'Consulta')
+SERVICE_NAMES = (
+    'Depósitos', 'Retiros', 'Pago de préstamos', 'Apertura de cuentas', 'Cambio de divisas',
+    'Pago de servicios', 'Certificados financieros', 'Tarjetas de débito', 'Remesas',
+    'Asesoría financiera', 'Estacionamiento', 'Autobanco',
+)
+STATUSES = ('pending', 'in_progress', 'resolved', 'closed', 'rejected')
+
+
+def batched(iterable, size):
+    """Divide un iterable en listas de hasta `size` elementos"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = 'Genera datos sintéticos en volumen (bulk_create por lotes) para pruebas de carga'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale',
+            type=int,
+            default=1,
+            help='Multiplicador de los volúmenes base (por defecto: 1; 0 no genera datos)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Filas por bulk_create y por transacción (por defecto: 1000)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=None,
+            help='Semilla para generar siempre los mismos datos'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Elimina antes las filas generadas por ejecuciones anteriores'
+        )
+
+    def handle(self, *args, **options):
+        scale = options['scale']
+        if scale < 0:
+            raise CommandError('--scale debe ser mayor o igual a 0')
+
+        self.batch_size = max(options['batch_size'], 1)
+        self.random = random.Random(options['seed'])
+        self.faker = Faker('es_ES')
+        self.faker.seed_instance(options['seed'])
+        start = time.perf_counter()
+
+        if options['clear']:
+            self.clear()
+
+        if scale:
+            self.stdout.write(self.style.SUCCESS(f'🏭 Generando datos de carga (escala {scale})...'))
+            self.build_pools()
+            self.generate_news(NEWS_PER_SCALE * scale)
+            self.generate_submissions(SUBMISSIONS_PER_SCALE * scale)
+            self.generate_locations(LOCATIONS_PER_SCALE * scale)
+            self.generate_documents(YEARS_PER_SCALE * scale)
+
+        self.invalidate_caches()
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Datos de carga listos en {time.perf_counter() - start:.1f} segundos')
+        )
+
+    def build_pools(self):
+        """Valores de Faker precalculados: generar uno por fila es lo más lento"""
+        self.names = [self.faker.name() for _ in range(500)]
+        self.sentences = [self.faker.sentence(nb_words=8) for _ in range(300)]
+        self.paragraphs = [self.faker.paragraph(nb_sentences=5) for _ in range(100)]
+        self.addresses = [self.faker.street_address() for _ in range(300)]
+
+    def bulk_create(self, model, objects, **kwargs):
+        """Inserta por lotes, cada lote en su propia transacción"""
+        created = []
+        for batch in batched(objects, self.batch_size):
+            with transaction.atomic():
+                created.extend(model.objects.bulk_create(batch, **kwargs))
+        self.stdout.write(f'  📦 {model._meta.verbose_name_plural}: {len(created)} filas')
+        return created
+
+    def person(self, index):
+        """Datos personales de un formulario"""
+        name = self.random.choice(self.names)
+        return {
+            'full_name': name,
+            'document': f'{self.random.randint(0, 999):03d}-{self.random.randint(0, 9999999):07d}-{self.random.randint(0, 9)}',
+            'phone': f'809-{self.random.randint(200, 999)}-{self.random.randint(0, 9999):04d}',
+            'email': f'usuario{index}@{LOAD_EMAIL_DOMAIN}',
+            'message': self.random.choice(self.paragraphs),
+        }
+
+    def review(self):
+        """Estado de seguimiento; los casos cerrados tienen fecha de resolución"""
+        status = self.random.choice(STATUSES)
+        resolved_at = None
+        if status in ('resolved', 'closed'):
+            resolved_at = timezone.now() - timedelta(days=self.random.randint(0, 365))
+        return {'status': status, 'resolved_at': resolved_at}
+
+    def generate_news(self, total):
+        """Noticias con contenido estructurado precalculado y su media"""
+        now = timezone.now()
+
+        # save() no se ejecuta con bulk_create: el contenido estructurado se calcula aquí
+        contents = []
+        for paragraph in self.paragraphs[:20]:
+            html = CONTENT_TEMPLATE.format(title=self.random.choice(self.sentences), paragraph=paragraph)
+            contents.append((html, parse_structured_content(html)))
+
+        def build():
+            for index in range(total):
+                html, structured = self.random.choice(contents)
+                yield News(
+                    title=self.random.choice(self.sentences)[:200],
+                    description=self.random.choice(self.paragraphs),
+                    image=f'news/carga-{index % 50}.jpg',
+                    author=LOAD_MARKER,
+                    category=self.random.choice(NEWS_CATEGORIES),
+                    tags=', '.join(self.random.sample(NEWS_CATEGORIES, 2)),
+                    fecha_publicacion=now - timedelta(hours=self.random.randint(0, 24 * 365 * 5)),
+                    full_content=html,
+                    structured_content=structured,
+                )
+
+        news = self.bulk_create(News, build())
+
+        def build_media():
+            for item in news:
+                for order in range(MEDIA_PER_NEWS):
+                    yield NewsMedia(
+                        news_id=item.pk,
+                        file=f'news/carga-media-{(item.pk + order) % 50}.jpg',
+                        media_type='image',
+                        caption=LOAD_MARKER,
+                        order=order,
+                    )
+
+        self.bulk_create(NewsMedia, build_media())
+
+        # El índice de etiquetas también se sincroniza en save()
+        tags = {tag.slug: tag.pk for tag in Tag.from_text(', '.join(NEWS_CATEGORIES))}
+
+        def build_tags():
+            for item in news:
+                for slug in split_tags(item.tags):
+                    yield News.tag_index.through(news_id=item.pk, tag_id=tags[slug])
+
+        self.bulk_create(News.tag_index.through, build_tags())
+
+    def generate_submissions(self, total):
+        """Reclamos, reportes de fraude y sugerencias"""
+        self.bulk_create(ClaimRequest, (
+            ClaimRequest(
+                product_type=self.random.choice(PRODUCT_TYPES),
+                claim_type=self.random.choice(CLAIM_TYPES),
+                distribution_channel=self.random.choice(CHANNELS),
+                **self.person(index),
+                **self.review(),
+            )
+            for index in range(total)
+        ))
+
+        self.bulk_create(FraudReport, (
+            FraudReport(
+                classification=self.random.choice(FRAUD_CLASSIFICATIONS),
+                **self.person(index),
+                **self.review(),
+            )
+            for index in range(total)
+        ))
+
+        provinces = list(Province.objects.values_list('pk', flat=True))
+        if not provinces:
+            provinces = [
+                Province.objects.get_or_create(name=name)[0].pk
+                for name in ('Distrito Nacional', 'Santo Domingo', 'Santiago')
+            ]
+        self.bulk_create(SuggestionBox, (
+            SuggestionBox(
+                province_id=self.random.choice(provinces),
+                classification=self.random.choice(SUGGESTION_CLASSIFICATIONS),
+                **self.person(index),
+                **self.review(),
+            )
+            for index in range(total)
+        ))
+
+    def generate_locations(self, total):
+        """Sucursales y cajeros con coordenadas y servicios"""
+        services = [
+            Service.objects.get_or_create(name=name, defaults={'description': name})[0].pk
+            for name in SERVICE_NAMES
+        ]
+
+        locations = self.bulk_create(Location, (
+            Location(
+                type='branch' if index % 3 == 0 else 'atm',
+                name=f'{LOAD_MARKER} {index + 1}',
+                address=self.random.choice(self.addresses),
+                phone=f'809-{self.random.randint(200, 999)}-{self.random.randint(0, 9999):04d}',
+                latitude=round(self.random.uniform(*LATITUDE_RANGE), 6),
+                longitude=round(self.random.uniform(*LONGITUDE_RANGE), 6),
+            )
+            for index in range(total)
+        ))
+
+        Through = Location.services.through
+        self.bulk_create(Through, (
+            Through(location_id=location.pk, service_id=service)
+            for location in locations
+            for service in self.random.sample(services, SERVICES_PER_LOCATION)
+        ))
+
+    def generate_documents(self, years):
+        """Documentos financieros y anuales de los últimos `years` años"""
+        current_year = date.today().year
+        year_range = [str(year) for year in range(current_year, max(current_year - years, OLDEST_YEAR - 1), -1)]
+
+        # El trimestre de los auditados es NULL, así que unique_together no evita duplicados
+        existing = set(FinancialDocument.objects.values_list('year', 'document_type', 'quarter'))
+        periods = [('audited', None)] + [('quarterly', str(quarter)) for quarter in range(1, 5)]
+        self.bulk_create(FinancialDocument, (
+            FinancialDocument(
+                title=f'{LOAD_MARKER} {year}',
+                file=f'financial_documents/carga-{year}-{quarter or "anual"}.pdf',
+                document_type=document_type,
+                quarter=quarter,
+                year=year,
+            )
+            for year in year_range
+            for document_type, quarter in periods
+            if (year, document_type, quarter) not in existing
+        ))
+
+        existing = set(YearlyDocument.objects.values_list('year', 'account_type_id'))
+        account_types = list(AccountType.objects.values_list('pk', flat=True))
+        if not account_types:
+            account_types = [
+                AccountType.objects.create(label=label, description=label).pk
+                for label in ('Cuentas abandonadas', 'Cuentas inactivas')
+            ]
+        self.bulk_create(YearlyDocument, (
+            YearlyDocument(
+                year=year,
+                account_type_id=account_type,
+                type='abandoned' if index % 2 == 0 else 'inactive',
+                title=f'{LOAD_MARKER} {year}',
+                document=f'documents/abandoned-accounts/carga-{year}-{account_type}.pdf',
+                date=date(int(year), 12, 31),
+            )
+            for year in year_range
+            for index, account_type in enumerate(account_types)
+            if (year, account_type) not in existing
+        ))
+
+    def clear(self):
+        """Elimina las filas marcadas por ejecuciones anteriores"""
+        self.stdout.write('🧹 Eliminando datos de carga anteriores...')
+        querysets = (
+            News.objects.filter(author=LOAD_MARKER),
+            ClaimRequest.objects.filter(email__endswith=f'@{LOAD_EMAIL_DOMAIN}'),
+            FraudReport.objects.filter(email__endswith=f'@{LOAD_EMAIL_DOMAIN}'),
+            SuggestionBox.objects.filter(email__endswith=f'@{LOAD_EMAIL_DOMAIN}'),
+            Location.objects.filter(name__startswith=f'{LOAD_MARKER} '),
+            FinancialDocument.objects.filter(title__startswith=f'{LOAD_MARKER} '),
+            YearlyDocument.objects.filter(title__startswith=f'{LOAD_MARKER} '),
+        )
+        with transaction.atomic():
+            for queryset in querysets:
+                _, deleted = queryset.delete()
+                total = deleted.get(queryset.model._meta.label, 0)
+                self.stdout.write(f'  🗑️ {queryset.model._meta.verbose_name_plural}: {total} filas')
+
+    def invalidate_caches(self):
+        """bulk_create no emite post_save: invalidar caché de respuestas, índice espacial y de búsqueda"""
+        _ensure_views_loaded()
+        for model in (News, NewsMedia, Tag, ClaimRequest, FraudReport, SuggestionBox,
+                      Location, Service, FinancialDocument, YearlyDocument):
+            invalidate_for_model(model)
+        invalidate_index()
+        rebuild_index(batch_size=self.batch_size)
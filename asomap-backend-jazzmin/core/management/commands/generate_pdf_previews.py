@@ -0,0 +1,68 @@
+"""
+Genera la miniatura y los metadatos de los documentos PDF ya subidos
+
+Los documentos nuevos se procesan en segundo plano al guardarse (ver
+core.signals y `manage.py run_jobs`); este comando cubre los que existían
+antes o los que fallaron.
+
+Ejemplos:
+    python manage.py generate_pdf_previews
+    python manage.py generate_pdf_previews --model prousuario.Contract --force
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from core.cache import invalidate_for_model
+from core.documents import enabled, generate_for_instance, needs_preview, preview_models
+from core.signals import _ensure_views_loaded
+
+
+class Command(BaseCommand):
+    help = 'Genera la vista previa (primera página, páginas y tamaño) de los documentos PDF existentes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Modelo a procesar (app_label.Model); se puede repetir. Por defecto todos'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenera también los documentos que ya tienen vista previa'
+        )
+
+    def handle(self, *args, **options):
+        if not enabled():
+            raise CommandError('Las vistas previas están desactivadas o falta pypdfium2')
+        self.stdout.write(self.style.SUCCESS('📄 Generando vistas previas de PDF...'))
+
+        if options['models']:
+            try:
+                models = [apps.get_model(label) for label in options['models']]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+        else:
+            models = preview_models()
+
+        total = failed = 0
+        for model in models:
+            if model not in preview_models():
+                raise CommandError(f'{model._meta.label} no tiene vista previa de PDF')
+            processed = 0
+            for instance in model._default_manager.iterator():
+                if not options['force'] and not needs_preview(instance):
+                    continue
+                try:
+                    processed += generate_for_instance(instance)
+                except Exception as e:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f'  ⚠️ {model._meta.label} #{instance.pk}: {e}'))
+            if processed:
+                _ensure_views_loaded()
+                invalidate_for_model(model)
+                self.stdout.write(f'  📄 {model._meta.label}: {processed} documentos')
+            total += processed
+
+        self.stdout.write(self.style.SUCCESS(f'✅ {total} documentos procesados, {failed} con error'))
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.db import connection
 from django.core.cache import cache
+from core.cache_backends import verify_cache
 from django.conf import settings
 import psutil
 import os
@@ -45,15 +46,12 @@ class Command(BaseCommand):
         # 2. Verificar cache
         if not options['check_db']:
             total_checks += 1
-            try:
-                cache.set('health_check', 'ok', 10)
-                if cache.get('health_check') == 'ok':
-                    self.stdout.write(self.style.SUCCESS('✓ Cache: Funcionando'))
-                    checks_passed += 1
-                else:
-                    self.stdout.write(self.style.WARNING('⚠️ Cache: No responde correctamente'))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'❌ Cache: Error - {e}'))
+            backend = cache.__class__.__name__
+            if verify_cache():
+                self.stdout.write(self.style.SUCCESS(f'✓ Cache: Funcionando ({backend})'))
+                checks_passed += 1
+            else:
+                self.stdout.write(self.style.WARNING(f'⚠️ Cache: No responde correctamente ({backend})'))
 
         # 3. Verificar directorios
         if not options['check_db']:
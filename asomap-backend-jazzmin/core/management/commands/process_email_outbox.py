@@ -0,0 +1,97 @@
+"""
+Worker de la cola de salida de emails
+
+Procesa los EmailLog en estado 'pending' con varios hilos de envío,
+reintentos con backoff exponencial y apagado ordenado con SIGTERM/SIGINT.
+"""
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.email_backends import close_email_connections
+from core.email_utils import claim_due_emails, send_pending_email
+
+
+def _send(email_log):
+    """
+    Envía un email desde un hilo del pool y libera su conexión a la BD
+
+    Cada hilo mantiene abierta su conexión SMTP mientras haya emails en la
+    cola, evitando un handshake TLS + AUTH por mensaje.
+    """
+    try:
+        return send_pending_email(email_log, keep_open=True)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = 'Envía los emails pendientes de la cola (EmailLog) de forma continua'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Cantidad de envíos SMTP simultáneos (por defecto: 4)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Cantidad máxima de emails reservados por ciclo (por defecto: 20)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Segundos de espera cuando la cola está vacía (por defecto: 2)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Procesa los emails pendientes una sola vez y termina'
+        )
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        concurrency = max(options['concurrency'], 1)
+        self.stdout.write(
+            self.style.SUCCESS(f'📬 Worker de emails iniciado ({concurrency} hilos)')
+        )
+
+        sent = failed = 0
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='email-outbox') as executor:
+            while not self.stopping:
+                emails = claim_due_emails(limit=options['batch_size'])
+                close_old_connections()
+
+                if emails:
+                    results = list(executor.map(_send, emails))
+                    sent += results.count(True)
+                    failed += results.count(False)
+                    self.stdout.write(
+                        f'📨 {results.count(True)} enviados, {results.count(False)} con error'
+                    )
+                    continue
+
+                # Cola vacía: ningún hilo está enviando, se liberan las conexiones SMTP
+                close_email_connections()
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Worker detenido: {sent} enviados, {failed} con error')
+        )
+
+    def stop(self, signum, frame):
+        """Termina después del ciclo en curso"""
+        self.stdout.write('⏹️ Deteniendo worker de emails...')
+        self.stopping = True
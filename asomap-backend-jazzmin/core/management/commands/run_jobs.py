@@ -0,0 +1,160 @@
+"""
+Worker de la cola de tareas en segundo plano
+
+Ejecuta los Job pendientes (ver core.jobs) en un pool de procesos, de modo
+que el procesamiento de imágenes y documentos no bloquea a gunicorn ni
+compite por el GIL. Los reintentos usan backoff exponencial y el apagado
+es ordenado con SIGTERM/SIGINT.
+
+Requiere un caché compartido con los procesos web (CACHE_BACKEND redis,
+sqlite o file): las tareas invalidan el caché de respuestas al terminar y
+con locmem esa invalidación nunca llegaría a gunicorn.
+"""
+import multiprocessing
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+
+from core.jobs import claim_due_jobs, execute, finish_job
+
+
+def _init_worker():
+    """Inicializa Django en cada proceso del pool (registra las tareas)"""
+    import django
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
+
+
+def _execute(task, payload):
+    """Ejecuta una tarea en un proceso del pool y libera su conexión a la BD"""
+    try:
+        return execute(task, payload)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = 'Ejecuta las tareas en segundo plano pendientes (Job) de forma continua'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=2,
+            help='Cantidad de procesos del pool (por defecto: 2)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help='Cantidad máxima de tareas reservadas por ciclo (por defecto: 10)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Segundos de espera cuando la cola está vacía (por defecto: 2)'
+        )
+        parser.add_argument(
+            '--max-tasks-per-child',
+            type=int,
+            default=100,
+            help='Tareas por proceso antes de reemplazarlo, limita el uso de memoria (por defecto: 100)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Procesa las tareas pendientes una sola vez y termina'
+        )
+
+    def handle(self, *args, **options):
+        if settings.CACHES['default']['BACKEND'].endswith('LocMemCache'):
+            raise CommandError(
+                'run_jobs necesita un caché compartido con el backend: configure '
+                'CACHE_BACKEND=redis, sqlite o file (o use JOBS_ASYNC=False sin worker)'
+            )
+
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        self.concurrency = max(options['concurrency'], 1)
+        self.max_tasks_per_child = max(options['max_tasks_per_child'], 1)
+        self.stdout.write(
+            self.style.SUCCESS(f'⚙️ Worker de tareas iniciado ({self.concurrency} procesos)')
+        )
+
+        done = failed = 0
+        executor = self.create_executor()
+        try:
+            while not self.stopping:
+                jobs = claim_due_jobs(limit=options['batch_size'])
+                close_old_connections()
+
+                if jobs:
+                    results, executor = self.run_batch(executor, jobs)
+                    done += results.count(True)
+                    failed += results.count(False)
+                    self.stdout.write(
+                        f'🗂️ {results.count(True)} completadas, {results.count(False)} con error'
+                    )
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Worker detenido: {done} completadas, {failed} con error')
+        )
+
+    def create_executor(self):
+        # Procesos nuevos (spawn): no heredan las conexiones a la BD del proceso principal
+        connections.close_all()
+        return ProcessPoolExecutor(
+            max_workers=self.concurrency,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def run_batch(self, executor, jobs):
+        """
+        Ejecuta un lote de tareas y registra cada resultado al terminar
+
+        Si un proceso del pool muere (ej. sin memoria) el pool queda
+        inutilizable: las tareas afectadas se reprograman y se crea uno nuevo.
+        """
+        futures = {executor.submit(_execute, job.task, job.payload): job for job in jobs}
+        results = []
+        broken = False
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                broken = True
+                results.append(finish_job(job, error=e))
+            except Exception as e:
+                results.append(finish_job(job, error=e))
+            else:
+                results.append(finish_job(job, result=result))
+
+        if broken:
+            self.stdout.write(self.style.WARNING('⚠️ Un proceso del pool terminó inesperadamente, reiniciando...'))
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = self.create_executor()
+        return results, executor
+
+    def stop(self, signum, frame):
+        """Termina después del ciclo en curso"""
+        self.stdout.write('⏹️ Deteniendo worker de tareas...')
+        self.stopping = True
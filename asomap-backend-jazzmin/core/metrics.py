@@ -0,0 +1,152 @@
+"""
+Métricas de la API en formato Prometheus
+
+MetricsMiddleware registra por cada ruta resuelta (view_name de Django/DRF,
+por ejemplo 'products-accounts' o 'prousuario:claim-requests-list'):
+
+- cantidad de peticiones por método y código de estado
+- histograma de latencia
+- histograma del tamaño de la respuesta
+- cantidad de consultas a la BD y tiempo total en la BD
+
+Con gunicorn cada worker es un proceso distinto; si la variable de entorno
+PROMETHEUS_MULTIPROC_DIR está definida (ver gunicorn.conf.py) prometheus_client
+guarda los valores en archivos compartidos y /metrics agrega todos los
+workers. Sin la variable (runserver, tests) se usa el registro del proceso.
+"""
+import os
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+# Etiquetas para peticiones que no llegan a resolverse con una URL de Django
+MEDIA_ROUTE = 'media'
+UNMATCHED_ROUTE = 'unmatched'
+
+REQUESTS = Counter(
+    'asomap_http_requests_total',
+    'Peticiones HTTP atendidas',
+    ['route', 'method', 'status'],
+)
+LATENCY = Histogram(
+    'asomap_http_request_duration_seconds',
+    'Duración de la petición en segundos',
+    ['route', 'method'],
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    'asomap_http_response_size_bytes',
+    'Tamaño del cuerpo de la respuesta en bytes',
+    ['route', 'method'],
+    buckets=SIZE_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    'asomap_db_queries_per_request',
+    'Consultas a la base de datos por petición',
+    ['route', 'method'],
+    buckets=QUERY_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'asomap_db_query_duration_seconds',
+    'Tiempo total en la base de datos por petición en segundos',
+    ['route', 'method'],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+class QueryCounter:
+    """
+    Wrapper de ejecución que cuenta las consultas SQL y su duración
+
+    Uso:
+        counter = QueryCounter()
+        with counter.install():
+            ...
+        counter.count, counter.duration
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+    def install(self):
+        """Instala el wrapper en todas las conexiones configuradas"""
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+
+def route_name(request):
+    """
+    Nombre de la ruta para las etiquetas de las métricas
+
+    Se usa el view_name y no el path para que las URL con parámetros
+    (/api/news/15/) no creen una serie por cada id.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is not None and match.view_name:
+        return match.view_name
+    if settings.MEDIA_URL and request.path.startswith(settings.MEDIA_URL):
+        return MEDIA_ROUTE
+    return UNMATCHED_ROUTE
+
+
+def response_size(response):
+    """Tamaño del cuerpo; para respuestas en streaming se usa Content-Length"""
+    if response.streaming:
+        try:
+            return int(response.get('Content-Length', 0))
+        except ValueError:
+            return 0
+    return len(response.content)
+
+
+def observe_request(request, response, duration, queries):
+    """Registra las métricas de una petición atendida"""
+    route = route_name(request)
+    method = request.method
+
+    REQUESTS.labels(route, method, str(response.status_code)).inc()
+    LATENCY.labels(route, method).observe(duration)
+    RESPONSE_SIZE.labels(route, method).observe(response_size(response))
+    DB_QUERIES.labels(route, method).observe(queries.count)
+    DB_DURATION.labels(route, method).observe(queries.duration)
+
+
+def render_metrics():
+    """
+    Genera el texto de exposición de Prometheus
+
+    Returns:
+        tuple: (contenido, content_type)
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,11 +1,22 @@
 import time
 import logging
+import mimetypes
+import re
+from urllib.parse import quote
 from django.http import HttpResponse
 from django.conf import settings
 import os
-from django.http import HttpResponse, Http404
+from django.http import HttpResponse, Http404, FileResponse, StreamingHttpResponse
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from core.metrics import QueryCounter, observe_request
+from core.query_budget import QueryBudgetExceeded, get_query_budget, server_timing
+from core.storage import blob_digest
 
 logger = logging.getLogger(__name__)
 
@@ -86,8 +97,40 @@ class HealthCheckMiddleware:
         response = self.get_response(request)
         return response
 
+# Tamaño de bloque para transmitir rangos parciales
+MEDIA_CHUNK_SIZE = 64 * 1024
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _file_range_iterator(path, start, length):
+    """Lee `length` bytes desde `start` en bloques, sin cargar el archivo en memoria"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(MEDIA_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
 class PublicMediaMiddleware:
-    """Middleware para servir archivos de media públicamente sin autenticación."""
+    """
+    Middleware para servir archivos de media públicamente sin autenticación.
+
+    Los archivos se transmiten en bloques (FileResponse), se responden
+    peticiones Range con 206 y se valida If-None-Match/If-Modified-Since
+    con 304. Con MEDIA_SENDFILE_BACKEND = 'nginx' o 'sendfile' la entrega
+    se delega al servidor web mediante X-Accel-Redirect o X-Sendfile, por
+    ejemplo en nginx:
+
+        location /protected-media/ {
+            internal;
+            alias /app/media/;
+        }
+    """
     
     def __init__(self, get_response):
         self.get_response = get_response
@@ -95,38 +138,190 @@ class PublicMediaMiddleware:
     def __call__(self, request):
         # Si la petición es para archivos de media, servir directamente
         if request.path.startswith('/media/'):
+            media_path = request.path[len('/media/'):]
             try:
-                # Obtener la ruta del archivo relativa a MEDIA_ROOT
-                media_path = request.path.replace('/media/', '')
-                full_path = os.path.join(settings.MEDIA_ROOT, media_path)
-                
-                # Verificar que el archivo existe
-                if os.path.exists(full_path) and os.path.isfile(full_path):
-                    # Servir el archivo directamente
-                    with open(full_path, 'rb') as f:
-                        content = f.read()
-                    
-                    # Determinar el tipo MIME basado en la extensión
-                    import mimetypes
-                    content_type, _ = mimetypes.guess_type(full_path)
-                    if content_type is None:
-                        content_type = 'application/octet-stream'
-                    
-                    response = HttpResponse(content, content_type=content_type)
-                    
-                    # Agregar headers para cache y CORS
-                    response['Cache-Control'] = 'public, max-age=31536000'  # 1 año
-                    response['Access-Control-Allow-Origin'] = '*'
-                    response['Access-Control-Allow-Methods'] = 'GET, HEAD, OPTIONS'
-                    response['Access-Control-Allow-Headers'] = 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization'
-                    
-                    return response
-                else:
-                    raise Http404("Archivo no encontrado")
-                    
-            except Exception as e:
-                # Si hay algún error, devolver 404
-                raise Http404(f"Error al servir archivo: {str(e)}")
+                # safe_join impide salir de MEDIA_ROOT con rutas como ../
+                full_path = safe_join(settings.MEDIA_ROOT, media_path)
+                stat = os.stat(full_path)
+            except (SuspiciousFileOperation, OSError, ValueError):
+                raise Http404("Archivo no encontrado")
+            if not os.path.isfile(full_path):
+                raise Http404("Archivo no encontrado")
+
+            response = self.serve(request, full_path, media_path, stat)
+
+            # Agregar headers para cache y CORS
+            response['Cache-Control'] = 'public, max-age=31536000'  # 1 año
+            if blob_digest(media_path):
+                # Ruta derivada del contenido (ver core.storage): nunca cambia
+                response['Cache-Control'] += ', immutable'
+            response['Access-Control-Allow-Origin'] = '*'
+            response['Access-Control-Allow-Methods'] = 'GET, HEAD, OPTIONS'
+            response['Access-Control-Allow-Headers'] = 'DNT,User-Agent,X-Requested-With,If-Modified-Since,Cache-Control,Content-Type,Range,Authorization'
+            return response
         
         response = self.get_response(request)
-        return response 
\ No newline at end of file
+        return response
+
+    def serve(self, request, full_path, media_path, stat):
+        """Construye la respuesta completa, parcial (206), 304 o delegada al servidor web"""
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        last_modified = int(stat.st_mtime)
+
+        # 304 Not Modified / 412 Precondition Failed
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            self.set_validators(response, etag, last_modified)
+            return response
+
+        content_type, _ = mimetypes.guess_type(full_path)
+        if content_type is None:
+            content_type = 'application/octet-stream'
+
+        backend = getattr(settings, 'MEDIA_SENDFILE_BACKEND', '')
+        if backend == 'nginx':
+            # nginx lee el archivo y atiende Range por su cuenta
+            response = HttpResponse(content_type=content_type)
+            prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+            response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(media_path)
+        elif backend == 'sendfile':
+            response = HttpResponse(content_type=content_type)
+            response['X-Sendfile'] = full_path
+        else:
+            response = self.file_response(request, full_path, stat.st_size, content_type, etag, last_modified)
+
+        self.set_validators(response, etag, last_modified)
+        return response
+
+    def file_response(self, request, full_path, size, content_type, etag, last_modified):
+        """Transmite el archivo completo o el rango solicitado"""
+        byte_range = self.requested_range(request, size, etag, last_modified)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        if byte_range is None:
+            response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                _file_range_iterator(full_path, start, length),
+                status=206,
+                content_type=content_type
+            )
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(length)
+
+        response['Accept-Ranges'] = 'bytes'
+        return response
+
+    def requested_range(self, request, size, etag, last_modified):
+        """
+        Interpreta el header Range (un solo rango de bytes)
+
+        Returns:
+            tuple | None | False: (inicio, fin) inclusivo, None para enviar el
+            archivo completo, o False si el rango no es satisfacible (416)
+        """
+        header = request.META.get('HTTP_RANGE', '').strip()
+        if not header or request.method not in ('GET', 'HEAD'):
+            return None
+
+        # If-Range: solo se respeta el rango si el archivo no cambió
+        if_range = request.META.get('HTTP_IF_RANGE', '').strip()
+        if if_range and if_range != etag:
+            if_range_date = parse_http_date_safe(if_range)
+            if if_range_date is None or if_range_date < last_modified:
+                return None
+
+        match = RANGE_RE.match(header)
+        if not match:
+            # Varios rangos o formato desconocido: se envía el archivo completo
+            return None
+
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # Sufijo: últimos N bytes
+            suffix = int(last)
+            if suffix == 0 or size == 0:
+                return False
+            return max(size - suffix, 0), size - 1
+
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and end < start:
+            # Rango sintácticamente inválido (RFC 9110 §14.2): se ignora el header
+            return None
+        if start >= size:
+            return False
+        return start, min(end, size - 1)
+
+    @staticmethod
+    def set_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+
+
+class MetricsMiddleware:
+    """
+    Registra latencia, tamaño de respuesta y consultas a la BD por ruta
+
+    Debe ir al principio de MIDDLEWARE para medir también las respuestas que
+    generan otros middlewares (healthcheck, media). Los valores se exponen
+    en /metrics (ver core/metrics.py).
+    """
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed('Métricas deshabilitadas (METRICS_ENABLED=False)')
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        start = time.perf_counter()
+        with queries.install():
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        try:
+            observe_request(request, response, duration, queries)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudieron registrar las métricas de {request.path}: {e}")
+        return response
+
+
+class QueryBudgetMiddleware:
+    """
+    Verifica el presupuesto de consultas por endpoint (ver core/query_budget.py)
+
+    Con DEBUG agrega X-DB-Queries y Server-Timing para revisar las
+    consultas de cada respuesta desde las herramientas del navegador.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryCounter()
+        start = time.perf_counter()
+        with queries.install():
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        budget = get_query_budget(request)
+        if budget is not None and queries.count > budget:
+            message = (
+                f"{request.method} {request.path} ({request.resolver_match.view_name}) "
+                f"ejecutó {queries.count} consultas; presupuesto: {budget}"
+            )
+            if getattr(settings, 'QUERY_BUDGET_RAISE', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(f"🐢 Presupuesto de consultas excedido: {message}")
+
+        if settings.DEBUG:
+            response['X-DB-Queries'] = str(queries.count)
+            response['Server-Timing'] = server_timing(queries, duration)
+        return response
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_emaillog_fraud_report_alter_emaillog_email_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillog',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='Número de intentos de envío realizados', verbose_name='Intentos'),
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='Momento a partir del cual el worker puede (re)intentar el envío', null=True, verbose_name='Próximo intento'),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='core_emaill_status_da9028_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_emaillog_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(help_text='Nombre de la tarea registrada en core.jobs', max_length=100, verbose_name='Tarea')),
+                ('payload', models.JSONField(blank=True, default=dict, help_text='Argumentos con los que se ejecuta la tarea', verbose_name='Parámetros')),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('running', 'En ejecución'), ('done', 'Completada'), ('failed', 'Fallida')], default='pending', max_length=20, verbose_name='Estado')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Número de ejecuciones realizadas', verbose_name='Intentos')),
+                ('next_attempt_at', models.DateTimeField(blank=True, help_text='Momento a partir del cual el worker puede (re)tomar la tarea', null=True, verbose_name='Próximo intento')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='Resultado')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='Mensaje de Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Inicio')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Fin')),
+            ],
+            options={
+                'verbose_name': 'Tarea en Segundo Plano',
+                'verbose_name_plural': 'Tareas en Segundo Plano',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='core_job_status_6febab_idx'), models.Index(fields=['task', 'status'], name='core_job_task_c920fe_idx')],
+            },
+        ),
+    ]
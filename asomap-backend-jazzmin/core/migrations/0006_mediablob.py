@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(help_text='Suma SHA-256 del contenido', max_length=64, unique=True, verbose_name='SHA-256')),
+                ('name', models.CharField(help_text='Ruta del archivo en el storage', max_length=255, verbose_name='Ruta')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='Tamaño (bytes)')),
+                ('ref_count', models.PositiveIntegerField(default=0, help_text='Cantidad de campos de archivo que usan este blob', verbose_name='Referencias')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Última Actualización')),
+            ],
+            options={
+                'verbose_name': 'Archivo Deduplicado',
+                'verbose_name_plural': 'Archivos Deduplicados',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['ref_count', 'updated_at'], name='core_mediab_ref_cou_7cfd2c_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,190 @@
+"""
+GET condicional (ETag / Last-Modified / 304) para los ViewSets de la API
+
+El validador se calcula con una sola consulta de agregación por modelo
+(MAX(updated_at) y COUNT(*)), de modo que si el cliente ya tiene la versión
+actual se responde 304 sin ejecutar la serialización.
+
+El resultado se guarda en el caché con la versión de cada modelo de la
+consulta (ver core.cache.get_model_versions), que las señales incrementan
+al guardar o eliminar: entre ediciones las revalidaciones no consultan la BD.
+Con un caché por proceso y varios workers (API_RESPONSE_CACHE_ENABLED=False)
+los validadores se calculan siempre.
+"""
+import hashlib
+from functools import wraps
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .cache import (
+    CACHE_KEY_PREFIX, get_model_versions, get_response_cache_timeout, response_cache_enabled
+)
+
+_table_labels = None
+
+
+def _resolve_queryset(source):
+    """Acepta un modelo, una etiqueta 'app_label.Model' o un queryset"""
+    if isinstance(source, str):
+        return apps.get_model(source)._default_manager.all()
+    if hasattr(source, '_default_manager'):
+        return source._default_manager.all()
+    return source
+
+
+def _query_labels(query):
+    """Modelos ('app_label.model') de las tablas que usa una consulta"""
+    global _table_labels
+    if _table_labels is None:
+        _table_labels = {
+            model._meta.db_table: model._meta.label_lower
+            for model in apps.get_models(include_auto_created=True)
+        }
+    tables = {join.table_name for join in query.alias_map.values()}
+    tables.add(query.model._meta.db_table)
+    return {_table_labels[table] for table in tables if table in _table_labels}
+
+
+def _validators_cache_key(querysets):
+    """
+    Clave de caché de los validadores: SQL de cada consulta más la versión
+    de los modelos que intervienen. None si alguna consulta no se puede
+    compilar (ej. un queryset vacío) o el caché de respuestas está
+    desactivado, en cuyo caso no se cachea.
+    """
+    if not response_cache_enabled():
+        return None
+
+    statements = []
+    labels = set()
+    for queryset in querysets:
+        try:
+            statements.append(queryset.query.sql_with_params())
+        except EmptyResultSet:
+            return None
+        labels |= _query_labels(queryset.query)
+
+    versions = sorted(get_model_versions(labels).items())
+    raw = repr((statements, versions)).encode('utf-8')
+    return f'{CACHE_KEY_PREFIX}:validators:{hashlib.md5(raw).hexdigest()}'
+
+
+def compute_validators(querysets):
+    """
+    Calcula el ETag (débil) y la fecha de última modificación
+
+    Args:
+        querysets: Modelos, etiquetas de modelo o querysets que alimentan la respuesta
+
+    Returns:
+        tuple: (etag, last_modified) donde last_modified es un timestamp o None
+    """
+    querysets = [_resolve_queryset(source).order_by() for source in querysets]
+    cache_key = _validators_cache_key(querysets)
+    if cache_key is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return tuple(cached)
+
+    parts = []
+    last_modified = None
+
+    for queryset in querysets:
+        model = queryset.model
+        try:
+            model._meta.get_field('updated_at')
+            aggregates = queryset.aggregate(total=Count('pk'), last=Max('updated_at'))
+        except FieldDoesNotExist:
+            # Modelos sin updated_at: solo cuenta filas, no detecta ediciones.
+            # Los modelos que alimentan un endpoint condicional deben tenerlo.
+            aggregates = queryset.aggregate(total=Count('pk'))
+
+        last = aggregates.get('last')
+        parts.append(f"{model._meta.label_lower}:{aggregates['total']}:{last.isoformat() if last else ''}")
+        if last and (last_modified is None or last > last_modified):
+            last_modified = last
+
+    digest = hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    validators = (f'W/"{digest}"', timestamp)
+    if cache_key is not None:
+        cache.set(cache_key, validators, get_response_cache_timeout())
+    return validators
+
+
+def _conditional_response(request, querysets, view_func):
+    """Retorna 304 si el cliente tiene la versión actual, o ejecuta la vista"""
+    etag, last_modified = compute_validators(querysets)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = view_func()
+
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        # Obliga al navegador/proxy a revalidar en lugar de usar frescura heurística
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def conditional_get(*sources):
+    """
+    Decorador para acciones GET personalizadas de un ViewSet
+
+    Args:
+        sources: Modelos, etiquetas 'app_label.Model' o querysets de los que
+            depende la respuesta. Si no se indican se usa
+            `self.filter_queryset(self.get_queryset())`.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_method(self, request, *args, **kwargs)
+            querysets = sources or [self.filter_queryset(self.get_queryset())]
+            return _conditional_response(
+                request,
+                querysets,
+                lambda: view_method(self, request, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    Mixin para ViewSets que agrega ETag/Last-Modified a list y retrieve
+
+    El validador de `list` usa el queryset filtrado de la vista; el de
+    `retrieve` se limita al objeto solicitado. Los modelos relacionados que se
+    serializan anidados se declaran en `conditional_related_models`.
+    """
+    conditional_related_models = ()
+
+    def get_conditional_querysets(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return [queryset, *self.conditional_related_models]
+
+    def list(self, request, *args, **kwargs):
+        return _conditional_response(
+            request,
+            self.get_conditional_querysets(),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return _conditional_response(
+            request,
+            self.get_conditional_querysets(),
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
@@ -32,6 +32,41 @@ class SoftDeleteModel(models.Model):
         self.save()
 
 
+def preview_upload_to(instance, filename):
+    return f'previews/{instance._meta.model_name}/{filename}'
+
+
+class PdfPreviewModel(models.Model):
+    """
+    Modelo base abstracto para documentos PDF con vista previa de la primera página
+
+    Las subclases indican en `pdf_field` el nombre de su FileField con el PDF;
+    los campos de la vista previa los completa core.documents en segundo plano.
+    """
+    pdf_field = 'file'
+
+    preview_image = models.ImageField(
+        upload_to=preview_upload_to,
+        blank=True,
+        editable=False,
+        verbose_name="Vista previa",
+        help_text="Miniatura de la primera página (se genera automáticamente)"
+    )
+    page_count = models.PositiveIntegerField(null=True, blank=True, editable=False, verbose_name="Páginas")
+    page_width = models.FloatField(null=True, blank=True, editable=False, verbose_name="Ancho de página (pt)")
+    page_height = models.FloatField(null=True, blank=True, editable=False, verbose_name="Alto de página (pt)")
+    file_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False, verbose_name="Tamaño (bytes)")
+    preview_source = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Archivo a partir del cual se generó la vista previa"
+    )
+
+    class Meta:
+        abstract = True
+
+
 class EmailConfiguration(models.Model):
     """Modelo para configuración de email del sistema"""
     
@@ -188,6 +223,17 @@ class EmailLog(models.Model):
         verbose_name="Mensaje de Error",
         help_text="Error si el envío falló"
     )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Intentos",
+        help_text="Número de intentos de envío realizados"
+    )
+    next_attempt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Próximo intento",
+        help_text="Momento a partir del cual el worker puede (re)intentar el envío"
+    )
     
     # Información relacionada
     claim_request = models.ForeignKey(
@@ -234,6 +280,7 @@ class EmailLog(models.Model):
             models.Index(fields=['email_type', 'status']),
             models.Index(fields=['created_at']),
             models.Index(fields=['to_email']),
+            models.Index(fields=['status', 'next_attempt_at']),
         ]
 
     def __str__(self):
@@ -249,4 +296,147 @@ class EmailLog(models.Model):
         """Calcula el tiempo de entrega"""
         if self.sent_at and self.created_at:
             return self.sent_at - self.created_at
-        return None 
\ No newline at end of file
+        return None 
+
+class Job(models.Model):
+    """
+    Tarea en segundo plano (cola en la base de datos)
+
+    Las tareas registradas en core.jobs se encolan al confirmar la
+    transacción y las ejecuta el worker `manage.py run_jobs`, fuera del
+    ciclo petición/respuesta.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pendiente'),
+        ('running', 'En ejecución'),
+        ('done', 'Completada'),
+        ('failed', 'Fallida'),
+    ]
+    
+    task = models.CharField(
+        max_length=100,
+        verbose_name="Tarea",
+        help_text="Nombre de la tarea registrada en core.jobs"
+    )
+    payload = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Parámetros",
+        help_text="Argumentos con los que se ejecuta la tarea"
+    )
+    
+    # Estado y seguimiento
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name="Estado"
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Intentos",
+        help_text="Número de ejecuciones realizadas"
+    )
+    next_attempt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Próximo intento",
+        help_text="Momento a partir del cual el worker puede (re)tomar la tarea"
+    )
+    result = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name="Resultado"
+    )
+    error_message = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name="Mensaje de Error"
+    )
+    
+    # Timestamps
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Fecha de Creación"
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Inicio"
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Fin"
+    )
+
+    class Meta:
+        verbose_name = "Tarea en Segundo Plano"
+        verbose_name_plural = "Tareas en Segundo Plano"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+            models.Index(fields=['task', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} - {self.get_status_display()}"
+    
+    @property
+    def duration(self):
+        """Tiempo de la última ejecución"""
+        if self.started_at and self.finished_at:
+            return self.finished_at - self.started_at
+        return None
+
+
+class MediaBlob(models.Model):
+    """
+    Archivo único del almacenamiento por contenido (ver core.storage)
+
+    ref_count es la cantidad de campos de archivo que apuntan al blob; los
+    blobs sin referencias los elimina `manage.py collect_media_garbage`.
+    """
+    
+    digest = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="SHA-256",
+        help_text="Suma SHA-256 del contenido"
+    )
+    name = models.CharField(
+        max_length=255,
+        verbose_name="Ruta",
+        help_text="Ruta del archivo en el storage"
+    )
+    size = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name="Tamaño (bytes)"
+    )
+    ref_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Referencias",
+        help_text="Cantidad de campos de archivo que usan este blob"
+    )
+    
+    # Timestamps
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Fecha de Creación"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Última Actualización"
+    )
+
+    class Meta:
+        verbose_name = "Archivo Deduplicado"
+        verbose_name_plural = "Archivos Deduplicados"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['ref_count', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} referencias)"
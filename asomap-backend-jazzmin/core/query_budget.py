@@ -0,0 +1,77 @@
+"""
+Presupuesto de consultas a la BD por endpoint
+
+Cada endpoint puede declarar cuántas consultas SQL debe ejecutar como máximo
+para detectar regresiones N+1 (un serializer que consulta por cada fila):
+
+    @action(detail=False, methods=['get'], url_path='branches')
+    @query_budget(8)
+    def branches(self, request):
+        ...
+
+o desde settings, por nombre de ruta (tiene prioridad sobre el decorador):
+
+    QUERY_BUDGETS = {'location-list': 8}
+
+QueryBudgetMiddleware cuenta las consultas de cada petición. Si se supera el
+presupuesto registra un warning o, con QUERY_BUDGET_RAISE (activo al correr
+los tests), lanza QueryBudgetExceeded para que el test falle. Con DEBUG
+agrega los headers X-DB-Queries y Server-Timing a todas las respuestas.
+"""
+from django.conf import settings
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Una petición ejecutó más consultas que las permitidas para su endpoint"""
+
+
+def query_budget(max_queries):
+    """
+    Declara el máximo de consultas de una acción de ViewSet o vista
+
+    Solo marca la función; la verificación la hace QueryBudgetMiddleware, de
+    modo que también cuenta las consultas de la paginación y del ETag.
+    """
+    def decorator(view_method):
+        view_method.query_budget = max_queries
+        return view_method
+    return decorator
+
+
+def _view_handler(request):
+    """Método o función que atendió la petición (acción del ViewSet si aplica)"""
+    func = request.resolver_match.func
+    actions = getattr(func, 'actions', None)
+    view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    if actions and view_class is not None:
+        return getattr(view_class, actions.get(request.method.lower(), ''), None)
+    return func
+
+
+def get_query_budget(request):
+    """
+    Presupuesto de la petición resuelta
+
+    Returns:
+        int | None: Máximo de consultas, o None si el endpoint no tiene límite
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    if match.view_name in budgets:
+        return budgets[match.view_name]
+
+    budget = getattr(_view_handler(request), 'query_budget', None)
+    if budget is None:
+        budget = getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+    return budget or None
+
+
+def server_timing(queries, duration):
+    """Valor del header Server-Timing (duraciones en milisegundos)"""
+    return (
+        f'db;dur={queries.duration * 1000:.1f};desc="{queries.count} queries", '
+        f'total;dur={duration * 1000:.1f}'
+    )
@@ -1,8 +1,50 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from .documents import preview_data
+from .images import responsive_image_data
+
+
 class BaseModelSerializer(serializers.ModelSerializer):
     """
     Base serializer with common functionality.
     """
     created_at = serializers.DateTimeField(read_only=True)
-    updated_at = serializers.DateTimeField(read_only=True) 
\ No newline at end of file
+    updated_at = serializers.DateTimeField(read_only=True) 
+
+
+@extend_schema_field(OpenApiTypes.OBJECT)
+class ResponsiveImageField(serializers.Field):
+    """
+    Variantes responsive de un ImageField (ver core.images)
+
+    Retorna {'src', 'width', 'height', 'srcset', 'sources'} o None si la
+    imagen aún no tiene variantes; el campo con la URL original no cambia.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return responsive_image_data(value)
+
+
+
+@extend_schema_field(OpenApiTypes.OBJECT)
+class PdfPreviewField(serializers.Field):
+    """
+    Vista previa de un documento PDF (ver core.documents)
+
+    Retorna {'thumbnail', 'width', 'height', 'pages', 'file_size',
+    'page_size_mm'} o None si todavía no se generó.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        kwargs['source'] = '*'
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return preview_data(value)
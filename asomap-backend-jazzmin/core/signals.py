@@ -0,0 +1,143 @@
+"""
+Señales de core
+
+Invalidan el caché de respuestas (ver core.cache) cuando se guarda, elimina
+o cambia una relación ManyToMany de un modelo del que depende algún endpoint,
+encolan la generación de las variantes responsive de las imágenes subidas
+(ver core.images y core.tasks) y de las vistas previas de los PDF (ver
+core.documents), mantienen el contador de referencias de los archivos
+deduplicados (ver core.storage) y aplican el perfil de SQLite (ver
+core.sqlite) a cada conexión nueva.
+"""
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from django.urls import get_resolver
+
+from .cache import invalidate_for_model
+from .documents import delete_preview_file, enabled as pdf_previews_enabled, needs_preview
+from .images import delete_for_instance, enabled as responsive_images_enabled, pending_images
+from .jobs import enqueue
+from .models import PdfPreviewModel
+from .sqlite import apply_pragmas
+from .storage import content_addressed_fields, update_references
+
+_urlconf_loaded = False
+
+
+def _ensure_views_loaded():
+    """
+    Carga el URLconf para que los decoradores @cached_response registren sus
+    dependencias aunque el proceso (ej. un comando de gestión) no haya
+    atendido todavía ninguna petición.
+    """
+    global _urlconf_loaded
+    if not _urlconf_loaded:
+        get_resolver().url_patterns
+        _urlconf_loaded = True
+
+
+@receiver(post_save, dispatch_uid='core_response_cache_post_save')
+@receiver(post_delete, dispatch_uid='core_response_cache_post_delete')
+def invalidate_response_cache(sender, using=None, **kwargs):
+    """
+    Invalida los endpoints cacheados que dependen del modelo modificado
+
+    La invalidación espera a que se confirme la transacción: si se hiciera
+    antes, una petición concurrente leería las filas anteriores y las
+    cachearía con la versión nueva durante API_RESPONSE_CACHE_TIMEOUT.
+    """
+    _ensure_views_loaded()
+    transaction.on_commit(lambda: invalidate_for_model(sender), using=using)
+
+
+@receiver(m2m_changed, dispatch_uid='core_response_cache_m2m_changed')
+def invalidate_response_cache_m2m(sender, instance, action, model, using=None, **kwargs):
+    """Invalida los endpoints cuando cambian relaciones ManyToMany"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    _ensure_views_loaded()
+    instance_model = instance.__class__
+
+    def invalidate():
+        invalidate_for_model(instance_model)
+        invalidate_for_model(model)
+
+    transaction.on_commit(invalidate, using=using)
+
+
+@receiver(post_save, dispatch_uid='core_responsive_images_post_save')
+def generate_responsive_images(sender, instance, raw=False, **kwargs):
+    """Encola la generación de variantes de las imágenes nuevas del objeto guardado"""
+    if raw or not responsive_images_enabled() or not pending_images(instance):
+        return
+    enqueue('images.generate_variants', model=sender._meta.label, pk=instance.pk)
+
+
+@receiver(post_delete, dispatch_uid='core_responsive_images_post_delete')
+def delete_responsive_images(sender, instance, **kwargs):
+    """Elimina las variantes de las imágenes del objeto borrado"""
+    delete_for_instance(instance)
+
+
+@receiver(post_save, dispatch_uid='core_pdf_previews_post_save')
+def generate_pdf_preview(sender, instance, raw=False, **kwargs):
+    """Encola la vista previa del PDF del objeto guardado si cambió el archivo"""
+    if raw or not isinstance(instance, PdfPreviewModel) or not pdf_previews_enabled():
+        return
+    if needs_preview(instance):
+        enqueue('documents.generate_preview', model=sender._meta.label, pk=instance.pk)
+
+
+@receiver(post_delete, dispatch_uid='core_pdf_previews_post_delete')
+def delete_pdf_preview(sender, instance, **kwargs):
+    """Elimina la miniatura del documento borrado"""
+    if isinstance(instance, PdfPreviewModel) and instance.preview_image:
+        delete_preview_file(instance.preview_image.storage, instance.preview_image.name)
+
+
+def _file_names(instance, fields):
+    return {field.attname: getattr(instance, field.attname).name or '' for field in fields}
+
+
+@receiver(pre_save, dispatch_uid='core_media_blobs_pre_save')
+def remember_media_blobs(sender, instance, raw=False, **kwargs):
+    """Guarda los archivos que tenía el objeto antes de guardarlo"""
+    fields = content_addressed_fields(sender)
+    if raw or not fields:
+        return
+    previous = {}
+    if instance.pk is not None:
+        previous = sender._default_manager.filter(pk=instance.pk).values(
+            *[field.attname for field in fields]
+        ).first() or {}
+    instance._media_blob_names = previous
+
+
+@receiver(post_save, dispatch_uid='core_media_blobs_post_save')
+def count_media_blobs(sender, instance, raw=False, **kwargs):
+    """Actualiza las referencias de los archivos que cambiaron"""
+    if raw or not hasattr(instance, '_media_blob_names'):
+        return
+    previous = instance.__dict__.pop('_media_blob_names')
+    current = _file_names(instance, content_addressed_fields(sender))
+    changed = [attname for attname, name in current.items() if (previous.get(attname) or '') != name]
+    update_references(
+        added=[current[attname] for attname in changed],
+        removed=[previous.get(attname) for attname in changed],
+    )
+
+
+@receiver(post_delete, dispatch_uid='core_media_blobs_post_delete')
+def release_media_blobs(sender, instance, **kwargs):
+    """Descuenta las referencias de los archivos del objeto borrado"""
+    fields = content_addressed_fields(sender)
+    if fields:
+        update_references(removed=_file_names(instance, fields).values())
+
+
+@receiver(connection_created, dispatch_uid='core_sqlite_pragmas')
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Aplica settings.SQLITE_PRAGMAS al abrir una conexión SQLite"""
+    apply_pragmas(connection)
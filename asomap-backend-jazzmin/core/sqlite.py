@@ -0,0 +1,126 @@
+"""
+Perfil de rendimiento para SQLite (asomap.db)
+
+Con varios workers de Gunicorn sobre el mismo archivo, el journal por
+defecto (rollback) bloquea las lecturas mientras se escribe un formulario
+público y termina en errores "database is locked". Al abrir cada conexión
+se aplican los pragmas de settings.SQLITE_PRAGMAS:
+
+- journal_mode=WAL: lectores y escritor no se bloquean entre sí
+- synchronous=NORMAL: seguro con WAL y mucho más rápido que FULL
+- mmap_size / cache_size: lecturas desde memoria
+- busy_timeout: espera al escritor en curso en lugar de fallar
+- temp_store=MEMORY: ordenamientos y tablas temporales en memoria
+
+El check core.I001 (ver core.checks) y gunicorn.conf.py informan los
+valores que quedaron activos.
+"""
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Orden de aplicación: journal_mode primero porque cambia el archivo
+PRAGMA_ORDER = ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'mmap_size', 'temp_store')
+
+# SQLite devuelve estos pragmas como números
+SYNCHRONOUS_VALUES = {'off': 0, 'normal': 1, 'full': 2, 'extra': 3}
+TEMP_STORE_VALUES = {'default': 0, 'file': 1, 'memory': 2}
+
+# Pragmas que una base en memoria no admite (se leen con otro valor)
+IN_MEMORY_SKIPPED = {'journal_mode', 'mmap_size'}
+
+
+def _ordered(pragmas):
+    return sorted(pragmas.items(), key=lambda item: (
+        PRAGMA_ORDER.index(item[0]) if item[0] in PRAGMA_ORDER else len(PRAGMA_ORDER)
+    ))
+
+
+def apply_pragmas(connection):
+    """
+    Aplica settings.SQLITE_PRAGMAS a una conexión SQLite recién creada
+
+    Se ejecutan sobre la conexión sqlite3 directamente para no pasar por los
+    wrappers de Django (métricas, presupuesto de consultas).
+    """
+    if connection.vendor != 'sqlite':
+        return
+
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    if not pragmas:
+        return
+
+    raw = connection.connection
+    for name, value in _ordered(pragmas):
+        try:
+            raw.execute(f'PRAGMA {name}={value}')
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo aplicar PRAGMA {name}={value} en '{connection.alias}': {e}")
+
+
+def expected_value(name, value):
+    """Valor configurado con el formato en que SQLite lo devuelve al consultarlo"""
+    if name == 'synchronous':
+        return SYNCHRONOUS_VALUES.get(str(value).lower(), value)
+    if name == 'temp_store':
+        return TEMP_STORE_VALUES.get(str(value).lower(), value)
+    if name == 'journal_mode':
+        return str(value).lower()
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def active_pragmas(connection):
+    """
+    Lee los valores activos de los pragmas configurados
+
+    Returns:
+        dict: {pragma: valor} tal como los devuelve SQLite
+    """
+    connection.ensure_connection()
+    raw = connection.connection
+    active = {}
+    for name, _value in _ordered(getattr(settings, 'SQLITE_PRAGMAS', {})):
+        row = raw.execute(f'PRAGMA {name}').fetchone()
+        active[name] = row[0] if row else None
+    return active
+
+
+def pragma_mismatches(connection):
+    """
+    Pragmas cuyo valor activo no coincide con el configurado
+
+    Una base en memoria (tests) no admite WAL ni mmap; journal_mode y
+    mmap_size se omiten en ese caso.
+
+    Returns:
+        list: [(pragma, configurado, activo)]
+    """
+    active = active_pragmas(connection)
+    mismatches = []
+    for name, value in _ordered(getattr(settings, 'SQLITE_PRAGMAS', {})):
+        if name in IN_MEMORY_SKIPPED and connection.is_in_memory_db():
+            continue
+        expected = expected_value(name, value)
+        current = active.get(name)
+        if isinstance(current, str):
+            current = current.lower()
+        if current != expected:
+            mismatches.append((name, expected, current))
+    return mismatches
+
+
+def describe_pragmas(connection):
+    """Resumen legible de los pragmas activos (ej. 'journal_mode=wal, synchronous=normal')"""
+    names = {
+        'synchronous': {number: name for name, number in SYNCHRONOUS_VALUES.items()},
+        'temp_store': {number: name for name, number in TEMP_STORE_VALUES.items()},
+    }
+    return ', '.join(
+        f'{name}={names.get(name, {}).get(value, value)}'
+        for name, value in active_pragmas(connection).items()
+    )
@@ -0,0 +1,156 @@
+"""
+Almacenamiento de media direccionado por contenido
+
+Los campos de archivo declarados con storage=media_storage guardan cada
+archivo subido una sola vez, bajo una ruta derivada de su suma SHA-256:
+
+    blobs/3f/3fa9...c1.png
+
+Si otro registro (del mismo u otro modelo) sube el mismo logo o PDF, se
+reutiliza el archivo existente. Cada archivo único tiene un registro
+core.MediaBlob con la cantidad de campos que lo referencian (la mantienen
+las señales de core al guardar y eliminar registros); los que quedan sin
+referencias los elimina `manage.py collect_media_garbage`.
+
+Como el nombre cambia con el contenido, las URLs de los blobs nunca
+cambian de contenido y se sirven con Cache-Control immutable (ver
+core.middleware.PublicMediaMiddleware).
+
+Es opcional: con CONTENT_ADDRESSED_MEDIA=False (por defecto)
+media_storage() devuelve el storage por defecto y los archivos se guardan
+en su upload_to habitual.
+"""
+import hashlib
+import logging
+import os
+import re
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+BLOB_ROOT = 'blobs'
+BLOB_NAME_RE = re.compile(rf'^{BLOB_ROOT}/[0-9a-f]{{2}}/(?P<digest>[0-9a-f]{{64}})(\.[0-9a-z]+)?$')
+
+
+def blob_name(digest, extension=''):
+    """Ruta de un blob a partir de su suma SHA-256 (ej. 'blobs/3f/3fa9...c1.png')"""
+    return f'{BLOB_ROOT}/{digest[:2]}/{digest}{extension.lower()}'
+
+
+def blob_digest(name):
+    """Suma SHA-256 de un nombre de blob, o None si no es un blob"""
+    match = BLOB_NAME_RE.match(name or '')
+    return match.group('digest') if match else None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage que guarda los archivos subidos por su suma SHA-256
+
+    Los nombres que ya están bajo BLOB_ROOT (variantes y manifiestos de
+    core.images, que derivan del nombre del blob) se guardan tal cual.
+    """
+    content_addressed = True
+
+    def _save(self, name, content):
+        if name.startswith(f'{BLOB_ROOT}/'):
+            return super()._save(name, content)
+
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        content.seek(0)
+        digest = digest.hexdigest()
+        target = blob_name(digest, os.path.splitext(name)[1])
+
+        if self.exists(target):
+            logger.info(f"♻️ Archivo duplicado {os.path.basename(name)}, se reutiliza {target}")
+        else:
+            saved = super()._save(target, content)
+            if saved != target:
+                # Otra petición guardó el mismo contenido en paralelo: el contenido es idéntico
+                super().delete(saved)
+        register_blob(digest, target, size)
+        return target
+
+    def get_available_name(self, name, max_length=None):
+        # El nombre final lo decide _save según el contenido
+        if name.startswith(f'{BLOB_ROOT}/'):
+            return super().get_available_name(name, max_length)
+        return name
+
+    def delete(self, name):
+        """
+        Los blobs no se eliminan directamente: pueden estar referenciados
+        por otros registros. Los elimina collect_media_garbage cuando quedan
+        sin referencias.
+        """
+        if blob_digest(name):
+            return
+        super().delete(name)
+
+
+def register_blob(digest, name, size):
+    """
+    Crea el registro MediaBlob de un archivo subido (las referencias las
+    cuentan las señales). Si ya existía se actualiza updated_at para que
+    collect_media_garbage no lo elimine mientras se guarda el registro.
+    """
+    from .models import MediaBlob
+
+    _blob, created = MediaBlob.objects.get_or_create(digest=digest, defaults={'name': name, 'size': size})
+    if not created:
+        MediaBlob.objects.filter(digest=digest).update(updated_at=timezone.now())
+
+
+def update_references(added=(), removed=()):
+    """Suma o descuenta una referencia a cada blob de las listas de nombres"""
+    from .models import MediaBlob
+
+    for names, delta in ((added, 1), (removed, -1)):
+        for name in names:
+            digest = blob_digest(name)
+            if not digest:
+                continue
+            queryset = MediaBlob.objects.filter(digest=digest)
+            if delta < 0:
+                queryset = queryset.filter(ref_count__gt=0)
+            queryset.update(ref_count=F('ref_count') + delta, updated_at=timezone.now())
+
+
+_content_addressed_storage = None
+
+
+def media_storage():
+    """
+    Storage para los campos de archivo con deduplicación opcional
+
+    Se usa como callable (storage=media_storage) para que las migraciones no
+    dependan del valor de CONTENT_ADDRESSED_MEDIA.
+    """
+    global _content_addressed_storage
+    if not getattr(settings, 'CONTENT_ADDRESSED_MEDIA', False):
+        return default_storage
+    if _content_addressed_storage is None:
+        _content_addressed_storage = ContentAddressedStorage()
+    return _content_addressed_storage
+
+
+def is_content_addressed(field):
+    return getattr(field.storage, 'content_addressed', False)
+
+
+def content_addressed_fields(model):
+    """Campos de archivo del modelo que usan el almacenamiento por contenido"""
+    from django.db import models
+
+    return [
+        field for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField) and is_content_addressed(field)
+    ]
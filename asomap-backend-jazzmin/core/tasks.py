@@ -0,0 +1,52 @@
+"""
+Tareas en segundo plano de core (ver core.jobs)
+"""
+from django.apps import apps
+
+from . import documents
+from .cache import invalidate_for_model
+from .images import generate_for_instance
+from .jobs import task
+from .signals import _ensure_views_loaded
+
+
+@task('images.generate_variants')
+def generate_image_variants(model, pk, force=False):
+    """
+    Genera las variantes responsive de las imágenes de un objeto
+
+    Al terminar se invalidan los endpoints cacheados del modelo para que
+    las respuestas incluyan el srcset nuevo.
+
+    Returns:
+        int: Imágenes procesadas
+    """
+    model_class = apps.get_model(model)
+    instance = model_class._default_manager.filter(pk=pk).first()
+    if instance is None:
+        return 0
+
+    processed = generate_for_instance(instance, force=force, fail_silently=False)
+    if processed:
+        _ensure_views_loaded()
+        invalidate_for_model(model_class)
+    return processed
+
+
+@task('documents.generate_preview')
+def generate_pdf_preview(model, pk, force=False):
+    """
+    Genera la miniatura de la primera página y los metadatos de un PDF
+
+    Returns:
+        bool: True si se generó una vista previa
+    """
+    model_class = apps.get_model(model)
+    instance = model_class._default_manager.filter(pk=pk).first()
+    if instance is None or not (force or documents.needs_preview(instance)):
+        return False
+
+    generated = documents.generate_for_instance(instance)
+    _ensure_views_loaded()
+    invalidate_for_model(model_class)
+    return generated
@@ -0,0 +1,37 @@
+"""
+Utilidades compartidas por los tests de las apps
+"""
+import os
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+
+class MediaTestCase(TestCase):
+    """
+    TestCase que guarda los archivos subidos en un directorio temporal
+
+    Antes de cada test vacía el caché (las respuestas y variantes cacheadas
+    de un test no deben llegar al siguiente) y apunta MEDIA_ROOT a
+    self.media_root, dentro de self.tmp, que se elimina al terminar. Las
+    subclases agregan otros settings que dependen de self.tmp con
+    extra_settings().
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.media_root = os.path.join(self.tmp, 'media')
+        os.makedirs(self.media_root)
+
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, **self.extra_settings())
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def extra_settings(self):
+        """Settings adicionales del test (ej. directorios bajo self.tmp)"""
+        return {}
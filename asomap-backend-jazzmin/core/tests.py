@@ -0,0 +1,470 @@
+import os
+import shutil
+import smtplib
+import tempfile
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.admin.sites import site
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from . import email_backends
+from .cache_backends import SQLiteCache, verify_cache
+from .email_backends import ConfigurationEmailBackend, config_connection, get_backend_for_config
+from .email_utils import claim_due_emails, send_email_with_db_config, send_pending_email
+from .metrics import REGISTRY
+from .models import EmailConfiguration, EmailLog
+from .testing import MediaTestCase
+
+
+class MetricsTests(TestCase):
+    """
+    Verifica que MetricsMiddleware etiqueta las métricas con el nombre de la
+    ruta (no con el path) y que /metrics solo es accesible con el token o
+    para el staff del admin.
+    """
+
+    @staticmethod
+    def latency_count(route):
+        return REGISTRY.get_sample_value(
+            'asomap_http_request_duration_seconds_count', {'route': route, 'method': 'GET'}
+        ) or 0
+
+    def test_latency_labelled_by_route_template(self):
+        before = self.latency_count('news-detail')
+
+        for pk in (15, 16):
+            self.client.get(f'/api/news/{pk}/')
+
+        self.assertEqual(self.latency_count('news-detail'), before + 2)
+        # Sin una serie por cada id de la URL
+        routes = {
+            sample.labels.get('route')
+            for metric in REGISTRY.collect() if metric.name == 'asomap_http_request_duration_seconds'
+            for sample in metric.samples
+        }
+        self.assertFalse([route for route in routes if route and route.startswith('/')])
+
+    @override_settings(METRICS_TOKEN='secreto')
+    def test_metrics_access(self):
+        self.client.get('/api/news/')
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secreto')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(b'asomap_http_request_duration_seconds_bucket{', response.content)
+        self.assertIn(b'route="news-list"', response.content)
+
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer otro').status_code, 403)
+
+        user = User.objects.create_user('editor', 'editor@asomap.com', 'clave-segura')
+        self.client.force_login(user)
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+        user.is_staff = True
+        user.save()
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+
+class PublicMediaMiddlewareTests(MediaTestCase):
+    """
+    Verifica que PublicMediaMiddleware atiende peticiones Range (206/416)
+    y revalidaciones condicionales (304) sin leer el archivo completo.
+    """
+
+    URL = '/media/docs/archivo.txt'
+    CONTENT = b'0123456789abcdefghij'
+
+    def extra_settings(self):
+        return {'MEDIA_SENDFILE_BACKEND': ''}
+
+    def setUp(self):
+        super().setUp()
+        os.makedirs(os.path.join(self.media_root, 'docs'))
+        with open(os.path.join(self.media_root, 'docs', 'archivo.txt'), 'wb') as file:
+            file.write(self.CONTENT)
+
+    def get(self, **headers):
+        response = self.client.get(self.URL, **headers)
+        self.addCleanup(response.close)
+        return response
+
+    @staticmethod
+    def body(response):
+        return b''.join(response.streaming_content) if response.streaming else response.content
+
+    def test_full_response(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.CONTENT)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_byte_ranges(self):
+        cases = [
+            ('bytes=0-3', b'0123', 'bytes 0-3/20'),
+            ('bytes=10-', b'abcdefghij', 'bytes 10-19/20'),
+            ('bytes=-4', b'ghij', 'bytes 16-19/20'),
+            ('bytes=15-99', b'fghij', 'bytes 15-19/20'),
+        ]
+        for header, body, content_range in cases:
+            with self.subTest(range=header):
+                response = self.get(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(self.body(response), body)
+                self.assertEqual(response['Content-Range'], content_range)
+                self.assertEqual(response['Content-Length'], str(len(body)))
+
+    def test_unsatisfiable_range(self):
+        for header in ('bytes=20-', 'bytes=-0'):
+            with self.subTest(range=header):
+                response = self.get(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */20')
+
+    def test_unsupported_range_sends_full_file(self):
+        # Varios rangos, unidades distintas de bytes o un rango inválido (fin < inicio)
+        for header in ('bytes=0-1,4-5', 'items=0-3', 'bytes=5-2', 'bytes=25-2'):
+            with self.subTest(range=header):
+                response = self.get(HTTP_RANGE=header)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.body(response), self.CONTENT)
+
+    def test_if_range(self):
+        etag = self.get()['ETag']
+
+        response = self.get(HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+
+        # El archivo cambió: se ignora el rango y se envía completo
+        response = self.get(HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE='"otro"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.body(response), self.CONTENT)
+
+    def test_not_modified(self):
+        first = self.get()
+
+        response = self.get(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+        self.assertEqual(response.content, b'')
+
+        response = self.get(HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.get(HTTP_IF_NONE_MATCH='"otro"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_sendfile_backends(self):
+        with override_settings(MEDIA_SENDFILE_BACKEND='nginx', MEDIA_ACCEL_REDIRECT_PREFIX='/protected-media/'):
+            response = self.get()
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/docs/archivo.txt')
+        self.assertEqual(response.content, b'')
+
+        with override_settings(MEDIA_SENDFILE_BACKEND='sendfile'):
+            response = self.get()
+        self.assertEqual(response['X-Sendfile'], os.path.join(self.media_root, 'docs', 'archivo.txt'))
+
+    def test_path_traversal(self):
+        response = self.client.get('/media/../config/settings.py')
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get('/media/docs/no-existe.txt')
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(EMAIL_ASYNC_SENDING=True, EMAIL_OUTBOX_MAX_ATTEMPTS=3, EMAIL_OUTBOX_RETRY_DELAY=30)
+class EmailOutboxTests(TestCase):
+    """
+    Verifica la cola de salida de emails: el formulario solo registra el
+    EmailLog, el worker lo reserva una vez (lease) y los fallos se
+    reintentan con backoff hasta EMAIL_OUTBOX_MAX_ATTEMPTS.
+    """
+
+    def setUp(self):
+        EmailConfiguration.objects.create(
+            name='Pruebas', provider='custom', host='smtp.example.com', username='asomap@example.com',
+            password='clave', from_email='asomap@example.com', is_default=True
+        )
+
+    def queue(self, subject='Solicitud recibida'):
+        self.assertTrue(send_email_with_db_config(subject, 'Mensaje', ['cliente@example.com']))
+        return EmailLog.objects.get(subject=subject)
+
+    def test_queue_then_send(self):
+        email_log = self.queue()
+
+        self.assertEqual(email_log.status, 'pending')
+        self.assertEqual(email_log.attempts, 0)
+        self.assertEqual(mail.outbox, [])
+
+        claimed = claim_due_emails()
+        self.assertEqual([log.pk for log in claimed], [email_log.pk])
+        self.assertEqual(claimed[0].attempts, 1)
+        # Reservado: otro worker no lo vuelve a tomar mientras dure el lease
+        self.assertEqual(claim_due_emails(), [])
+
+        self.assertTrue(send_pending_email(claimed[0]))
+        email_log.refresh_from_db()
+        self.assertEqual(email_log.status, 'sent')
+        self.assertIsNone(email_log.next_attempt_at)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['cliente@example.com'])
+        self.assertEqual(claim_due_emails(), [])
+
+    def test_expired_lease_is_claimed_again(self):
+        email_log = self.queue()
+        claim_due_emails()
+
+        # El worker murió a mitad del envío: al vencer el lease vuelve a la cola
+        EmailLog.objects.filter(pk=email_log.pk).update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        claimed = claim_due_emails()
+        self.assertEqual([log.pk for log in claimed], [email_log.pk])
+        self.assertEqual(claimed[0].attempts, 2)
+
+    def test_failures_retry_with_backoff_then_fail(self):
+        email_log = self.queue()
+        error = ConnectionRefusedError('SMTP no disponible')
+
+        with mock.patch('core.email_utils.deliver_email_log', side_effect=error):
+            for attempt in (1, 2):
+                claimed = claim_due_emails()
+                self.assertEqual(len(claimed), 1)
+                before = timezone.now()
+                self.assertFalse(send_pending_email(claimed[0]))
+
+                email_log.refresh_from_db()
+                self.assertEqual(email_log.status, 'pending')
+                self.assertEqual(email_log.attempts, attempt)
+                self.assertEqual(email_log.error_message, 'SMTP no disponible')
+                # 30s, 60s... con ±20% de jitter
+                delay = (email_log.next_attempt_at - before).total_seconds()
+                self.assertGreaterEqual(delay, 30 * 2 ** (attempt - 1) * 0.8 - 1)
+                self.assertLessEqual(delay, 30 * 2 ** (attempt - 1) * 1.2 + 1)
+
+                self.assertEqual(claim_due_emails(), [])
+                EmailLog.objects.filter(pk=email_log.pk).update(next_attempt_at=timezone.now())
+
+            claimed = claim_due_emails()
+            self.assertFalse(send_pending_email(claimed[0]))
+
+        email_log.refresh_from_db()
+        self.assertEqual(email_log.status, 'failed')
+        self.assertEqual(email_log.attempts, 3)
+        self.assertIsNone(email_log.next_attempt_at)
+        self.assertEqual(claim_due_emails(), [])
+
+    def test_immediate_sending(self):
+        with override_settings(EMAIL_ASYNC_SENDING=False):
+            self.assertTrue(send_email_with_db_config('Inmediato', 'Mensaje', ['cliente@example.com']))
+
+        email_log = EmailLog.objects.get(subject='Inmediato')
+        self.assertEqual(email_log.status, 'sent')
+        self.assertEqual(email_log.attempts, 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend')
+class EmailConnectionReuseTests(TestCase):
+    """
+    Verifica que los envíos de una misma EmailConfiguration reutilizan una
+    sola conexión SMTP autenticada y que el backend se reconstruye al
+    editar la configuración.
+    """
+
+    def setUp(self):
+        self.config = EmailConfiguration.objects.create(
+            name='Pruebas', provider='custom', host='smtp.example.com', port=2525, username='asomap@example.com',
+            password='clave', from_email='asomap@example.com', is_default=True
+        )
+        # Backends cacheados por hilo: cada test empieza sin ninguno
+        patcher = mock.patch.object(email_backends, '_local', threading.local())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('smtplib.SMTP')
+        self.smtp = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.smtp.return_value.noop.return_value = (250, b'OK')
+        self.smtp.return_value.sendmail.return_value = {}
+
+    def failed_logs(self, total):
+        return [
+            EmailLog.objects.create(
+                subject=f'Solicitud {index}', to_email='cliente@example.com', message='Mensaje',
+                email_config=self.config, status='failed'
+            )
+            for index in range(total)
+        ]
+
+    def test_backend_cached_until_config_changes(self):
+        backend = get_backend_for_config(self.config)
+
+        self.assertIsInstance(backend, ConfigurationEmailBackend)
+        self.assertEqual((backend.host, backend.port, backend.username), ('smtp.example.com', 2525, 'asomap@example.com'))
+        self.assertIs(get_backend_for_config(EmailConfiguration.objects.get(pk=self.config.pk)), backend)
+
+        self.config.port = 587
+        self.config.save()
+        rebuilt = get_backend_for_config(self.config)
+        self.assertIsNot(rebuilt, backend)
+        self.assertEqual(rebuilt.port, 587)
+
+    def test_batch_uses_one_connection(self):
+        logs = self.failed_logs(3)
+
+        with config_connection(self.config) as connection:
+            for email_log in logs:
+                self.assertTrue(send_pending_email(email_log, connection=connection, retry=False))
+
+        self.smtp.assert_called_once()
+        self.assertEqual(self.smtp.call_args.args, ('smtp.example.com', 2525))
+        smtp = self.smtp.return_value
+        smtp.login.assert_called_once_with('asomap@example.com', 'clave')
+        self.assertEqual(smtp.sendmail.call_count, 3)
+        smtp.quit.assert_called_once()
+
+    def test_dropped_connection_reconnects(self):
+        backend = get_backend_for_config(self.config)
+        backend.ensure_open()
+        self.smtp.return_value.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        self.assertTrue(backend.ensure_open())
+        self.assertEqual(self.smtp.call_count, 2)
+
+    def test_admin_resend_uses_one_connection(self):
+        self.failed_logs(2)
+        model_admin = site._registry[EmailLog]
+
+        with mock.patch.object(model_admin, 'message_user') as message_user:
+            model_admin.resend_failed_emails(None, EmailLog.objects.all())
+
+        self.assertIn('2 emails reenviados', message_user.call_args.args[1])
+        self.smtp.assert_called_once()
+        self.assertEqual(self.smtp.return_value.sendmail.call_count, 2)
+        # Se reenvían los mismos registros, sin crear otros
+        self.assertEqual(EmailLog.objects.count(), 2)
+        self.assertEqual(
+            list(EmailLog.objects.order_by('pk').values_list('status', 'attempts')),
+            [('sent', 1), ('sent', 1)]
+        )
+
+@override_settings(EMAIL_ASYNC_SENDING=True)
+class EmailOutboxWorkerTests(TransactionTestCase):
+    """
+    Verifica que process_email_outbox envía la cola y termina con --once
+
+    TransactionTestCase porque los hilos del worker usan su propia conexión
+    a la BD y no verían los datos de la transacción de un TestCase.
+    """
+
+    def test_worker_command(self):
+        EmailConfiguration.objects.create(
+            name='Pruebas', provider='custom', host='smtp.example.com', username='asomap@example.com',
+            password='clave', from_email='asomap@example.com', is_default=True
+        )
+        for index in range(3):
+            send_email_with_db_config(f'Solicitud {index}', 'Mensaje', ['cliente@example.com'])
+
+        out = StringIO()
+        # Sin reemplazar los manejadores de SIGTERM/SIGINT del proceso de tests
+        with mock.patch('signal.signal'):
+            call_command('process_email_outbox', once=True, concurrency=1, stdout=out)
+
+        self.assertEqual(EmailLog.objects.filter(status='sent').count(), 3)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn('3 enviados', out.getvalue())
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    """
+    Verifica el backend core.cache_backends.SQLiteCache: expiración, add e
+    incr atómicos y que varias instancias (workers) comparten el archivo.
+    """
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.location = os.path.join(directory, 'cache', 'cache.sqlite3')
+        self.cache = self.create_cache()
+
+    def create_cache(self, **options):
+        return SQLiteCache(self.location, {'OPTIONS': options})
+
+    def test_set_get_delete(self):
+        self.cache.set('clave', {'valor': [1, 2]}, 60)
+
+        self.assertEqual(self.cache.get('clave'), {'valor': [1, 2]})
+        self.assertTrue(self.cache.has_key('clave'))
+        self.assertTrue(self.cache.delete('clave'))
+        self.assertFalse(self.cache.delete('clave'))
+        self.assertEqual(self.cache.get('clave', 'defecto'), 'defecto')
+
+    def test_expiration(self):
+        with mock.patch('time.time', return_value=1000.0):
+            self.cache.set('temporal', 1, 10)
+            self.cache.set('permanente', 1, None)
+        with mock.patch('time.time', return_value=1011.0):
+            self.assertIsNone(self.cache.get('temporal'))
+            self.assertEqual(self.cache.get('permanente'), 1)
+            # Una clave expirada se puede volver a agregar
+            self.assertTrue(self.cache.add('temporal', 2, 10))
+
+    def test_add_and_incr(self):
+        self.assertTrue(self.cache.add('contador', 1))
+        self.assertFalse(self.cache.add('contador', 5))
+        self.assertEqual(self.cache.incr('contador'), 2)
+        self.assertEqual(self.cache.incr('contador', 10), 12)
+        with self.assertRaises(ValueError):
+            self.cache.incr('no-existe')
+
+    def test_instances_share_the_file(self):
+        other = self.create_cache()
+        self.cache.set('version', 1, None)
+
+        other.incr('version')
+        self.assertEqual(self.cache.get('version'), 2)
+
+        other.clear()
+        self.assertIsNone(self.cache.get('version'))
+
+    def test_concurrent_incr_is_atomic(self):
+        self.cache.set('hits', 0, None)
+
+        def hit():
+            for _ in range(50):
+                self.cache.incr('hits')
+
+        threads = [threading.Thread(target=hit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.cache.get('hits'), 200)
+
+    def test_cull_keeps_max_entries(self):
+        cache = self.create_cache(MAX_ENTRIES=10, CULL_FREQUENCY=2)
+        for index in range(30):
+            cache.set(f'clave-{index}', index, 60 + index)
+
+        count = cache._connection().execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+        self.assertLessEqual(count, 11)
+        # Se eliminan primero las que expiran antes
+        self.assertEqual(cache.get('clave-29'), 29)
+
+    def test_verify_cache(self):
+        caches = {'default': {'BACKEND': 'core.cache_backends.SQLiteCache', 'LOCATION': self.location}}
+        with override_settings(CACHES=caches):
+            self.assertTrue(verify_cache())
+            with mock.patch.object(SQLiteCache, 'incr', side_effect=OSError('disco lleno')):
+                self.assertFalse(verify_cache())
@@ -1,7 +1,13 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
 from rest_framework import viewsets
 from rest_framework.response import Response
 from rest_framework import status
 
+from .metrics import render_metrics
+
 class BaseViewSet(viewsets.ModelViewSet):
     """
     Base viewset with common functionality.
@@ -12,4 +18,26 @@ class BaseViewSet(viewsets.ModelViewSet):
         if hasattr(instance, 'soft_delete'):
             instance.soft_delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
-        return super().destroy(request, *args, **kwargs)
\ No newline at end of file
+        return super().destroy(request, *args, **kwargs)
+
+
+def metrics_authorized(request):
+    """
+    Acceso a /metrics: token Bearer (METRICS_TOKEN) o usuario staff del admin
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        header = request.headers.get('Authorization', '')
+        if header.startswith('Bearer ') and constant_time_compare(header[7:], token):
+            return True
+    user = getattr(request, 'user', None)
+    return bool(user and user.is_authenticated and user.is_staff)
+
+
+@require_GET
+def metrics_view(request):
+    """Métricas de la API en formato de texto de Prometheus"""
+    if not metrics_authorized(request):
+        return HttpResponseForbidden('Forbidden')
+    content, content_type = render_metrics()
+    return HttpResponse(content, content_type=content_type)
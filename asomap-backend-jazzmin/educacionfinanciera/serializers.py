@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import SavingTip, SliderSlide, FAQItem
+from core.serializers import ResponsiveImageField
 
 
 class SavingTipSerializer(serializers.ModelSerializer):
@@ -20,12 +21,13 @@ class SavingTipSerializer(serializers.ModelSerializer):
 
 
 class SliderSlideSerializer(serializers.ModelSerializer):
+    image_responsive = ResponsiveImageField(source='image')
     image_url = serializers.SerializerMethodField()
     
     class Meta:
         model = SliderSlide
         fields = [
-            'id', 'image_url', 'title', 'description', 
+            'id', 'image_url', 'image_responsive', 'title', 'description', 
             'order', 'is_active', 'created_at', 'updated_at'
         ]
     
@@ -1,9 +1,18 @@
 # Configuración de Gunicorn para manejar archivos grandes
 import multiprocessing
+import os
+import shutil
+
+# Métricas Prometheus compartidas entre workers (ver core/metrics.py).
+# Debe definirse antes de cargar la app (preload_app) para que
+# prometheus_client use el modo multiproceso.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/asomap-prometheus')
 
 # Configuración básica
 bind = "0.0.0.0:8000"
-workers = multiprocessing.cpu_count() * 2 + 1
+# Se publica en el entorno antes de cargar la app para que settings sepa si
+# hay varios workers (API_RESPONSE_CACHE_ENABLED con CACHE_BACKEND=locmem)
+workers = int(os.environ.setdefault('WEB_CONCURRENCY', str(multiprocessing.cpu_count() * 2 + 1)))
 worker_class = "sync"
 
 # Timeouts para archivos grandes
@@ -36,3 +45,56 @@ limit_request_field_size = 8190
 # Configuración para archivos grandes
 max_requests_jitter = 50
 graceful_timeout = 300
+
+
+def post_fork(server, worker):
+    """Verifica el caché compartido y los pragmas de SQLite al iniciar cada worker"""
+    try:
+        from django.conf import settings
+        from django.db import connections
+        from core.cache_backends import verify_cache
+        from core.sqlite import describe_pragmas, pragma_mismatches
+    except ImportError:
+        return
+
+    connection = connections['default']
+    if connection.vendor == 'sqlite' and settings.SQLITE_PRAGMAS:
+        try:
+            server.log.info(f"Worker {worker.pid}: SQLite {describe_pragmas(connection)}")
+            for name, expected, current in pragma_mismatches(connection):
+                server.log.warning(
+                    f"Worker {worker.pid}: PRAGMA {name} es {current!r}, se configuró {expected!r}"
+                )
+        except Exception as e:
+            server.log.error(f"Worker {worker.pid}: no se pudieron leer los pragmas de SQLite: {e}")
+        finally:
+            connection.close()
+
+    backend = settings.CACHES['default']['BACKEND'].rsplit('.', 1)[-1]
+    if verify_cache():
+        server.log.info(f"Worker {worker.pid}: caché '{backend}' verificado")
+    else:
+        server.log.error(f"Worker {worker.pid}: el caché '{backend}' no responde")
+
+    if backend == 'LocMemCache' and server.cfg.workers > 1:
+        server.log.warning(
+            "LocMemCache no se comparte entre workers: los contadores de throttling "
+            "y rate limiting quedan duplicados y las respuestas de la API no se "
+            "cachean. Configure CACHE_BACKEND=redis o sqlite."
+        )
+
+
+def on_starting(server):
+    """Limpia las métricas de ejecuciones anteriores del master"""
+    path = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Descarta las métricas en vivo del worker que terminó"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
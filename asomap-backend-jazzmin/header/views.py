@@ -2,10 +2,40 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from core.cache import cached_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from .models import Navigation, ExchangeRate
 from .serializers import NavigationSerializer, ExchangeRateSerializer, HeaderCompleteSerializer
 
+
+def build_header_data():
+    """
+    Estructura completa del header (navegación y tasas de cambio)
+    
+    Compartida por header-data y por la página de inicio compuesta.
+    """
+    # Obtener navegación
+    navigation_items = Navigation.objects.filter(is_active=True)
+    navigation_data = {}
+    for item in navigation_items:
+        navigation_data[item.navigation_type] = item.get_navigation_type_display()
+    
+    # Obtener tasas de cambio
+    exchange_rate = ExchangeRate.objects.filter(is_active=True).first()
+    exchange_data = {
+        'base': 'Tasa de Cambio',
+        'lastUpdated': exchange_rate.last_updated_iso if exchange_rate else None,
+        'showBuyRate': exchange_rate.show_buy_rate if exchange_rate else True,
+        'showSellRate': exchange_rate.show_sell_rate if exchange_rate else False,
+        'rates': exchange_rate.rates_for_frontend if exchange_rate else []
+    }
+    
+    return {
+        'navigation': navigation_data,
+        'exchange': exchange_data
+    }
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="Listar navegación",
@@ -103,6 +133,7 @@ class HeaderViewSet(viewsets.ModelViewSet):
         tags=['header']
     )
     @action(detail=False, methods=['get'], url_path='navigation')
+    @cached_response('header:navigation', models=['header.Navigation'])
     def navigation(self, request):
         """
         Obtener datos de navegación
@@ -120,6 +151,7 @@ class HeaderViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='exchange')
+    @cached_response('header:exchange', models=['header.ExchangeRate'])
     def exchange(self, request):
         """
         Obtener tasas de cambio
@@ -148,6 +180,7 @@ class HeaderViewSet(viewsets.ModelViewSet):
         tags=['header']
     )
     @action(detail=False, methods=['get'], url_path='header-data')
+    @cached_response('header:header-data', models=['header.Navigation', 'header.ExchangeRate'])
     def header_data(self, request):
         """
         Obtener datos completos del header
@@ -155,26 +188,7 @@ class HeaderViewSet(viewsets.ModelViewSet):
         Retorna la estructura completa del header que coincide con la estructura del frontend
         """
         try:
-            # Obtener navegación
-            navigation_items = Navigation.objects.filter(is_active=True)
-            navigation_data = {}
-            for item in navigation_items:
-                navigation_data[item.navigation_type] = item.get_navigation_type_display()
-            
-            # Obtener tasas de cambio
-            exchange_rate = ExchangeRate.objects.filter(is_active=True).first()
-            exchange_data = {
-                'base': 'Tasa de Cambio',
-                'lastUpdated': exchange_rate.last_updated_iso if exchange_rate else None,
-                'showBuyRate': exchange_rate.show_buy_rate if exchange_rate else True,
-                'showSellRate': exchange_rate.show_sell_rate if exchange_rate else False,
-                'rates': exchange_rate.rates_for_frontend if exchange_rate else []
-            }
-            
-            response_data = {
-                'navigation': navigation_data,
-                'exchange': exchange_data
-            }
+            response_data = build_header_data()
             
             return Response(response_data)
             
@@ -1,3 +1,197 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from header.models import ExchangeRate, Navigation
+from layout.models import Footer
+from .models import (
+    DebitCardPromo, EducationItem, EducationSection, PeKeAccountSummary,
+    Product, ProductSection, SliderItem
+)
+
+
+class ResponseCacheTests(TestCase):
+    """
+    Verifica que los endpoints con @cached_response responden desde el caché
+    sin consultar la BD y que las señales de core lo invalidan al guardar,
+    eliminar o cambiar una relación ManyToMany.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.promo = DebitCardPromo.objects.create(
+            title='Tarjeta de Débito', highlighted_title='Sin costo', description='Descripción',
+            primary_button_text='Solicitar', secondary_button_text='Ver más', image_alt='Tarjeta'
+        )
+
+    def test_cache_hit_skips_database(self):
+        first = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(first.status_code, 200)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(cached.json(), first.json())
+
+        # Cada query string tiene su propia entrada
+        with self.assertNumQueries(1):
+            self.client.get('/api/home/debit-card-promo/', {'lang': 'es'})
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        # Caché por proceso con varios workers: cada petición consulta la BD
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                response = self.client.get('/api/home/debit-card-promo/')
+            self.assertEqual(response.json()['title'], 'Tarjeta de Débito')
+
+    def test_save_and_delete_invalidate(self):
+        self.client.get('/api/home/debit-card-promo/')
+
+        self.promo.title = 'Tarjeta de Débito ASOMAP'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.promo.save()
+        response = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(response.json()['title'], 'Tarjeta de Débito ASOMAP')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.promo.delete()
+        response = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(response.status_code, 404)
+
+        # Los 404 no se cachean
+        DebitCardPromo.objects.bulk_create([DebitCardPromo(
+            title='Nueva', highlighted_title='Promo', description='Descripción',
+            primary_button_text='Solicitar', secondary_button_text='Ver más', image_alt='Tarjeta'
+        )])
+        response = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Nueva')
+
+    def test_invalidates_after_commit(self):
+        self.client.get('/api/home/debit-card-promo/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.promo.title = 'Tarjeta de Débito ASOMAP'
+            self.promo.save()
+            # Antes de confirmar no se invalida: una petición concurrente que
+            # leyera las filas anteriores no debe cachearlas con la versión nueva
+            response = self.client.get('/api/home/debit-card-promo/')
+            self.assertEqual(response.json()['title'], 'Tarjeta de Débito')
+
+        response = self.client.get('/api/home/debit-card-promo/')
+        self.assertEqual(response.json()['title'], 'Tarjeta de Débito ASOMAP')
+
+    def test_m2m_change_invalidates(self):
+        section = EducationSection.objects.create(
+            title='Educación', subtitle='Aprende', footer_text='Más información'
+        )
+        item = EducationItem.objects.create(
+            image='education/ahorro.png', alt='Ahorro', description='Cómo ahorrar'
+        )
+        response = self.client.get('/api/home/education-section/')
+        self.assertEqual(response.json()['data']['educationItems'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            section.education_items.add(item)
+
+        response = self.client.get('/api/home/education-section/')
+        items = response.json()['data']['educationItems']
+        self.assertEqual([entry['alt'] for entry in items], ['Ahorro'])
+
+
+class HomePageTests(TestCase):
+    """
+    Verifica la estructura de /api/home/page/, que compone todas las
+    secciones de la página de inicio en una sola respuesta cacheada.
+    """
+
+    URL = '/api/home/page/'
+    SECTIONS = [
+        'debitCardPromo', 'educationSection', 'pekeAccountSummary',
+        'productSection', 'slider', 'header', 'footer'
+    ]
+
+    def setUp(self):
+        cache.clear()
+
+    def create_sections(self):
+        DebitCardPromo.objects.create(
+            title='Tarjeta de Débito', highlighted_title='Sin costo', description='Descripción',
+            primary_button_text='Solicitar', secondary_button_text='Ver más', image_alt='Tarjeta'
+        )
+        education = EducationSection.objects.create(
+            title='Educación', subtitle='Aprende', footer_text='Más información'
+        )
+        education.education_items.add(
+            EducationItem.objects.create(image='education/ahorro.png', alt='Ahorro', description='Ahorra'),
+            EducationItem.objects.create(
+                image='education/oculto.png', alt='Oculto', description='Inactivo', is_active=False
+            ),
+        )
+        PeKeAccountSummary.objects.create(
+            title='Cuenta PeKe', description='Para niños', button_text='Abrir', image_alt='PeKe'
+        )
+        products = ProductSection.objects.create(
+            title='Productos', subtitle='Para ti', button_text='Ver todos'
+        )
+        products.products.add(Product.objects.create(
+            title='Préstamo', description='Personal', image='products/prestamo.png', category='loans'
+        ))
+        for order in (2, 1):
+            SliderItem.objects.create(
+                image_desktop=f'slider/{order}.png', image_tablet=f'slider/{order}-t.png',
+                image_mobile=f'slider/{order}-m.png', alt=f'Slide {order}', order=order
+            )
+        Navigation.objects.create(navigation_type='individual')
+        ExchangeRate.objects.create(currency_name='USD', buy_rate='58.50', sell_rate='59.25')
+        Footer.objects.create()
+
+    def test_page_shape(self):
+        self.create_sections()
+
+        with self.assertNumQueries(10):
+            response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(list(data), self.SECTIONS)
+        self.assertEqual(data['debitCardPromo']['title'], 'Tarjeta de Débito')
+        self.assertEqual(data['educationSection']['title'], 'Educación')
+        self.assertEqual([item['alt'] for item in data['educationSection']['educationItems']], ['Ahorro'])
+        self.assertEqual(data['pekeAccountSummary']['button_text'], 'Abrir')
+        self.assertEqual(data['productSection']['section'], {'title': 'Productos', 'subtitle': 'Para ti'})
+        self.assertEqual([product['title'] for product in data['productSection']['products']], ['Préstamo'])
+        self.assertEqual([slide['alt'] for slide in data['slider']], ['Slide 1', 'Slide 2'])
+        self.assertEqual(set(data['slider'][0]), {'id', 'image', 'imageTablet', 'imageMobile', 'alt'})
+        self.assertEqual(data['header']['navigation'], {'individual': 'Individual'})
+        self.assertEqual(set(data['header']['exchange']), {'base', 'lastUpdated', 'showBuyRate', 'showSellRate', 'rates'})
+        self.assertIsNotNone(data['footer'])
+
+        # La página completa coincide con los endpoints de cada sección
+        self.assertEqual(data['header'], self.client.get('/api/header/header-data/').json())
+        self.assertEqual(data['slider'], self.client.get('/api/home/slider/').json())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.URL).json(), data)
+
+    def test_empty_sections_are_null(self):
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        for section in ('debitCardPromo', 'educationSection', 'pekeAccountSummary', 'productSection', 'footer'):
+            self.assertIsNone(data[section], section)
+        self.assertEqual(data['slider'], [])
+
+    def test_any_section_invalidates_page(self):
+        self.create_sections()
+        self.client.get(self.URL)
+
+        # update() no emite señales: la página sigue saliendo del caché
+        ExchangeRate.objects.update(is_active=False)
+        self.assertNotEqual(self.client.get(self.URL).json()['header']['exchange']['rates'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Navigation.objects.create(navigation_type='empresarial')
+        data = self.client.get(self.URL).json()
+        self.assertEqual(data['header']['navigation'], {'individual': 'Individual', 'empresarial': 'Empresarial'})
+        self.assertEqual(data['header']['exchange']['rates'], [])
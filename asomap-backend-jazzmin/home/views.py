@@ -1,7 +1,13 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db.models import Prefetch
+from core.cache import cached_response
+from core.query_budget import query_budget
 from drf_spectacular.utils import extend_schema
+from header.views import build_header_data
+from layout.models import Footer
+from layout.serializers import FooterSerializer
 from .models import DebitCardPromo, EducationItem, EducationSection, PeKeAccountSummary, Product, ProductSection, SliderItem
 from .serializers import (
     DebitCardPromoSerializer, 
@@ -16,6 +22,80 @@ from .serializers import (
 )
 
 
+def active_education_sections():
+    """Secciones de educación activas con sus elementos activos ya ordenados"""
+    return EducationSection.objects.filter(is_active=True).prefetch_related(
+        Prefetch(
+            'education_items',
+            queryset=EducationItem.objects.filter(is_active=True).order_by('order')
+        )
+    )
+
+
+def active_product_sections():
+    """Secciones de productos activas con sus productos activos ya ordenados"""
+    return ProductSection.objects.filter(is_active=True).prefetch_related(
+        Prefetch(
+            'products',
+            queryset=Product.objects.filter(is_active=True).order_by('order')
+        )
+    )
+
+
+def build_education_section_data(section):
+    """Estructura de la sección de educación esperada por el frontend"""
+    return {
+        'title': section.title,
+        'subtitle': section.subtitle,
+        'educationItems': [
+            {
+                'image': item.image_url,
+                'alt': item.alt,
+                'description': item.description
+            }
+            for item in section.education_items.all()
+        ],
+        'footerText': section.footer_text
+    }
+
+
+def build_product_section_data(section):
+    """Estructura de la sección de productos esperada por el frontend"""
+    return {
+        'section': {
+            'title': section.title,
+            'subtitle': section.subtitle
+        },
+        'buttonText': section.button_text,
+        'products': [
+            {
+                'id': str(product.id),
+                'title': product.title,
+                'description': product.description,
+                'image': product.image_url,
+                'category': product.category,
+                'imageWidth': product.image_width,
+                'imageHeight': product.image_height
+            }
+            for product in section.products.all()
+        ]
+    }
+
+
+def build_slider_data(slider_items):
+    """Lista de slides esperada por el frontend"""
+    return [
+        {
+            'id': item.id,
+            'image': item.image_desktop_url,
+            'imageTablet': item.image_tablet_url,
+            'imageMobile': item.image_mobile_url,
+            'alt': item.alt
+        }
+        for item in slider_items
+    ]
+
+
 class HomeViewSet(viewsets.ModelViewSet):
     """
     ViewSet para la página de inicio
@@ -30,6 +110,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         tags=['home']
     )
     @action(detail=False, methods=['get'], url_path='debit-card-promo')
+    @cached_response('home:debit-card-promo', models=['home.DebitCardPromo'])
     def debit_card_promo(self, request):
         """
         Obtener promoción de tarjeta de débito
@@ -73,6 +154,10 @@ class HomeViewSet(viewsets.ModelViewSet):
         tags=['home']
     )
     @action(detail=False, methods=['get'], url_path='education-section')
+    @cached_response('home:education-section', models=[
+        'home.EducationSection',
+        'home.EducationItem',
+    ])
     def education_section(self, request):
         """
         Obtener sección de educación
@@ -81,9 +166,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         que coincide con la estructura esperada por el frontend
         """
         try:
-            section = EducationSection.objects.filter(is_active=True).prefetch_related(
-                'education_items'
-            ).first()
+            section = active_education_sections().first()
             
             if not section:
                 return Response(
@@ -98,22 +181,8 @@ class HomeViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            # Preparar la respuesta que coincide con la estructura del frontend
-            education_items = []
-            for item in section.education_items.filter(is_active=True).order_by('order'):
-                education_items.append({
-                    'image': item.image_url,
-                    'alt': item.alt,
-                    'description': item.description
-                })
-            
             response_data = {
-                'data': {
-                    'title': section.title,
-                    'subtitle': section.subtitle,
-                    'educationItems': education_items,
-                    'footerText': section.footer_text
-                }
+                'data': build_education_section_data(section)
             }
             
             return Response(response_data)
@@ -139,6 +208,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         tags=['home']
     )
     @action(detail=False, methods=['get'], url_path='peke-account-summary')
+    @cached_response('home:peke-account-summary', models=['home.PeKeAccountSummary'])
     def peke_account_summary(self, request):
         """
         Obtener resumen de cuenta PeKe
@@ -182,6 +252,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         tags=['home']
     )
     @action(detail=False, methods=['get'], url_path='product-section')
+    @cached_response('home:product-section', models=['home.ProductSection', 'home.Product'])
     def product_section(self, request):
         """
         Obtener sección de productos
@@ -190,9 +261,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         que coincide con la estructura esperada por el frontend
         """
         try:
-            section = ProductSection.objects.filter(is_active=True).prefetch_related(
-                'products'
-            ).first()
+            section = active_product_sections().first()
             
             if not section:
                 return Response(
@@ -207,28 +276,8 @@ class HomeViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            # Preparar la respuesta que coincide con la estructura del frontend
-            products = []
-            for product in section.products.filter(is_active=True).order_by('order'):
-                products.append({
-                    'id': str(product.id),
-                    'title': product.title,
-                    'description': product.description,
-                    'image': product.image_url,
-                    'category': product.category,
-                    'imageWidth': product.image_width,
-                    'imageHeight': product.image_height
-                })
-            
             response_data = {
-                'data': {
-                    'section': {
-                        'title': section.title,
-                        'subtitle': section.subtitle
-                    },
-                    'buttonText': section.button_text,
-                    'products': products
-                }
+                'data': build_product_section_data(section)
             }
             
             return Response(response_data)
@@ -254,6 +303,7 @@ class HomeViewSet(viewsets.ModelViewSet):
         tags=['home']
     )
     @action(detail=False, methods=['get'], url_path='slider')
+    @cached_response('home:slider', models=['home.SliderItem'])
     def slider(self, request):
         """
         Obtener elementos del slider
@@ -276,18 +326,7 @@ class HomeViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_404_NOT_FOUND
                 )
             
-            # Preparar la respuesta que coincide con la estructura del frontend
-            slides = []
-            for item in slider_items:
-                slides.append({
-                    'id': item.id,
-                    'image': item.image_desktop_url,
-                    'imageTablet': item.image_tablet_url,
-                    'imageMobile': item.image_mobile_url,
-                    'alt': item.alt
-                })
-            
-            return Response(slides)
+            return Response(build_slider_data(slider_items))
             
         except Exception as e:
             return Response(
@@ -301,3 +340,70 @@ class HomeViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
+
+    @extend_schema(
+        summary="Obtener la página de inicio completa",
+        description=(
+            "Retorna en una sola respuesta todas las secciones de la página de inicio: "
+            "promoción de tarjeta de débito, sección de educación, resumen de cuenta PeKe, "
+            "sección de productos, slider, header y footer. Las secciones sin datos activos "
+            "se retornan como null."
+        ),
+        responses={200: None},
+        tags=['home']
+    )
+    @action(detail=False, methods=['get'], url_path='page')
+    @query_budget(10)
+    @cached_response('home:page', models=[
+        'home.DebitCardPromo',
+        'home.EducationSection',
+        'home.EducationItem',
+        'home.PeKeAccountSummary',
+        'home.ProductSection',
+        'home.Product',
+        'home.SliderItem',
+        'header.Navigation',
+        'header.ExchangeRate',
+        'layout.Footer',
+    ])
+    def page(self, request):
+        """
+        Obtener la página de inicio completa
+        
+        Compone las respuestas de debit-card-promo, education-section,
+        peke-account-summary, product-section, slider, header-data y footer
+        para que el primer pintado del frontend necesite una sola petición.
+        Cada sección se obtiene con una consulta (más el prefetch de sus
+        elementos) y la respuesta completa comparte una clave de caché que se
+        invalida al modificar cualquiera de los modelos que la componen.
+        """
+        try:
+            promo = DebitCardPromo.objects.filter(is_active=True).first()
+            education = active_education_sections().first()
+            summary = PeKeAccountSummary.objects.filter(is_active=True).first()
+            products = active_product_sections().first()
+            slider_items = SliderItem.objects.filter(is_active=True).order_by('order')
+            footer = Footer.objects.filter(is_active=True).first()
+            
+            response_data = {
+                'debitCardPromo': DebitCardPromoSerializer(promo).data if promo else None,
+                'educationSection': build_education_section_data(education) if education else None,
+                'pekeAccountSummary': PeKeAccountSummarySerializer(summary).data if summary else None,
+                'productSection': build_product_section_data(products) if products else None,
+                'slider': build_slider_data(slider_items),
+                'header': build_header_data(),
+                'footer': FooterSerializer(footer).data if footer else None
+            }
+            
+            return Response(response_data)
+            
+        except Exception as e:
+            return Response(
+                {
+                    'error': 'Home page not found',
+                    'debug_info': {
+                        'exception': str(e)
+                    }
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
@@ -2,6 +2,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from core.cache import cached_response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from .models import Footer, SocialNetwork, Contact
 from .serializers import FooterSerializer, SocialNetworkSerializer, ContactSerializer
@@ -103,6 +104,7 @@ class LayoutViewSet(viewsets.ModelViewSet):
         tags=['layout']
     )
     @action(detail=False, methods=['get'], url_path='footer')
+    @cached_response('layout:footer', models=['layout.Footer'])
     def footer(self, request):
         """
         Obtener información del footer
@@ -0,0 +1,147 @@
+"""
+Índice espacial en memoria para buscar ubicaciones cercanas
+
+Las ubicaciones activas se agrupan en una cuadrícula de celdas de
+GRID_CELL_DEGREES grados (similar a un geohash de precisión fija). Una
+consulta solo revisa las celdas que cubren el rectángulo del radio pedido y
+calcula la distancia haversine contra esos candidatos.
+
+El índice vive en cada proceso. Al guardar o eliminar una Location se
+incrementa una versión en el caché compartido (ver locations.signals) y
+cada worker reconstruye su índice en la siguiente consulta.
+"""
+import logging
+import math
+import threading
+from collections import defaultdict
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+# ~11 km por celda en latitud: suficiente para el tamaño del país
+GRID_CELL_DEGREES = 0.1
+INDEX_VERSION_KEY = 'locations:spatial-index:version'
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Distancia en kilómetros entre dos puntos (grados decimales)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat, lng, radius_km):
+    """Rectángulo (min_lat, max_lat, min_lng, max_lng) que contiene el círculo"""
+    dlat = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(lat))
+    dlng = 180.0 if cos_lat < 1e-6 else min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+    return (
+        max(lat - dlat, -90.0), min(lat + dlat, 90.0),
+        lng - dlng, lng + dlng,
+    )
+
+
+def _cell(lat, lng):
+    return (math.floor(lat / GRID_CELL_DEGREES), math.floor(lng / GRID_CELL_DEGREES))
+
+
+class SpatialGrid:
+    """Cuadrícula inmutable de puntos (pk, tipo, lat, lng)"""
+
+    def __init__(self, points):
+        self.cells = defaultdict(list)
+        for pk, location_type, lat, lng in points:
+            self.cells[_cell(lat, lng)].append((pk, location_type, lat, lng))
+        self.size = sum(len(cell) for cell in self.cells.values())
+
+    def nearby(self, lat, lng, radius_km, location_type=None, limit=None):
+        """
+        Busca los puntos dentro del radio ordenados por distancia
+
+        Returns:
+            list: Tuplas (distancia_km, pk)
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        min_row, min_col = _cell(min_lat, min_lng)
+        max_row, max_col = _cell(max_lat, max_lng)
+
+        # Si el rectángulo cubre más celdas que las ocupadas, recorrer las ocupadas
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self.cells):
+            candidates = (point for cell in self.cells.values() for point in cell)
+        else:
+            candidates = (
+                point
+                for row in range(min_row, max_row + 1)
+                for col in range(min_col, max_col + 1)
+                for point in self.cells.get((row, col), ())
+            )
+
+        results = []
+        for pk, point_type, point_lat, point_lng in candidates:
+            if location_type and point_type != location_type:
+                continue
+            distance = haversine_km(lat, lng, point_lat, point_lng)
+            if distance <= radius_km:
+                results.append((distance, pk))
+
+        results.sort()
+        return results[:limit] if limit else results
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def _current_version():
+    version = cache.get(INDEX_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(INDEX_VERSION_KEY, version, None)
+    return version
+
+
+def build_index():
+    """Construye la cuadrícula con las ubicaciones activas con coordenadas"""
+    from .models import Location
+
+    points = Location.objects.filter(
+        is_active=True,
+        latitude__isnull=False,
+        longitude__isnull=False,
+    ).values_list('pk', 'type', 'latitude', 'longitude')
+    grid = SpatialGrid(points)
+    logger.debug(f"🗺️ Índice espacial reconstruido con {grid.size} ubicaciones")
+    return grid
+
+
+def get_index():
+    """Retorna el índice del proceso, reconstruyéndolo si cambió la versión"""
+    global _index, _index_version
+
+    version = _current_version()
+    index = _index
+    if index is not None and _index_version == version:
+        return index
+
+    with _index_lock:
+        index = _index
+        if index is None or _index_version != version:
+            index = _index = build_index()
+            _index_version = version
+        return index
+
+
+def invalidate_index():
+    """Marca el índice como desactualizado en todos los procesos"""
+    global _index
+    _index = None
+    try:
+        cache.incr(INDEX_VERSION_KEY)
+    except ValueError:
+        cache.set(INDEX_VERSION_KEY, 2, None)
@@ -0,0 +1,99 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:40
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def parse_coordinate(value, limit):
+    """Convierte el texto guardado a float; None si no es válido"""
+    try:
+        number = float(str(value).strip().replace(',', '.'))
+    except (TypeError, ValueError):
+        return None
+    if not -limit <= number <= limit:
+        return None
+    return number
+
+
+def copy_coordinates(apps, schema_editor):
+    """Copia las coordenadas de texto a las nuevas columnas numéricas"""
+    Location = apps.get_model('locations', 'Location')
+    for location in Location.objects.only('pk', 'latitude', 'longitude'):
+        Location.objects.filter(pk=location.pk).update(
+            latitude_value=parse_coordinate(location.latitude, 90),
+            longitude_value=parse_coordinate(location.longitude, 180),
+        )
+
+
+def copy_coordinates_back(apps, schema_editor):
+    """Restaura las coordenadas como texto"""
+    Location = apps.get_model('locations', 'Location')
+    for location in Location.objects.only('pk', 'latitude_value', 'longitude_value'):
+        Location.objects.filter(pk=location.pk).update(
+            latitude='' if location.latitude_value is None else str(location.latitude_value),
+            longitude='' if location.longitude_value is None else str(location.longitude_value),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0006_service_remove_location_services_location_services'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='latitude_value',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='longitude_value',
+            field=models.FloatField(null=True),
+        ),
+        # Columnas de texto anulables para que la migración sea reversible
+        migrations.AlterField(
+            model_name='location',
+            name='latitude',
+            field=models.TextField(help_text='Latitud de la ubicación', null=True, verbose_name='Latitud'),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='longitude',
+            field=models.TextField(help_text='Longitud de la ubicación', null=True, verbose_name='Longitud'),
+        ),
+        migrations.RunPython(copy_coordinates, copy_coordinates_back),
+        migrations.RemoveField(
+            model_name='location',
+            name='latitude',
+        ),
+        migrations.RemoveField(
+            model_name='location',
+            name='longitude',
+        ),
+        migrations.RenameField(
+            model_name='location',
+            old_name='latitude_value',
+            new_name='latitude',
+        ),
+        migrations.RenameField(
+            model_name='location',
+            old_name='longitude_value',
+            new_name='longitude',
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='latitude',
+            field=models.FloatField(help_text='Latitud de la ubicación en grados decimales (ej: 18.4861)', null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='Latitud'),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='longitude',
+            field=models.FloatField(help_text='Longitud de la ubicación en grados decimales (ej: -69.9312)', null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='Longitud'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['latitude', 'longitude'], name='location_lat_lng_idx'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 
@@ -206,13 +207,17 @@ class Location(models.Model):
     )
     
     # Coordenadas geográficas
-    latitude = models.TextField(
+    latitude = models.FloatField(
+        null=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
         verbose_name="Latitud",
-        help_text="Latitud de la ubicación"
+        help_text="Latitud de la ubicación en grados decimales (ej: 18.4861)"
     )
-    longitude = models.TextField(
+    longitude = models.FloatField(
+        null=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
         verbose_name="Longitud",
-        help_text="Longitud de la ubicación"
+        help_text="Longitud de la ubicación en grados decimales (ej: -69.9312)"
     )
     
     # Horarios - Ahora usando modelo Schedule
@@ -259,6 +264,10 @@ class Location(models.Model):
         verbose_name = "Ubicación"
         verbose_name_plural = "Ubicaciones"
         ordering = ['type', 'name']
+        indexes = [
+            # Consultas por rectángulo (bounding box) de coordenadas
+            models.Index(fields=['latitude', 'longitude'], name='location_lat_lng_idx'),
+        ]
 
     def __str__(self):
         return f"{self.get_type_display()} - {self.name}"
@@ -268,16 +277,10 @@ class Location(models.Model):
         """
         Retorna las coordenadas en formato para el frontend
         """
-        try:
-            return {
-                'lat': float(self.latitude),
-                'lng': float(self.longitude)
-            }
-        except (ValueError, TypeError):
-            return {
-                'lat': 0.0,
-                'lng': 0.0
-            }
+        return {
+            'lat': self.latitude if self.latitude is not None else 0.0,
+            'lng': self.longitude if self.longitude is not None else 0.0
+        }
 
     @property
     def hours(self):
@@ -302,4 +305,5 @@ class Location(models.Model):
         """
         Retorna la lista de servicios en formato para el frontend
         """
-        return [service.name for service in self.services.filter(is_active=True)]
+        # all() aprovecha prefetch_related('services') cuando la vista lo usa
+        return [service.name for service in self.services.all() if service.is_active]
@@ -22,3 +22,11 @@ class LocationSerializer(serializers.ModelSerializer):
 
     def get_services(self, obj):
         return obj.services_list
+
+
+class NearbyLocationSerializer(LocationSerializer):
+    """Ubicación con la distancia (km) al punto consultado"""
+    distance = serializers.FloatField(read_only=True)
+
+    class Meta(LocationSerializer.Meta):
+        fields = LocationSerializer.Meta.fields + ['distance']
@@ -0,0 +1,18 @@
+"""
+Señales de locations
+
+Mantienen actualizado el índice espacial de ubicaciones (ver locations.geo).
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .geo import invalidate_index
+from .models import Location
+
+
+@receiver(post_save, sender=Location, dispatch_uid='locations_spatial_index_post_save')
+@receiver(post_delete, sender=Location, dispatch_uid='locations_spatial_index_post_delete')
+def refresh_spatial_index(sender, using=None, **kwargs):
+    """Invalida el índice espacial cuando se confirma el cambio de una ubicación"""
+    transaction.on_commit(invalidate_index, using=using)
@@ -1,3 +1,95 @@
-from django.test import TestCase
+from datetime import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.query_budget import QueryBudgetExceeded
+from .models import Location, Schedule, Service
+
+
+class LocationQueryBudgetTests(TestCase):
+    """
+    Verifica que los listados de ubicaciones cargan horario y servicios sin
+    una consulta por fila (QueryBudgetMiddleware hace fallar la petición si
+    se supera el presupuesto declarado con @query_budget).
+    """
+
+    def setUp(self):
+        cache.clear()
+        schedule = Schedule.objects.create(
+            name='Horario regular', opening_time=time(8, 0), closing_time=time(17, 0)
+        )
+        services = [Service.objects.create(name=f'Servicio {index}') for index in range(3)]
+        for index in range(8):
+            location = Location.objects.create(
+                type='branch' if index % 2 else 'atm',
+                name=f'Ubicación {index}',
+                address='Santo Domingo',
+                phone='809-000-0000',
+                schedule=schedule
+            )
+            location.services.set(services)
+
+    @staticmethod
+    def results(response):
+        data = response.json()
+        return data['results'] if isinstance(data, dict) else data
+
+    def test_lists_stay_within_budget(self):
+        for url in ('/api/locations/', '/api/locations/branches/', '/api/locations/atms/'):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(self.results(response)[0]['services']), 3)
+
+    @override_settings(QUERY_BUDGETS={'location-list': 1})
+    def test_exceeded_budget_fails(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get('/api/locations/')
+
+
+class NearbyLocationTests(TestCase):
+    """
+    Verifica que /nearby/ retorna las ubicaciones dentro del radio ordenadas
+    por distancia y rechaza parámetros inválidos con 400.
+    """
+
+    URL = '/api/locations/nearby/'
+
+    def setUp(self):
+        cache.clear()
+        points = [
+            ('branch', 'Sucursal Centro', 18.4861, -69.9312),
+            ('atm', 'Cajero Piantini', 18.4700, -69.9400),
+            ('branch', 'Sucursal Santiago', 19.4517, -70.6970),
+        ]
+        for location_type, name, lat, lng in points:
+            Location.objects.create(
+                type=location_type, name=name, address='República Dominicana',
+                phone='809-000-0000', latitude=lat, longitude=lng
+            )
+
+    def test_nearby_sorted_by_distance(self):
+        response = self.client.get(self.URL, {'lat': 18.48, 'lng': -69.93, 'radius': 20})
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([item['name'] for item in results], ['Sucursal Centro', 'Cajero Piantini'])
+        self.assertLess(results[0]['distance'], results[1]['distance'])
+
+        response = self.client.get(self.URL, {'lat': 18.48, 'lng': -69.93, 'radius': 20, 'type': 'atm'})
+        self.assertEqual([item['name'] for item in response.json()['results']], ['Cajero Piantini'])
+
+    def test_invalid_parameters(self):
+        for params in (
+            {'lng': -69.93},
+            {'lat': 'abc', 'lng': -69.93},
+            {'lat': 18.4, 'lng': -69.9, 'radius': 'nan'},
+            {'lat': 'nan', 'lng': -69.9},
+            {'lat': 18.4, 'lng': 'inf'},
+            {'lat': 18.4, 'lng': -69.9, 'radius': '-inf'},
+            {'lat': 95, 'lng': -69.9},
+            {'lat': 18.4, 'lng': -69.9, 'type': 'kiosk'},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.URL, params).status_code, 400)
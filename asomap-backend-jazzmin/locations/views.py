@@ -1,20 +1,31 @@
+import math
+
 from django.shortcuts import render
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema
+from core.mixins import ConditionalGetMixin, conditional_get
+from core.query_budget import query_budget
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .geo import get_index
 from .models import Location
-from .serializers import LocationSerializer
+from .serializers import LocationSerializer, NearbyLocationSerializer
+
+NEARBY_DEFAULT_RADIUS_KM = 10
+NEARBY_MAX_RADIUS_KM = 500
+NEARBY_DEFAULT_LIMIT = 20
+NEARBY_MAX_LIMIT = 100
 
 
 # Create your views here.
 
-class LocationViewSet(viewsets.ModelViewSet):
+class LocationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet para ubicaciones (sucursales y cajeros automáticos)
     """
-    queryset = Location.objects.filter(is_active=True)
+    queryset = Location.objects.filter(is_active=True).select_related('schedule').prefetch_related('services')
     serializer_class = LocationSerializer
+    conditional_related_models = ('locations.Service', 'locations.Schedule')
     
     @extend_schema(
         summary="Listar ubicaciones",
@@ -22,6 +33,7 @@ class LocationViewSet(viewsets.ModelViewSet):
         responses={200: LocationSerializer(many=True)},
         tags=['locations']
     )
+    @query_budget(6)
     def list(self, request, *args, **kwargs):
         """
         Listar ubicaciones
@@ -36,6 +48,7 @@ class LocationViewSet(viewsets.ModelViewSet):
         responses={200: LocationSerializer, 404: None},
         tags=['locations']
     )
+    @query_budget(5)
     def retrieve(self, request, *args, **kwargs):
         """
         Obtener ubicación
@@ -51,6 +64,8 @@ class LocationViewSet(viewsets.ModelViewSet):
         tags=['locations']
     )
     @action(detail=False, methods=['get'], url_path='branches')
+    @query_budget(5)
+    @conditional_get('locations.Location', 'locations.Service', 'locations.Schedule')
     def branches(self, request):
         """
         Obtener sucursales
@@ -61,7 +76,7 @@ class LocationViewSet(viewsets.ModelViewSet):
             branches = Location.objects.filter(
                 type='branch',
                 is_active=True
-            ).order_by('name')
+            ).select_related('schedule').prefetch_related('services').order_by('name')
             
             serializer = self.get_serializer(branches, many=True)
             return Response(serializer.data)
@@ -85,6 +100,8 @@ class LocationViewSet(viewsets.ModelViewSet):
         tags=['locations']
     )
     @action(detail=False, methods=['get'], url_path='atms')
+    @query_budget(5)
+    @conditional_get('locations.Location', 'locations.Service', 'locations.Schedule')
     def atms(self, request):
         """
         Obtener cajeros automáticos
@@ -95,7 +112,7 @@ class LocationViewSet(viewsets.ModelViewSet):
             atms = Location.objects.filter(
                 type='atm',
                 is_active=True
-            ).order_by('name')
+            ).select_related('schedule').prefetch_related('services').order_by('name')
             
             serializer = self.get_serializer(atms, many=True)
             return Response(serializer.data)
@@ -111,3 +128,81 @@ class LocationViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
+
+    
+    @extend_schema(
+        summary="Ubicaciones cercanas",
+        description="Retorna las sucursales y cajeros dentro de un radio, ordenados por distancia",
+        parameters=[
+            OpenApiParameter('lat', float, required=True, description='Latitud del punto de búsqueda'),
+            OpenApiParameter('lng', float, required=True, description='Longitud del punto de búsqueda'),
+            OpenApiParameter('radius', float, description=f'Radio en km (por defecto {NEARBY_DEFAULT_RADIUS_KM}, máximo {NEARBY_MAX_RADIUS_KM})'),
+            OpenApiParameter('type', str, enum=['branch', 'atm'], description='Filtrar por tipo de ubicación'),
+            OpenApiParameter('limit', int, description=f'Cantidad máxima de resultados (por defecto {NEARBY_DEFAULT_LIMIT})'),
+        ],
+        responses={200: NearbyLocationSerializer(many=True), 400: None},
+        tags=['locations']
+    )
+    @action(detail=False, methods=['get'], url_path='nearby')
+    @conditional_get('locations.Location', 'locations.Service', 'locations.Schedule')
+    def nearby(self, request):
+        """
+        Ubicaciones cercanas
+        
+        Usa el índice espacial en memoria (locations.geo) para encontrar las
+        ubicaciones dentro del radio y solo consulta en la base de datos las
+        que se retornan.
+        """
+        try:
+            lat = float(request.query_params['lat'])
+            lng = float(request.query_params['lng'])
+            radius = float(request.query_params.get('radius', NEARBY_DEFAULT_RADIUS_KM))
+            limit = int(request.query_params.get('limit', NEARBY_DEFAULT_LIMIT))
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'Los parámetros lat y lng son requeridos y deben ser numéricos'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # float() acepta 'nan' e 'inf', que no se pueden ubicar en la cuadrícula
+        if not all(map(math.isfinite, (lat, lng, radius))):
+            return Response(
+                {'error': 'Los parámetros lat, lng y radius deben ser números finitos'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180) or radius <= 0:
+            return Response(
+                {'error': 'Coordenadas o radio fuera de rango'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        location_type = request.query_params.get('type') or None
+        if location_type and location_type not in dict(Location.TYPE_CHOICES):
+            return Response(
+                {'error': f'Tipo de ubicación inválido: {location_type}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        radius = min(radius, NEARBY_MAX_RADIUS_KM)
+        limit = max(1, min(limit, NEARBY_MAX_LIMIT))
+        matches = get_index().nearby(lat, lng, radius, location_type=location_type, limit=limit)
+        
+        locations = Location.objects.filter(
+            pk__in=[pk for _, pk in matches],
+            is_active=True
+        ).select_related('schedule').prefetch_related('services')
+        by_pk = {location.pk: location for location in locations}
+        
+        results = []
+        for distance, pk in matches:
+            location = by_pk.get(pk)
+            if location is not None:
+                location.distance = round(distance, 2)
+                results.append(location)
+        
+        serializer = NearbyLocationSerializer(results, many=True, context=self.get_serializer_context())
+        return Response({
+            'count': len(results),
+            'results': serializer.data
+        })
@@ -1,11 +1,11 @@
 from django.contrib import admin
-from .models import News, Promotion, NewsMedia
+from .models import News, Promotion, NewsMedia, Tag
 
 
 @admin.register(News)
 class NewsAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'category', 'fecha_publicacion', 'is_active', 'created_at']
-    list_filter = ['is_active', 'category', 'created_at', 'fecha_publicacion']
+    list_filter = ['is_active', 'category', 'tag_index', 'created_at', 'fecha_publicacion']
     search_fields = ['title', 'description', 'author', 'category']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-fecha_publicacion']
@@ -52,7 +52,7 @@ class NewsAdmin(admin.ModelAdmin):
 @admin.register(Promotion)
 class PromotionAdmin(admin.ModelAdmin):
     list_display = ['title', 'category', 'fecha_inicio', 'fecha_fin', 'is_active', 'created_at']
-    list_filter = ['is_active', 'category', 'created_at', 'fecha_inicio', 'fecha_fin']
+    list_filter = ['is_active', 'category', 'tag_index', 'created_at', 'fecha_inicio', 'fecha_fin']
     search_fields = ['title', 'description', 'category', 'tags', 'terms']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-fecha_inicio']
@@ -115,3 +115,11 @@ class NewsMediaAdmin(admin.ModelAdmin):
             "classes": ("collapse",)
         }),
     )
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ['name', 'slug']
+    search_fields = ['name', 'slug']
+    prepopulated_fields = {'slug': ('name',)}
+    ordering = ['name']
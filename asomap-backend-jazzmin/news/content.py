@@ -0,0 +1,79 @@
+"""
+Conversión del HTML de ProseEditor al formato estructurado del frontend
+
+El resultado es una lista de bloques {'type': ..., 'content': ...} con los
+tipos paragraph, subtitle, list y quote. Se calcula al guardar News y
+Promotion y se almacena en `structured_content`, de modo que la API no
+vuelve a parsear el HTML en cada serialización.
+"""
+from bs4 import BeautifulSoup
+
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+BLOCK_TAGS = ['p', *HEADING_TAGS, 'ul', 'ol', 'blockquote', 'pre']
+
+
+def parse_structured_content(html):
+    """Convierte el contenido HTML de ProseEditor a una lista de bloques"""
+    if not html:
+        return []
+
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+        content = []
+
+        # Procesar elementos en orden, evitando duplicados
+        for element in soup.find_all(BLOCK_TAGS):
+            # Verificar que el elemento no sea hijo de una lista ya procesada
+            if element.parent and element.parent.name in ['ul', 'ol']:
+                continue
+
+            if element.name in ['ul', 'ol']:
+                items = [li.get_text().strip() for li in element.find_all('li') if li.get_text().strip()]
+                if items:
+                    content.append({
+                        'type': 'list',
+                        'content': items
+                    })
+                continue
+
+            text = element.get_text().strip()
+            if not text:
+                continue
+
+            if element.name in HEADING_TAGS:
+                block_type = 'subtitle'
+            elif element.name == 'blockquote':
+                block_type = 'quote'
+            else:
+                # p y pre se muestran como párrafos
+                block_type = 'paragraph'
+
+            content.append({
+                'type': block_type,
+                'content': text
+            })
+
+        # Filtrar contenido duplicado
+        filtered_content = []
+        seen_content = set()
+
+        for item in content:
+            if item['type'] == 'list':
+                # Para listas, verificar si los elementos ya aparecieron como párrafos
+                list_items = set(item['content'])
+                if not any(item_text in seen_content for item_text in list_items):
+                    filtered_content.append(item)
+                    seen_content.update(list_items)
+            else:
+                # Para otros tipos, verificar si el contenido ya apareció
+                if item['content'] not in seen_content:
+                    filtered_content.append(item)
+                    seen_content.add(item['content'])
+
+        return filtered_content
+    except Exception:
+        # Si hay error en el parsing, retornar como párrafo simple
+        return [{
+            'type': 'paragraph',
+            'content': html
+        }]
@@ -0,0 +1,61 @@
+"""
+Comando de gestión para precalcular el contenido estructurado de noticias y promociones
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from news.content import parse_structured_content
+from news.models import News, Promotion
+
+
+class Command(BaseCommand):
+    help = 'Genera structured_content a partir de full_content en noticias y promociones existentes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Regenera todas las filas, no solo las que no tienen contenido estructurado'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Cantidad de filas procesadas por lote (por defecto: 200)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        for model in (News, Promotion):
+            queryset = model.objects.exclude(full_content='').only('pk', 'full_content')
+            if not options['all']:
+                queryset = queryset.filter(structured_content=[])
+
+            total = queryset.count()
+            self.stdout.write(f'📝 {model._meta.verbose_name_plural}: {total} filas por procesar')
+
+            updated = 0
+            batch = []
+            for obj in queryset.order_by('pk').iterator(chunk_size=batch_size):
+                obj.structured_content = parse_structured_content(obj.full_content)
+                batch.append(obj)
+                if len(batch) >= batch_size:
+                    updated += self._flush(model, batch)
+                    batch = []
+            if batch:
+                updated += self._flush(model, batch)
+
+            self.stdout.write(
+                self.style.SUCCESS(f'✅ {model._meta.verbose_name_plural}: {updated} filas actualizadas')
+            )
+
+    def _flush(self, model, batch):
+        """
+        Guarda un lote con bulk_update
+
+        No usa save() para no modificar updated_at (y con ello los ETag de la API).
+        """
+        with transaction.atomic():
+            model.objects.bulk_update(batch, ['structured_content'])
+        return len(batch)
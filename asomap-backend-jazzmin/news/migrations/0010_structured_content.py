@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_newsmedia'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='structured_content',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Bloques (párrafos, subtítulos, listas, citas) generados al guardar', verbose_name='Contenido estructurado'),
+        ),
+        migrations.AddField(
+            model_name='promotion',
+            name='structured_content',
+            field=models.JSONField(blank=True, default=list, editable=False, help_text='Bloques (párrafos, subtítulos, listas, citas) generados al guardar', verbose_name='Contenido estructurado'),
+        ),
+    ]
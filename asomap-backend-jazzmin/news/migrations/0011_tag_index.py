@@ -0,0 +1,63 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:49
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+TAGGED_MODELS = ['news', 'promotion']
+
+
+def split_existing_tags(apps, schema_editor):
+    """Crea las etiquetas normalizadas a partir del texto separado por comas"""
+    Tag = apps.get_model('news', 'Tag')
+    tags = {}
+    for model_name in TAGGED_MODELS:
+        model = apps.get_model('news', model_name)
+        through = model.tag_index.through
+        links = []
+        for obj in model.objects.order_by('pk').only('pk', 'tags'):
+            slugs = []
+            for name in (obj.tags or '').split(','):
+                name = name.strip()
+                slug = slugify(name)[:120]
+                if not slug or slug in slugs:
+                    continue
+                if slug not in tags:
+                    tags[slug] = Tag.objects.create(name=name[:100], slug=slug)
+                slugs.append(slug)
+                links.append(through(**{f'{model_name}_id': obj.pk, 'tag_id': tags[slug].pk}))
+        through.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_structured_content'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Nombre de la etiqueta tal como se escribió por primera vez', max_length=100, verbose_name='Nombre')),
+                ('slug', models.SlugField(help_text='Identificador normalizado de la etiqueta', max_length=120, unique=True, verbose_name='Slug')),
+            ],
+            options={
+                'verbose_name': 'Etiqueta',
+                'verbose_name_plural': 'Etiquetas',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='tag_index',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Etiquetas normalizadas; se sincroniza con `tags` al guardar', related_name='news', to='news.tag', verbose_name='Índice de etiquetas'),
+        ),
+        migrations.AddField(
+            model_name='promotion',
+            name='tag_index',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Etiquetas normalizadas; se sincroniza con `tags` al guardar', related_name='promotions', to='news.tag', verbose_name='Índice de etiquetas'),
+        ),
+        migrations.RunPython(split_existing_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:10
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0011_tag_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsmedia',
+            name='file',
+            field=models.FileField(help_text='Archivo de imagen, video o documento', storage=core.storage.media_storage, upload_to='news/', verbose_name='Archivo'),
+        ),
+    ]
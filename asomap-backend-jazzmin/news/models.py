@@ -1,6 +1,68 @@
 from django.db import models
 from django.core.validators import MinValueValidator
+from django.utils.text import slugify
 from django_prose_editor.fields import ProseEditorField
+from core.storage import media_storage
+
+from .content import parse_structured_content
+
+
+def split_tags(text):
+    """
+    Separa las etiquetas de un texto separado por comas
+
+    Returns:
+        dict: {slug: nombre} sin repetir, en el orden en que aparecen
+    """
+    names = {}
+    for name in (text or '').split(','):
+        name = name.strip()
+        slug = slugify(name)[:120]
+        if slug and slug not in names:
+            names[slug] = name
+    return names
+
+
+class Tag(models.Model):
+    """
+    Etiqueta normalizada de noticias y promociones
+
+    El texto `tags` de News y Promotion sigue siendo el que se edita; al
+    guardar se sincroniza con esta tabla para filtrar por etiqueta y contar
+    facetas con una sola consulta indexada.
+    """
+    name = models.CharField(
+        max_length=100,
+        verbose_name="Nombre",
+        help_text="Nombre de la etiqueta tal como se escribió por primera vez"
+    )
+    slug = models.SlugField(
+        max_length=120,
+        unique=True,
+        verbose_name="Slug",
+        help_text="Identificador normalizado de la etiqueta"
+    )
+
+    class Meta:
+        verbose_name = "Etiqueta"
+        verbose_name_plural = "Etiquetas"
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def from_text(cls, text):
+        """Etiquetas del texto separado por comas, creando las que no existen"""
+        names = split_tags(text)
+        if not names:
+            return []
+        existing = {tag.slug: tag for tag in cls.objects.filter(slug__in=names)}
+        missing = [cls(name=name[:100], slug=slug) for slug, name in names.items() if slug not in existing]
+        if missing:
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+            existing = {tag.slug: tag for tag in cls.objects.filter(slug__in=names)}
+        return [existing[slug] for slug in names if slug in existing]
 
 
 class News(models.Model):
@@ -43,6 +105,14 @@ class News(models.Model):
         verbose_name="Etiquetas",
         help_text="Etiquetas separadas por comas (ej: tecnología, finanzas, innovación)"
     )
+    tag_index = models.ManyToManyField(
+        Tag,
+        blank=True,
+        editable=False,
+        related_name='news',
+        verbose_name="Índice de etiquetas",
+        help_text="Etiquetas normalizadas; se sincroniza con `tags` al guardar"
+    )
     
     # Fechas
     fecha_publicacion = models.DateTimeField(
@@ -70,6 +140,15 @@ class News(models.Model):
         help_text="Contenido completo de la noticia con formato enriquecido"
     )
     
+    # Contenido estructurado precalculado a partir de full_content
+    structured_content = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="Contenido estructurado",
+        help_text="Bloques (párrafos, subtítulos, listas, citas) generados al guardar"
+    )
+    
     # Media adicional (opcional)
     media_urls = models.TextField(
         blank=True,
@@ -109,6 +188,16 @@ class News(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # El parseo del HTML se hace una sola vez aquí y no en cada serialización
+        self.structured_content = parse_structured_content(self.full_content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'full_content' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'structured_content'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'tags' in update_fields:
+            self.tag_index.set(Tag.from_text(self.tags))
+
     @property
     def image_url(self):
         """
@@ -214,6 +303,7 @@ class NewsMedia(models.Model):
     )
     file = models.FileField(
         upload_to='news/',
+        storage=media_storage,
         verbose_name="Archivo",
         help_text="Archivo de imagen, video o documento"
     )
@@ -296,6 +386,14 @@ class Promotion(models.Model):
         verbose_name="Etiquetas",
         help_text="Etiquetas separadas por comas (ej: descuento, nuevo cliente, limitado)"
     )
+    tag_index = models.ManyToManyField(
+        Tag,
+        blank=True,
+        editable=False,
+        related_name='promotions',
+        verbose_name="Índice de etiquetas",
+        help_text="Etiquetas normalizadas; se sincroniza con `tags` al guardar"
+    )
     
     # Fechas
     fecha_inicio = models.DateField(
@@ -328,6 +426,15 @@ class Promotion(models.Model):
         help_text="Contenido completo de la promoción con formato enriquecido"
     )
     
+    # Contenido estructurado precalculado a partir de full_content
+    structured_content = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="Contenido estructurado",
+        help_text="Bloques (párrafos, subtítulos, listas, citas) generados al guardar"
+    )
+    
     # Términos y condiciones
     terms = models.TextField(
         blank=True,
@@ -374,6 +481,16 @@ class Promotion(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # El parseo del HTML se hace una sola vez aquí y no en cada serialización
+        self.structured_content = parse_structured_content(self.full_content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'full_content' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'structured_content'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'tags' in update_fields:
+            self.tag_index.set(Tag.from_text(self.tags))
+
     @property
     def image_url(self):
         """
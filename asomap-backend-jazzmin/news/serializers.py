@@ -1,10 +1,23 @@
 from rest_framework import serializers
 from .models import News, Promotion, NewsMedia
-from bs4 import BeautifulSoup
-import re
+from .content import parse_structured_content
+from core.serializers import ResponsiveImageField
+
+
+def structured_content_for(obj):
+    """
+    Retorna los bloques estructurados de una noticia o promoción
+
+    Usa el valor almacenado en `structured_content`; solo parsea el HTML si la
+    fila aún no fue procesada (ver comando build_structured_content).
+    """
+    if obj.structured_content or not obj.full_content:
+        return obj.structured_content or []
+    return parse_structured_content(obj.full_content)
 
 
 class NewsSerializer(serializers.ModelSerializer):
+    imageResponsive = ResponsiveImageField(source='image')
     image = serializers.SerializerMethodField()
     date = serializers.SerializerMethodField()
     full_content = serializers.SerializerMethodField()
@@ -15,7 +28,7 @@ class NewsSerializer(serializers.ModelSerializer):
     class Meta:
         model = News
         fields = [
-            'id', 'image', 'title', 'description', 'date', 'author', 
+            'id', 'image', 'imageResponsive', 'title', 'description', 'date', 'author', 
             'category', 'tags', 'full_content', 'media', 'related_links'
         ]
 
@@ -35,7 +48,11 @@ class NewsSerializer(serializers.ModelSerializer):
 
     def get_media(self, obj):
         """Retorna los archivos de media como lista estructurada"""
-        media_files = obj.media_files.filter(is_active=True).order_by('order', 'created_at')
+        # all() aprovecha prefetch_related('media_files') en lugar de una consulta por noticia
+        media_files = sorted(
+            (media for media in obj.media_files.all() if media.is_active),
+            key=lambda media: (media.order, media.created_at)
+        )
         return [
             {
                 'type': media.media_type,
@@ -50,83 +67,44 @@ class NewsSerializer(serializers.ModelSerializer):
         return obj.related_links_list
 
     def get_full_content(self, obj):
-        """Convierte el contenido HTML de ProseEditor al formato estructurado del frontend"""
-        if not obj.full_content:
-            return []
-        
-        try:
-            soup = BeautifulSoup(obj.full_content, 'html.parser')
-            content = []
-            
-            # Procesar elementos en orden, evitando duplicados
-            for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'blockquote', 'pre']):
-                # Verificar que el elemento no sea hijo de una lista ya procesada
-                if element.parent and element.parent.name in ['ul', 'ol']:
-                    continue
-                    
-                if element.name == 'p':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'paragraph',
-                            'content': text
-                        })
-                elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'subtitle',
-                            'content': text
-                        })
-                elif element.name in ['ul', 'ol']:
-                    items = [li.get_text().strip() for li in element.find_all('li') if li.get_text().strip()]
-                    if items:
-                        content.append({
-                            'type': 'list',
-                            'content': items
-                        })
-                elif element.name == 'blockquote':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'quote',
-                            'content': text
-                        })
-                elif element.name == 'pre':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'paragraph',
-                            'content': text
-                        })
-            
-            # Filtrar contenido duplicado
-            filtered_content = []
-            seen_content = set()
-            
-            for item in content:
-                if item['type'] == 'list':
-                    # Para listas, verificar si los elementos ya aparecieron como párrafos
-                    list_items = set(item['content'])
-                    if not any(item_text in seen_content for item_text in list_items):
-                        filtered_content.append(item)
-                        seen_content.update(list_items)
-                else:
-                    # Para otros tipos, verificar si el contenido ya apareció
-                    if item['content'] not in seen_content:
-                        filtered_content.append(item)
-                        seen_content.add(item['content'])
-            
-            return filtered_content
-        except Exception:
-            # Si hay error en el parsing, retornar como párrafo simple
-            return [{
-                'type': 'paragraph',
-                'content': obj.full_content
-            }]
+        """Retorna el contenido estructurado precalculado al guardar"""
+        return structured_content_for(obj)
+
+
+class NewsListSerializer(serializers.ModelSerializer):
+    """
+    Representación ligera de noticias para listados
+
+    Omite full_content y media, por lo que la vista puede diferir esas
+    columnas y evitar la consulta de archivos de media por noticia.
+    """
+    imageResponsive = ResponsiveImageField(source='image')
+    image = serializers.SerializerMethodField()
+    date = serializers.SerializerMethodField()
+    tags = serializers.SerializerMethodField()
+
+    class Meta:
+        model = News
+        fields = [
+            'id', 'image', 'imageResponsive', 'title', 'description', 'date', 'author',
+            'category', 'tags'
+        ]
+
+    def get_image(self, obj):
+        """Retorna la URL de la imagen"""
+        return obj.image_url
+
+    def get_date(self, obj):
+        """Retorna la fecha formateada"""
+        return obj.formatted_date
+
+    def get_tags(self, obj):
+        """Retorna las etiquetas como lista"""
+        return obj.tags_list
 
 
 class PromotionSerializer(serializers.ModelSerializer):
+    imageResponsive = ResponsiveImageField(source='image')
     image = serializers.SerializerMethodField()
     tags = serializers.SerializerMethodField()
     terms = serializers.SerializerMethodField()
@@ -138,7 +116,7 @@ class PromotionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Promotion
         fields = [
-            'id', 'image', 'title', 'description', 'category', 
+            'id', 'image', 'imageResponsive', 'title', 'description', 'category', 
             'tags', 'full_content', 'media', 'related_links', 'validUntil', 
             'terms', 'fecha_inicio', 'fecha_fin', 'is_active', 'created_at', 'updated_at'
         ]
@@ -168,77 +146,34 @@ class PromotionSerializer(serializers.ModelSerializer):
         return obj.valid_until
 
     def get_full_content(self, obj):
-        """Convierte el contenido HTML de ProseEditor al formato estructurado del frontend"""
-        if not obj.full_content:
-            return []
-        
-        try:
-            soup = BeautifulSoup(obj.full_content, 'html.parser')
-            content = []
-            
-            # Procesar elementos en orden, evitando duplicados
-            for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'blockquote', 'pre']):
-                # Verificar que el elemento no sea hijo de una lista ya procesada
-                if element.parent and element.parent.name in ['ul', 'ol']:
-                    continue
-                    
-                if element.name == 'p':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'paragraph',
-                            'content': text
-                        })
-                elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'subtitle',
-                            'content': text
-                        })
-                elif element.name in ['ul', 'ol']:
-                    items = [li.get_text().strip() for li in element.find_all('li') if li.get_text().strip()]
-                    if items:
-                        content.append({
-                            'type': 'list',
-                            'content': items
-                        })
-                elif element.name == 'blockquote':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'quote',
-                            'content': text
-                        })
-                elif element.name == 'pre':
-                    text = element.get_text().strip()
-                    if text:
-                        content.append({
-                            'type': 'paragraph',
-                            'content': text
-                        })
-            
-            # Filtrar contenido duplicado
-            filtered_content = []
-            seen_content = set()
-            
-            for item in content:
-                if item['type'] == 'list':
-                    # Para listas, verificar si los elementos ya aparecieron como párrafos
-                    list_items = set(item['content'])
-                    if not any(item_text in seen_content for item_text in list_items):
-                        filtered_content.append(item)
-                        seen_content.update(list_items)
-                else:
-                    # Para otros tipos, verificar si el contenido ya apareció
-                    if item['content'] not in seen_content:
-                        filtered_content.append(item)
-                        seen_content.add(item['content'])
-            
-            return filtered_content
-        except Exception:
-            # Si hay error en el parsing, retornar como párrafo simple
-            return [{
-                'type': 'paragraph',
-                'content': obj.full_content
-            }] 
\ No newline at end of file
+        """Retorna el contenido estructurado precalculado al guardar"""
+        return structured_content_for(obj)
+
+
+class PromotionListSerializer(serializers.ModelSerializer):
+    """
+    Representación ligera de promociones para listados (sin full_content)
+    """
+    imageResponsive = ResponsiveImageField(source='image')
+    image = serializers.SerializerMethodField()
+    tags = serializers.SerializerMethodField()
+    validUntil = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Promotion
+        fields = [
+            'id', 'image', 'imageResponsive', 'title', 'description', 'category', 'tags',
+            'validUntil', 'fecha_inicio', 'fecha_fin', 'is_active'
+        ]
+
+    def get_image(self, obj):
+        """Retorna la URL de la imagen"""
+        return obj.image_url
+
+    def get_tags(self, obj):
+        """Retorna las etiquetas como lista"""
+        return obj.tags_list
+
+    def get_validUntil(self, obj):
+        """Retorna la fecha de fin formateada"""
+        return obj.valid_until
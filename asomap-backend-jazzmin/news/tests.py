@@ -0,0 +1,128 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from news.models import News, Promotion, Tag
+
+
+class TagIndexTests(TestCase):
+    """
+    Verifica el índice de etiquetas de noticias y promociones: el filtro
+    ?tag= por nombre o slug, las facetas (solo elementos activos) y la
+    sincronización del índice con el texto `tags` al guardar.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.first = self.create_news('Primera', 'Finanzas, Educación Financiera')
+        self.second = self.create_news('Segunda', 'finanzas, Tecnología')
+        self.hidden = self.create_news('Oculta', 'Tecnología, Sorteo', is_active=False)
+
+    @staticmethod
+    def create_news(title, tags, **kwargs):
+        return News.objects.create(
+            title=title, description='Descripción', image='news/noticia.jpg',
+            tags=tags, fecha_publicacion=timezone.now(), full_content='<p>Contenido</p>',
+            **kwargs
+        )
+
+    @staticmethod
+    def create_promotion(title, tags, **kwargs):
+        return Promotion.objects.create(
+            title=title, description='Descripción', tags=tags,
+            fecha_inicio=date(2026, 1, 1), fecha_fin=date(2026, 12, 31), **kwargs
+        )
+
+    @staticmethod
+    def titles(response):
+        data = response.json()
+        results = data['results'] if isinstance(data, dict) else data
+        return sorted(item['title'] for item in results)
+
+    def test_filter_by_name_or_slug(self):
+        for tag in ('Educación Financiera', 'educacion-financiera', ' EDUCACIÓN financiera '):
+            with self.subTest(tag=tag):
+                response = self.client.get('/api/news/', {'tag': tag})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.titles(response), ['Primera'])
+
+        # Las etiquetas se comparan por slug: 'Finanzas' y 'finanzas' son la misma
+        response = self.client.get('/api/news/latest/', {'tag': 'FINANZAS'})
+        self.assertEqual(self.titles(response), ['Primera', 'Segunda'])
+
+        # Las noticias inactivas no aparecen aunque tengan la etiqueta
+        response = self.client.get('/api/news/', {'tag': 'sorteo'})
+        self.assertEqual(self.titles(response), [])
+
+        response = self.client.get('/api/news/', {'tag': '¿?'})
+        self.assertEqual(self.titles(response), [])
+
+    def test_facets_count_active_rows_only(self):
+        response = self.client.get('/api/news/tags/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            {'name': 'Finanzas', 'slug': 'finanzas', 'count': 2},
+            {'name': 'Educación Financiera', 'slug': 'educacion-financiera', 'count': 1},
+            {'name': 'Tecnología', 'slug': 'tecnologia', 'count': 1},
+        ])
+
+        self.create_promotion('Activa', 'Descuento, Tecnología')
+        self.create_promotion('Vencida', 'Descuento, Sorteo', is_active=False)
+
+        response = self.client.get('/api/news/promotions/tags/')
+        self.assertEqual(response.json(), [
+            {'name': 'Descuento', 'slug': 'descuento', 'count': 1},
+            {'name': 'Tecnología', 'slug': 'tecnologia', 'count': 1},
+        ])
+        response = self.client.get('/api/news/promotions/', {'tag': 'sorteo'})
+        self.assertEqual(self.titles(response), [])
+
+    def test_facets_follow_edits(self):
+        self.client.get('/api/news/tags/')
+
+        # El caché de facetas se invalida al cambiar las etiquetas o el estado
+        self.hidden.is_active = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hidden.save(update_fields=['is_active'])
+
+        counts = {item['slug']: item['count'] for item in self.client.get('/api/news/tags/').json()}
+        self.assertEqual(counts['tecnologia'], 2)
+        self.assertEqual(counts['sorteo'], 1)
+
+    def test_save_resyncs_tag_index(self):
+        self.assertEqual(
+            sorted(self.first.tag_index.values_list('slug', flat=True)),
+            ['educacion-financiera', 'finanzas']
+        )
+
+        self.first.tags = 'Educación Financiera, Ahorro, ahorro,  '
+        self.first.save()
+
+        self.assertEqual(
+            sorted(self.first.tag_index.values_list('slug', flat=True)),
+            ['ahorro', 'educacion-financiera']
+        )
+        # Las etiquetas existentes se reutilizan: se conserva el primer nombre escrito
+        self.assertEqual(Tag.objects.get(slug='finanzas').name, 'Finanzas')
+        self.assertEqual(Tag.objects.filter(slug='ahorro').count(), 1)
+
+        # Un guardado parcial sin `tags` no toca el índice
+        self.first.tags = 'Otra'
+        self.first.save(update_fields=['title'])
+        self.assertEqual(
+            sorted(self.first.tag_index.values_list('slug', flat=True)),
+            ['ahorro', 'educacion-financiera']
+        )
+
+        self.first.save(update_fields=['tags'])
+        self.assertEqual(list(self.first.tag_index.values_list('slug', flat=True)), ['otra'])
+
+    def test_from_text(self):
+        tags = Tag.from_text('finanzas, Nuevo Cliente, , nuevo cliente')
+
+        self.assertEqual([tag.slug for tag in tags], ['finanzas', 'nuevo-cliente'])
+        self.assertEqual(tags[0].name, 'Finanzas')
+        self.assertEqual(Tag.from_text(''), [])
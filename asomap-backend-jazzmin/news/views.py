@@ -2,9 +2,39 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
-from drf_spectacular.utils import extend_schema, extend_schema_view
-from .models import News, Promotion
-from .serializers import NewsSerializer, PromotionSerializer
+from django.db.models import Count
+from django.utils.text import slugify
+from core.cache import cached_response
+from core.mixins import ConditionalGetMixin, conditional_get
+from core.query_budget import query_budget
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+from .models import News, Promotion, Tag
+from .serializers import (
+    NewsSerializer, NewsListSerializer, PromotionSerializer, PromotionListSerializer
+)
+
+# Columnas que la representación resumida no necesita leer
+SUMMARY_DEFERRED_FIELDS = ('full_content', 'structured_content')
+
+TAG_PARAMETER = OpenApiParameter('tag', str, description='Filtrar por etiqueta (nombre o slug)')
+
+
+def tag_facets(relation):
+    """
+    Etiquetas con la cantidad de elementos activos que las usan
+
+    Args:
+        relation: Relación inversa de Tag ('news' o 'promotions')
+
+    Returns:
+        list: [{'name', 'slug', 'count'}] ordenada por cantidad descendente
+    """
+    return list(
+        Tag.objects.filter(**{f'{relation}__is_active': True})
+        .annotate(count=Count(relation))
+        .order_by('-count', 'name')
+        .values('name', 'slug', 'count')
+    )
 
 class NewsPagination(PageNumberPagination):
     page_size = 6
@@ -15,6 +45,7 @@ class NewsPagination(PageNumberPagination):
     list=extend_schema(
         summary="Listar noticias",
         description="Retorna una lista paginada de noticias activas",
+        parameters=[TAG_PARAMETER],
         tags=['news']
     ),
     retrieve=extend_schema(
@@ -43,25 +74,66 @@ class NewsPagination(PageNumberPagination):
         tags=['news']
     )
 )
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     pagination_class = NewsPagination
     queryset = News.objects.all()
     serializer_class = NewsSerializer
+    conditional_related_models = ('news.NewsMedia',)
     
     def get_queryset(self):
         """
         Retorna el queryset apropiado según la acción
         """
-        return News.objects.filter(is_active=True)
+        queryset = News.objects.filter(is_active=True)
+        if self.action == 'list':
+            queryset = self.filter_by_tag(queryset)
+        if self.action == 'list' and self.wants_summary():
+            return queryset.defer(*SUMMARY_DEFERRED_FIELDS)
+        return queryset.prefetch_related('media_files')
+
+    def get_serializer_class(self):
+        """
+        Usa la representación resumida en listados cuando se pide ?summary=true
+        """
+        if self.action == 'list' and self.wants_summary():
+            return NewsListSerializer
+        return super().get_serializer_class()
+
+    def wants_summary(self):
+        """
+        Indica si el cliente pidió la representación sin full_content
+
+        Es opcional porque el detalle de noticias del frontend toma
+        full_content del listado.
+        """
+        value = self.request.query_params.get('summary', '') if self.request else ''
+        return value.lower() in ('1', 'true', 'yes')
+
+    def filter_by_tag(self, queryset):
+        """
+        Filtra por ?tag= usando el índice de etiquetas (una sola consulta con JOIN)
+
+        Acepta el nombre o el slug de la etiqueta.
+        """
+        tag = self.request.query_params.get('tag', '').strip() if self.request else ''
+        if not tag:
+            return queryset
+        slug = slugify(tag)
+        if not slug:
+            return queryset.none()
+        return queryset.filter(tag_index__slug=slug)
     
+    @query_budget(5)
     def list(self, request, *args, **kwargs):
         """
         Listar noticias
         
-        Retorna una lista paginada de noticias activas
+        Retorna una lista paginada de noticias activas. Con ?summary=true se
+        omiten full_content y media.
         """
         return super().list(request, *args, **kwargs)
     
+    @query_budget(4)
     def retrieve(self, request, *args, **kwargs):
         """
         Obtener noticia
@@ -105,10 +177,13 @@ class NewsViewSet(viewsets.ModelViewSet):
     @extend_schema(
         summary="Obtener últimas noticias",
         description="Retorna las noticias más recientes de ASOMAP",
+        parameters=[TAG_PARAMETER],
         responses={200: NewsSerializer(many=True), 404: None},
         tags=['news']
     )
     @action(detail=False, methods=['get'], url_path='latest')
+    @query_budget(5)
+    @conditional_get('news.News', 'news.NewsMedia')
     def latest(self, request):
         """
         Obtener últimas noticias
@@ -116,12 +191,18 @@ class NewsViewSet(viewsets.ModelViewSet):
         Retorna las noticias más recientes de ASOMAP
         """
         try:
-            news = News.objects.filter(is_active=True).order_by('-fecha_publicacion')
+            news = self.filter_by_tag(News.objects.filter(is_active=True)).order_by('-fecha_publicacion')
+            serializer_class = NewsSerializer
+            if self.wants_summary():
+                news = news.defer(*SUMMARY_DEFERRED_FIELDS)
+                serializer_class = NewsListSerializer
+            else:
+                news = news.prefetch_related('media_files')
             page = self.paginate_queryset(news)
             if page is not None:
-                serializer = NewsSerializer(page, many=True)
+                serializer = serializer_class(page, many=True)
                 return self.get_paginated_response(serializer.data)
-            serializer = NewsSerializer(news, many=True)
+            serializer = serializer_class(news, many=True)
             return Response(serializer.data)
         except Exception as e:
             return Response(
@@ -130,6 +211,8 @@ class NewsViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='promotions')
+    @query_budget(3)
+    @conditional_get('news.Promotion')
     def promotions(self, request):
         """
         Obtener promociones activas
@@ -137,15 +220,53 @@ class NewsViewSet(viewsets.ModelViewSet):
         Retorna las promociones activas y vigentes de ASOMAP
         """
         try:
-            promotions = Promotion.objects.filter(is_active=True).order_by('-fecha_inicio')
+            promotions = self.filter_by_tag(Promotion.objects.filter(is_active=True)).order_by('-fecha_inicio')
+            serializer_class = PromotionSerializer
+            if self.wants_summary():
+                promotions = promotions.defer(*SUMMARY_DEFERRED_FIELDS)
+                serializer_class = PromotionListSerializer
             page = self.paginate_queryset(promotions)
             if page is not None:
-                serializer = PromotionSerializer(page, many=True)
+                serializer = serializer_class(page, many=True)
                 return self.get_paginated_response(serializer.data)
-            serializer = PromotionSerializer(promotions, many=True)
+            serializer = serializer_class(promotions, many=True)
             return Response(serializer.data)
         except Exception as e:
             return Response(
                 {'error': 'Promotions not found'}, 
                 status=status.HTTP_404_NOT_FOUND
-            )
\ No newline at end of file
+            )
+
+    @extend_schema(
+        summary="Etiquetas de noticias",
+        description="Retorna las etiquetas de las noticias activas con la cantidad de noticias de cada una",
+        responses={200: None},
+        tags=['news']
+    )
+    @action(detail=False, methods=['get'], url_path='tags')
+    @query_budget(1)
+    @cached_response('news:tags', models=['news.News', 'news.Tag'])
+    def tags(self, request):
+        """
+        Etiquetas de noticias
+
+        Facetas etiqueta → cantidad calculadas desde el índice de etiquetas
+        """
+        return Response(tag_facets('news'))
+
+    @extend_schema(
+        summary="Etiquetas de promociones",
+        description="Retorna las etiquetas de las promociones activas con la cantidad de promociones de cada una",
+        responses={200: None},
+        tags=['news']
+    )
+    @action(detail=False, methods=['get'], url_path='promotions/tags')
+    @query_budget(1)
+    @cached_response('news:promotion-tags', models=['news.Promotion', 'news.Tag'])
+    def promotion_tags(self, request):
+        """
+        Etiquetas de promociones
+
+        Facetas etiqueta → cantidad calculadas desde el índice de etiquetas
+        """
+        return Response(tag_facets('promotions'))
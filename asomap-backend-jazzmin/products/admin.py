@@ -5,7 +5,8 @@ from django.utils.html import format_html
 from .models import (
     Account, Loan, LoanType, Card, Certificate, Banner,
     AccountBenefit, CardBenefit, 
-    CertificateBenefit, CertificateRate, CertificateDepositRate, CertificateFAQ
+    CertificateBenefit, CertificateRate, CertificateDepositRate, CertificateFAQ,
+    SlugRedirect
 )
 
 # Importar configuración del admin
@@ -178,12 +179,12 @@ class AccountAdmin(BaseModelAdmin):
     list_display = ['title', 'category', 'is_active', 'created_at', 'updated_at']
     list_filter = ['is_active', 'created_at', 'category']
     search_fields = ['title', 'description', 'features', 'requirements']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['slug', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     fieldsets = (
         ('Información Básica', {
-            'fields': ('title', 'description', 'category')
+            'fields': ('title', 'slug', 'description', 'category')
         }),
         ('Imágenes', {
             'fields': ('banner_image', 'account_image'),
@@ -211,12 +212,12 @@ class LoanAdmin(BaseModelAdmin):
     list_display = ['title', 'loan_type', 'is_active', 'created_at', 'updated_at']
     list_filter = ['is_active', 'created_at', 'loan_type']
     search_fields = ['title', 'description', 'details', 'requirements']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['slug', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     fieldsets = (
         ('Información Básica', {
-            'fields': ('title', 'description', 'loan_type')
+            'fields': ('title', 'slug', 'description', 'loan_type')
         }),
         ('Imagen del Banner', {
             'fields': ('banner_image',),
@@ -244,12 +245,12 @@ class CardAdmin(BaseModelAdmin):
     list_display = ['title', 'card_type', 'is_active', 'created_at', 'updated_at']
     list_filter = ['is_active', 'created_at', 'card_type']
     search_fields = ['title', 'description', 'features', 'requirements']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['slug', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     fieldsets = (
         ('Información Básica', {
-            'fields': ('title', 'description', 'card_type')
+            'fields': ('title', 'slug', 'description', 'card_type')
         }),
         ('Imágenes', {
             'fields': ('banner_image', 'card_image'),
@@ -277,12 +278,12 @@ class CertificateAdmin(BaseModelAdmin):
     list_display = ['title', 'certificate_type', 'is_active', 'created_at', 'updated_at']
     list_filter = ['is_active', 'created_at', 'certificate_type']
     search_fields = ['title', 'subtitle', 'description', 'requirements']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['slug', 'created_at', 'updated_at']
     ordering = ['-created_at']
     
     fieldsets = (
         ('Información Básica', {
-            'fields': ('title', 'subtitle', 'description', 'certificate_type')
+            'fields': ('title', 'slug', 'subtitle', 'description', 'certificate_type')
         }),
         ('Imágenes', {
             'fields': ('banner_image', 'certificate_image'),
@@ -353,7 +354,7 @@ class BannerAdmin(BaseModelAdmin):
     
     fieldsets = (
         ('Información Básica', {
-            'fields': ('title', 'description')
+            'fields': ('title', 'slug', 'description')
         }),
         ('Botón 1', {
             'fields': ('button1_name', 'button1_url')
@@ -370,7 +371,7 @@ class BannerAdmin(BaseModelAdmin):
         }),
     )
     
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('slug', 'created_at', 'updated_at')
 
 
 @admin.register(LoanType)
@@ -394,4 +395,16 @@ class LoanTypeAdmin(BaseModelAdmin):
         }),
     )
     
-    readonly_fields = ('created_at', 'updated_at')
\ No newline at end of file
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(SlugRedirect)
+class SlugRedirectAdmin(admin.ModelAdmin):
+    list_display = ['old_slug', 'content_type', 'object_id', 'created_at']
+    list_filter = ['content_type']
+    search_fields = ['old_slug']
+    readonly_fields = ['content_type', 'object_id', 'old_slug', 'created_at']
+
+    def has_add_permission(self, request):
+        """Las redirecciones se crean automáticamente al renombrar un producto"""
+        return False
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:19
+
+from django.db import migrations, models
+from django.utils.text import slugify
+import django.db.models.deletion
+
+
+SLUGGED_MODELS = ['account', 'banner', 'card', 'certificate', 'loan']
+
+
+def populate_slugs(apps, schema_editor):
+    """Genera slugs únicos a partir del título para los registros existentes"""
+    for model_name in SLUGGED_MODELS:
+        model = apps.get_model('products', model_name)
+        used = set()
+        for obj in model.objects.order_by('pk').only('pk', 'title'):
+            base = slugify(obj.title)[:210] or model_name
+            slug = base
+            counter = 2
+            while slug in used:
+                slug = f'{base}-{counter}'
+                counter += 1
+            used.add(slug)
+            model.objects.filter(pk=obj.pk).update(slug=slug)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('products', '0010_banner_loantype_alter_loan_details_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, verbose_name='Slug'),
+        ),
+        migrations.AddField(
+            model_name='banner',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, verbose_name='Slug'),
+        ),
+        migrations.AddField(
+            model_name='card',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, verbose_name='Slug'),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, verbose_name='Slug'),
+        ),
+        migrations.AddField(
+            model_name='loan',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, verbose_name='Slug'),
+        ),
+        migrations.RunPython(populate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='account',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, unique=True, verbose_name='Slug'),
+        ),
+        migrations.AlterField(
+            model_name='banner',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, unique=True, verbose_name='Slug'),
+        ),
+        migrations.AlterField(
+            model_name='card',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, unique=True, verbose_name='Slug'),
+        ),
+        migrations.AlterField(
+            model_name='certificate',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, unique=True, verbose_name='Slug'),
+        ),
+        migrations.AlterField(
+            model_name='loan',
+            name='slug',
+            field=models.SlugField(blank=True, help_text='Identificador único para URLs (se genera automáticamente a partir del título)', max_length=220, unique=True, verbose_name='Slug'),
+        ),
+        migrations.CreateModel(
+            name='SlugRedirect',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID del producto')),
+                ('old_slug', models.SlugField(max_length=220, verbose_name='Slug anterior')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='Tipo de producto')),
+            ],
+            options={
+                'verbose_name': 'Redirección de slug',
+                'verbose_name_plural': 'Redirecciones de slug',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='slugredirect',
+            constraint=models.UniqueConstraint(fields=('content_type', 'old_slug'), name='unique_slug_redirect'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:10
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_product_slugs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='account_image',
+            field=models.ImageField(blank=True, help_text='Imagen principal de la cuenta', null=True, storage=core.storage.media_storage, upload_to='products/accounts/', verbose_name='Imagen de la cuenta'),
+        ),
+        migrations.AlterField(
+            model_name='account',
+            name='banner_image',
+            field=models.ImageField(blank=True, help_text='Imagen de banner para la cuenta', null=True, storage=core.storage.media_storage, upload_to='products/accounts/banners/', verbose_name='Imagen de banner'),
+        ),
+        migrations.AlterField(
+            model_name='card',
+            name='banner_image',
+            field=models.ImageField(blank=True, help_text='Imagen de banner para la tarjeta', null=True, storage=core.storage.media_storage, upload_to='products/cards/banners/', verbose_name='Imagen de banner'),
+        ),
+        migrations.AlterField(
+            model_name='card',
+            name='card_image',
+            field=models.ImageField(blank=True, help_text='Imagen principal de la tarjeta', null=True, storage=core.storage.media_storage, upload_to='products/cards/', verbose_name='Imagen de la tarjeta'),
+        ),
+    ]
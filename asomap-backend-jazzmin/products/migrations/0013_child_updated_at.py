@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_content_addressed_media'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountbenefit',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='cardbenefit',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='certificatebenefit',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='certificatedepositrate',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='certificatefaq',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='certificaterate',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Fecha de actualización'),
+            preserve_default=False,
+        ),
+    ]
@@ -1,7 +1,67 @@
+import re
+
 from django.db import models
 from django.core.validators import MinValueValidator
+from django.contrib.contenttypes.models import ContentType
 from django_prose_editor.fields import ProseEditorField
 from django.utils.text import slugify
+from core.storage import media_storage
+
+SLUG_MAX_LENGTH = 220
+
+
+def assign_slug(instance, source_field, update_fields=None):
+    """
+    Asigna a `instance.slug` un slug único derivado del campo `source_field`
+
+    Si el título cambia, el slug anterior se registra en SlugRedirect para
+    que las URLs antiguas sigan funcionando mediante una redirección.
+
+    En un guardado parcial (update_fields) el slug solo se recalcula si se
+    guarda `source_field`, y en ese caso se agrega 'slug' a los campos: así
+    nunca se registra una redirección hacia un slug que no se guardó.
+
+    Returns:
+        update_fields para pasar a save()
+    """
+    if update_fields is not None:
+        if source_field not in update_fields:
+            return update_fields
+        update_fields = {*update_fields, 'slug'}
+
+    model = instance.__class__
+    source = getattr(instance, source_field)
+    base = slugify(source)[:SLUG_MAX_LENGTH - 10] or model._meta.model_name
+
+    others = model._default_manager.exclude(pk=instance.pk)
+
+    # El slug actual ya corresponde al título (o a su variante con sufijo si
+    # otro producto ocupa el slug base)
+    if instance.slug == base:
+        return update_fields
+    if (instance.slug and re.fullmatch(rf'{re.escape(base)}-\d+', instance.slug)
+            and others.filter(slug=base).exists()):
+        return update_fields
+
+    slug = base
+    counter = 2
+    while others.filter(slug=slug).exists():
+        slug = f'{base}-{counter}'
+        counter += 1
+
+    old_slug = instance.slug
+    instance.slug = slug
+
+    content_type = ContentType.objects.get_for_model(model)
+    # El nuevo slug deja de ser una redirección (ej. se restauró un título anterior)
+    SlugRedirect.objects.filter(content_type=content_type, old_slug=slug).delete()
+    if instance.pk and old_slug:
+        SlugRedirect.objects.update_or_create(
+            content_type=content_type,
+            old_slug=old_slug,
+            defaults={'object_id': instance.pk}
+        )
+    return update_fields
 
 
 class AccountBenefit(models.Model):
@@ -47,7 +107,11 @@ class AccountBenefit(models.Model):
         verbose_name="Texto del beneficio",
         help_text="Descripción del beneficio"
     )
-    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
+
     class Meta:
         verbose_name = "Beneficio de Cuenta"
         verbose_name_plural = "Beneficios de Cuenta"
@@ -71,6 +135,13 @@ class Account(models.Model):
         verbose_name="Título",
         help_text="Título de la cuenta"
     )
+    slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        unique=True,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Identificador único para URLs (se genera automáticamente a partir del título)"
+    )
     description = models.TextField(
         verbose_name="Descripción",
         help_text="Descripción breve de la cuenta"
@@ -79,6 +150,7 @@ class Account(models.Model):
     # Imágenes
     banner_image = models.ImageField(
         upload_to='products/accounts/banners/',
+        storage=media_storage,
         null=True,
         blank=True,
         verbose_name="Imagen de banner",
@@ -86,6 +158,7 @@ class Account(models.Model):
     )
     account_image = models.ImageField(
         upload_to='products/accounts/',
+        storage=media_storage,
         null=True,
         blank=True,
         verbose_name="Imagen de la cuenta",
@@ -190,12 +263,9 @@ class Account(models.Model):
             })
         return benefits
 
-    @property
-    def slug(self):
-        """
-        Retorna el slug del título para URLs amigables
-        """
-        return slugify(self.title)
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = assign_slug(self, 'title', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
 class LoanType(models.Model):
     """
@@ -265,6 +335,13 @@ class Loan(models.Model):
         verbose_name="Título",
         help_text="Título del préstamo "
     )
+    slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        unique=True,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Identificador único para URLs (se genera automáticamente a partir del título)"
+    )
     description = models.TextField(
         verbose_name="Descripción",
         help_text="Descripción detallada del préstamo"
@@ -327,13 +404,9 @@ class Loan(models.Model):
             return [req.strip() for req in self.requirements.split('/') if req.strip()]
         return []
 
-    @property
-    def slug(self):
-        """
-        Retorna el slug del título para URLs
-        """
-        from django.utils.text import slugify
-        return slugify(self.title)
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = assign_slug(self, 'title', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
 class CardBenefit(models.Model):
     """Modelo para los beneficios de las tarjetas con iconos"""
@@ -379,7 +452,11 @@ class CardBenefit(models.Model):
         verbose_name="Texto del beneficio",
         help_text="Descripción del beneficio"
     )
-    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
+
     class Meta:
         verbose_name = "Beneficio de Tarjeta"
         verbose_name_plural = "Beneficios de Tarjeta"
@@ -403,6 +480,13 @@ class Card(models.Model):
         verbose_name="Título",
         help_text="Título de la tarjeta"
     )
+    slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        unique=True,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Identificador único para URLs (se genera automáticamente a partir del título)"
+    )
     description = models.TextField(
         verbose_name="Descripción",
         help_text="Descripción breve de la tarjeta"
@@ -411,6 +495,7 @@ class Card(models.Model):
     # Imágenes
     banner_image = models.ImageField(
         upload_to='products/cards/banners/',
+        storage=media_storage,
         null=True,
         blank=True,
         verbose_name="Imagen de banner",
@@ -418,6 +503,7 @@ class Card(models.Model):
     )
     card_image = models.ImageField(
         upload_to='products/cards/',
+        storage=media_storage,
         null=True,
         blank=True,
         verbose_name="Imagen de la tarjeta",
@@ -521,12 +607,9 @@ class Card(models.Model):
             })
         return benefits
 
-    @property
-    def slug(self):
-        """
-        Retorna el slug del título para URLs amigables
-        """
-        return slugify(self.title)
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = assign_slug(self, 'title', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
 class CertificateBenefit(models.Model):
     """Modelo para los beneficios de los certificados financieros"""
@@ -540,6 +623,10 @@ class CertificateBenefit(models.Model):
         verbose_name="Descripción del beneficio",
         help_text="Descripción detallada del beneficio"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
 
     class Meta:
         verbose_name = "Beneficio de Certificado"
@@ -563,7 +650,11 @@ class CertificateRate(models.Model):
         verbose_name="Valor",
         help_text="Valor de la tarifa (ej: $5,000,000.00)"
     )
-  
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
+
     class Meta:
         verbose_name = "Tarifa de Certificado"
         verbose_name_plural = "Tarifas de Certificado"
@@ -591,7 +682,11 @@ class CertificateDepositRate(models.Model):
         verbose_name="Plazo",
         help_text="Plazo de la inversión (ej: de 30 a 90 días)"
     )
-   
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
+
     class Meta:
         verbose_name = "Tasa de Depósito de Certificado"
         verbose_name_plural = "Tasas de Depósito de Certificado"
@@ -612,6 +707,10 @@ class CertificateFAQ(models.Model):
         verbose_name="Respuesta",
         help_text="Respuesta a la pregunta frecuente"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Fecha de actualización"
+    )
 
     class Meta:
         verbose_name = "FAQ de Certificado"
@@ -636,6 +735,13 @@ class Certificate(models.Model):
         verbose_name="Título principal",
         help_text="Título principal del certificado"
     )
+    slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        unique=True,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Identificador único para URLs (se genera automáticamente a partir del título)"
+    )
     subtitle = models.CharField(
         max_length=200,
         blank=True,
@@ -870,12 +976,9 @@ class Certificate(models.Model):
             })
         return faqs
 
-    @property
-    def slug(self):
-        """
-        Retorna el slug del título para URLs amigables
-        """
-        return slugify(self.title)
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = assign_slug(self, 'title', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
 
 class Banner(models.Model):
@@ -887,6 +990,13 @@ class Banner(models.Model):
         verbose_name="Título",
         help_text="Título principal del banner"
     )
+    slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        unique=True,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Identificador único para URLs (se genera automáticamente a partir del título)"
+    )
     description = models.TextField(
         verbose_name="Descripción",
         help_text="Descripción del banner"
@@ -951,9 +1061,56 @@ class Banner(models.Model):
     def __str__(self):
         return f"{self.title} - Orden: {self.order}"
 
-    @property
-    def slug(self):
+    def save(self, *args, **kwargs):
+        kwargs['update_fields'] = assign_slug(self, 'title', kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
+
+
+class SlugRedirect(models.Model):
+    """Slugs anteriores de productos, para redirigir URLs antiguas al slug actual"""
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        verbose_name="Tipo de producto"
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name="ID del producto"
+    )
+    old_slug = models.SlugField(
+        max_length=SLUG_MAX_LENGTH,
+        verbose_name="Slug anterior"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Fecha de creación"
+    )
+
+    class Meta:
+        verbose_name = "Redirección de slug"
+        verbose_name_plural = "Redirecciones de slug"
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'old_slug'],
+                name='unique_slug_redirect'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.old_slug} → {self.content_type.model} #{self.object_id}"
+
+    @classmethod
+    def resolve(cls, model, old_slug):
         """
-        Retorna el slug del título para URLs amigables
+        Retorna el slug actual del producto activo que usaba `old_slug`, o None
         """
-        return slugify(self.title) 
\ No newline at end of file
+        redirect = cls.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            old_slug=old_slug
+        ).first()
+        if not redirect:
+            return None
+        return model._default_manager.filter(
+            pk=redirect.object_id,
+            is_active=True
+        ).values_list('slug', flat=True).first()
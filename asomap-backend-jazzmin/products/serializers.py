@@ -1,7 +1,10 @@
 from rest_framework import serializers
 from .models import Account, Loan, LoanType, Card, Certificate, Banner
+from core.serializers import ResponsiveImageField
 
 class AccountSerializer(serializers.ModelSerializer):
+    bannerImageResponsive = ResponsiveImageField(source='banner_image')
+    accountImageResponsive = ResponsiveImageField(source='account_image')
     bannerImage = serializers.SerializerMethodField()
     accountImage = serializers.SerializerMethodField()
     features = serializers.SerializerMethodField()
@@ -12,7 +15,8 @@ class AccountSerializer(serializers.ModelSerializer):
     class Meta:
         model = Account
         fields = [
-            'id', 'title', 'description', 'bannerImage', 'accountImage', 
+            'id', 'title', 'description', 'bannerImage', 'bannerImageResponsive',
+            'accountImage', 'accountImageResponsive',
             'category', 'features', 'requirements', 'benefits', 'slug',
             'is_active', 'created_at', 'updated_at'
         ]
@@ -42,6 +46,7 @@ class AccountSerializer(serializers.ModelSerializer):
         return obj.slug
 
 class LoanSerializer(serializers.ModelSerializer):
+    bannerImageResponsive = ResponsiveImageField(source='banner_image')
     details = serializers.SerializerMethodField()
     requirements = serializers.SerializerMethodField()
     bannerImage = serializers.SerializerMethodField()
@@ -51,7 +56,7 @@ class LoanSerializer(serializers.ModelSerializer):
         model = Loan
         fields = [
             'id', 'title', 'description', 'loan_type', 'details', 
-            'requirements_title', 'requirements', 'bannerImage', 'slug',
+            'requirements_title', 'requirements', 'bannerImage', 'bannerImageResponsive', 'slug',
             'is_active', 'created_at', 'updated_at'
         ]
 
@@ -72,6 +77,8 @@ class LoanSerializer(serializers.ModelSerializer):
         return obj.slug
 
 class CardSerializer(serializers.ModelSerializer):
+    bannerImageResponsive = ResponsiveImageField(source='banner_image')
+    cardImageResponsive = ResponsiveImageField(source='card_image')
     bannerImage = serializers.SerializerMethodField()
     cardImage = serializers.SerializerMethodField()
     features = serializers.SerializerMethodField()
@@ -82,7 +89,8 @@ class CardSerializer(serializers.ModelSerializer):
     class Meta:
         model = Card
         fields = [
-            'id', 'title', 'description', 'bannerImage', 'cardImage', 
+            'id', 'title', 'description', 'bannerImage', 'bannerImageResponsive',
+            'cardImage', 'cardImageResponsive',
             'card_type', 'features', 'requirements', 'benefits', 'slug',
             'is_active', 'created_at', 'updated_at'
         ]
@@ -112,6 +120,8 @@ class CardSerializer(serializers.ModelSerializer):
         return obj.slug
 
 class CertificateSerializer(serializers.ModelSerializer):
+    bannerImageResponsive = ResponsiveImageField(source='banner_image')
+    certificateImageResponsive = ResponsiveImageField(source='certificate_image')
     bannerImage = serializers.SerializerMethodField()
     certificateImage = serializers.SerializerMethodField()
     benefits = serializers.SerializerMethodField()
@@ -125,7 +135,8 @@ class CertificateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Certificate
         fields = [
-            'id', 'title', 'subtitle', 'description', 'bannerImage', 'certificateImage',
+            'id', 'title', 'subtitle', 'description', 'bannerImage', 'bannerImageResponsive',
+            'certificateImage', 'certificateImageResponsive',
             'certificate_type', 'cta_apply', 'cta_rates', 'benefits_title', 'benefits',
             'investment_title', 'investment_subtitle', 'investment', 'rates_title', 'rates',
             'requirements_title', 'requirements', 'deposit_rates_title', 'depositRates',
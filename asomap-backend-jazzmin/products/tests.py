@@ -0,0 +1,250 @@
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.jobs import claim_due_jobs, run_job
+from core.models import Job, MediaBlob
+from core.storage import ContentAddressedStorage
+from core.testing import MediaTestCase
+
+from .models import (
+    Account, Card, Certificate, CertificateBenefit, CertificateRate,
+    CertificateDepositRate, CertificateFAQ, SlugRedirect
+)
+
+
+class CertificateQueryCountTests(TestCase):
+    """
+    Verifica que los endpoints de certificados cargan las listas anidadas
+    (beneficios, tarifas, tasas de depósito y FAQs) con un número fijo de
+    consultas, sin importar cuántos certificados se serializan.
+    """
+
+    # 5 agregaciones del ETag (en frío) + COUNT de paginación + certificados + 4 prefetch
+    LIST_QUERIES = 11
+    # 5 agregaciones del ETag + certificado + 4 prefetch
+    DETAIL_QUERIES = 10
+
+    def setUp(self):
+        cache.clear()
+
+    def create_certificates(self, total):
+        certificates = []
+        for index in range(total):
+            certificate = Certificate.objects.create(
+                title=f'Certificado {index}',
+                description='Descripción del certificado'
+            )
+            for item in range(3):
+                CertificateBenefit.objects.create(
+                    certificate=certificate, title=f'Beneficio {item}', description='Detalle'
+                )
+                CertificateRate.objects.create(
+                    certificate=certificate, label=f'Tarifa {item}', value='1%'
+                )
+                CertificateDepositRate.objects.create(
+                    certificate=certificate, range=f'Rango {item}', rate='5%', term='12 meses'
+                )
+                CertificateFAQ.objects.create(
+                    certificate=certificate, question=f'Pregunta {item}', answer='Respuesta'
+                )
+            certificates.append(certificate)
+        return certificates
+
+    def test_list_query_count_is_constant(self):
+        self.create_certificates(6)
+
+        for page_size in (1, 6):
+            cache.clear()
+            with self.assertNumQueries(self.LIST_QUERIES):
+                response = self.client.get(
+                    '/api/products/certificates/', {'page_size': page_size}
+                )
+            self.assertEqual(response.status_code, 200)
+            results = response.json()['results']
+            self.assertEqual(len(results), page_size)
+            self.assertEqual(len(results[0]['benefits']['items']), 3)
+            self.assertEqual(len(results[0]['faq']['items']), 3)
+
+    def test_slug_query_count_is_constant(self):
+        certificate = self.create_certificates(2)[0]
+
+        with self.assertNumQueries(self.DETAIL_QUERIES):
+            response = self.client.get(f'/api/products/certificates/{certificate.slug}/')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['title'], certificate.title)
+        self.assertEqual(len(data['rates']['items']), 3)
+        self.assertEqual(len(data['depositRates']['items']), 3)
+
+    def test_editing_nested_row_changes_etag(self):
+        certificate = self.create_certificates(1)[0]
+        url = f'/api/products/certificates/{certificate.slug}/'
+        etag = self.client.get(url)['ETag']
+
+        faq = certificate.certificate_faqs.first()
+        faq.answer = 'Respuesta actualizada'
+        with self.captureOnCommitCallbacks(execute=True):
+            faq.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class SlugRedirectTests(TestCase):
+    """
+    Verifica que el slug sigue al título y que los slugs anteriores
+    redirigen al actual, también en guardados parciales (update_fields).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.certificate = Certificate.objects.create(
+            title='Certificado Plus', description='Descripción del certificado'
+        )
+
+    def rename(self, title, **kwargs):
+        self.certificate.title = title
+        self.certificate.save(**kwargs)
+        self.certificate.refresh_from_db()
+
+    def test_renaming_redirects_old_slug(self):
+        self.assertEqual(self.certificate.slug, 'certificado-plus')
+
+        self.rename('Certificado Premium')
+
+        self.assertEqual(self.certificate.slug, 'certificado-premium')
+        response = self.client.get('/api/products/certificates/certificado-plus/?lang=es')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/api/products/certificates/certificado-premium/?lang=es')
+
+        # Restaurar el título anterior elimina la redirección que lo ocupaba
+        self.rename('Certificado Plus')
+        self.assertEqual(self.certificate.slug, 'certificado-plus')
+        self.assertFalse(SlugRedirect.objects.filter(old_slug='certificado-plus').exists())
+        response = self.client.get('/api/products/certificates/certificado-premium/')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/api/products/certificates/certificado-plus/')
+
+    def test_duplicate_titles_get_suffix(self):
+        other = Certificate.objects.create(title='Certificado Plus', description='Otro')
+        self.assertEqual(other.slug, 'certificado-plus-2')
+
+        other.description = 'Editado'
+        other.save()
+        other.refresh_from_db()
+        self.assertEqual(other.slug, 'certificado-plus-2')
+        self.assertFalse(SlugRedirect.objects.exists())
+
+    def test_update_fields_with_title_saves_slug(self):
+        self.rename('Certificado Premium', update_fields=['title'])
+
+        self.assertEqual(self.certificate.slug, 'certificado-premium')
+        self.assertEqual(
+            SlugRedirect.resolve(Certificate, 'certificado-plus'), 'certificado-premium'
+        )
+
+    def test_update_fields_without_title_keeps_slug(self):
+        self.certificate.title = 'Certificado Premium'
+        self.certificate.is_active = False
+        self.certificate.save(update_fields=['is_active'])
+        self.certificate.refresh_from_db()
+
+        self.assertEqual(self.certificate.title, 'Certificado Plus')
+        self.assertEqual(self.certificate.slug, 'certificado-plus')
+        self.assertFalse(SlugRedirect.objects.exists())
+
+
+@override_settings(RESPONSIVE_IMAGE_FORMATS=['webp'], JOBS_ASYNC=True)
+class ResponsiveImageTests(MediaTestCase):
+    """
+    Verifica que al subir una imagen se encola la generación de variantes
+    por breakpoint (sin ampliar el original) y que, una vez ejecutada la
+    tarea, el serializer las expone para srcset.
+    """
+
+    def upload(self, certificate, width, height):
+        buffer = BytesIO()
+        Image.new('RGB', (width, height), (0, 90, 160)).save(buffer, 'JPEG')
+        certificate.certificate_image.save('certificado.jpg', ContentFile(buffer.getvalue()))
+
+    def test_certificate_image_variants(self):
+        certificate = Certificate.objects.create(title='Certificado', description='Descripción')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.upload(certificate, 800, 400)
+            self.upload(certificate, 800, 400)
+
+        job = Job.objects.get(task='images.generate_variants')
+        self.assertEqual(job.payload, {'model': 'products.Certificate', 'pk': certificate.pk})
+        self.assertIsNone(
+            self.client.get(f'/api/products/certificates/{certificate.slug}/').json()['certificateImageResponsive']
+        )
+
+        for job in claim_due_jobs():
+            self.assertTrue(run_job(job))
+        response = self.client.get(f'/api/products/certificates/{certificate.slug}/')
+
+        self.assertEqual(response.status_code, 200)
+        image = response.json()['certificateImageResponsive']
+        self.assertEqual((image['width'], image['height']), (800, 400))
+        self.assertEqual(
+            [candidate.rsplit(' ', 1)[1] for candidate in image['srcset'].split(', ')],
+            ['360w', '640w', '800w']
+        )
+        self.assertEqual([source['type'] for source in image['sources']], ['image/webp'])
+        self.assertIsNone(response.json()['bannerImageResponsive'])
+
+
+@override_settings(RESPONSIVE_IMAGES_ENABLED=False)
+class ContentAddressedStorageTests(MediaTestCase):
+    """
+    Verifica que el mismo archivo subido en varios modelos se guarda una
+    sola vez, que las referencias se cuentan al guardar/eliminar y que
+    collect_media_garbage elimina solo los blobs sin referencias.
+    """
+
+    def setUp(self):
+        super().setUp()
+        storage = ContentAddressedStorage(location=self.media_root)
+        for model, field in ((Account, 'account_image'), (Card, 'card_image')):
+            patcher = mock.patch.object(model._meta.get_field(field), 'storage', storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def image(self, color):
+        buffer = BytesIO()
+        Image.new('RGB', (40, 20), color).save(buffer, 'PNG')
+        return ContentFile(buffer.getvalue())
+
+    def test_duplicate_uploads_share_one_blob(self):
+        account = Account.objects.create(title='Cuenta', description='Descripción')
+        card = Card.objects.create(title='Tarjeta', description='Descripción')
+        account.account_image.save('logo.png', self.image((0, 90, 160)))
+        card.card_image.save('logo-copia.png', self.image((0, 90, 160)))
+
+        self.assertEqual(account.account_image.name, card.card_image.name)
+        self.assertRegex(account.account_image.name, r'^blobs/[0-9a-f]{2}/[0-9a-f]{64}\.png$')
+        logo = MediaBlob.objects.get()
+        self.assertEqual(logo.ref_count, 2)
+
+        account.account_image.save('nuevo.png', self.image((200, 0, 0)))
+        card.delete()
+        logo.refresh_from_db()
+        self.assertEqual(logo.ref_count, 0)
+        self.assertEqual(MediaBlob.objects.get(name=account.account_image.name).ref_count, 1)
+
+        response = self.client.get(f'/media/{account.account_image.name}')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        with override_settings(MEDIA_GC_GRACE_HOURS=0):
+            call_command('collect_media_garbage', stdout=StringIO())
+        self.assertFalse(MediaBlob.objects.filter(pk=logo.pk).exists())
+        self.assertFalse(account.account_image.storage.exists(logo.name))
+        self.assertTrue(account.account_image.storage.exists(account.account_image.name))
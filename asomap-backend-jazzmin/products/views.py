@@ -2,13 +2,41 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from django.http import HttpResponsePermanentRedirect
+from core.mixins import ConditionalGetMixin, conditional_get
+from core.query_budget import query_budget
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from .models import Account, Loan, LoanType, Card, Certificate, Banner
+from .models import Account, Loan, LoanType, Card, Certificate, Banner, SlugRedirect
 from .serializers import (
     AccountSerializer, LoanSerializer, LoanTypeSerializer,
     CardSerializer, CertificateSerializer, BannerSerializer
 )
 
+def get_slug_redirect(request, model, slug):
+    """
+    Retorna una redirección permanente si `slug` es un slug anterior del producto
+
+    Permite que las URLs antiguas (antes de renombrar el título) sigan funcionando.
+    """
+    new_slug = SlugRedirect.resolve(model, slug)
+    if not new_slug:
+        return None
+    prefix, _, suffix = request.path.rpartition(slug)
+    url = f'{prefix}{new_slug}{suffix}'
+    if request.META.get('QUERY_STRING'):
+        url = f"{url}?{request.META['QUERY_STRING']}"
+    return HttpResponsePermanentRedirect(url)
+
+
+# Relaciones inversas que CertificateSerializer recorre por cada certificado
+CERTIFICATE_PREFETCH = (
+    'certificate_benefits',
+    'certificate_rates',
+    'certificate_deposit_rates',
+    'certificate_faqs',
+)
+
+
 class ProductsPagination(PageNumberPagination):
     page_size = 6
     page_size_query_param = 'page_size'
@@ -46,10 +74,11 @@ class ProductsPagination(PageNumberPagination):
         tags=['products']
     )
 )
-class ProductsViewSet(viewsets.ModelViewSet):
+class ProductsViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     pagination_class = ProductsPagination
     queryset = Account.objects.all()
     serializer_class = AccountSerializer
+    conditional_related_models = ('products.AccountBenefit',)
     
     def get_queryset(self):
         """
@@ -112,6 +141,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=['products']
     )
     @action(detail=False, methods=['get'], url_path='accounts')
+    @conditional_get('products.Account', 'products.AccountBenefit')
     def accounts(self, request):
         """
         Obtener productos de cuentas
@@ -139,6 +169,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=['products']
     )
     @action(detail=False, methods=['get'], url_path='accounts/(?P<slug>[^/.]+)')
+    @conditional_get('products.Account', 'products.AccountBenefit')
     def account_by_slug(self, request, slug=None):
         """
         Obtener cuenta por slug
@@ -146,13 +177,16 @@ class ProductsViewSet(viewsets.ModelViewSet):
         Retorna una cuenta específica por su slug (título convertido a URL amigable)
         """
         try:
-            # Buscar por slug (título convertido a slug)
+            # Búsqueda exacta por el slug almacenado (índice único)
             account = Account.objects.filter(
                 is_active=True,
-                title__icontains=slug.replace('-', ' ')
+                slug=slug
             ).first()
             
             if not account:
+                redirect = get_slug_redirect(request, Account, slug)
+                if redirect:
+                    return redirect
                 return Response(
                     {'error': f'Account with slug "{slug}" not found'}, 
                     status=status.HTTP_404_NOT_FOUND
@@ -166,6 +200,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    @conditional_get('products.Account', 'products.AccountBenefit')
     def get_account_by_id(self, request, pk=None):
         """
         Obtener cuenta por ID
@@ -193,6 +228,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='loans')
+    @conditional_get('products.Loan', 'products.LoanType')
     def loans(self, request):
         """
         Obtener productos de préstamos hipotecarios
@@ -220,6 +256,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=['products']
     )
     @action(detail=False, methods=['get'], url_path='loans/(?P<slug>[^/.]+)')
+    @conditional_get('products.Loan', 'products.LoanType')
     def loan_by_slug(self, request, slug=None):
         """
         Obtener préstamo por slug
@@ -227,13 +264,16 @@ class ProductsViewSet(viewsets.ModelViewSet):
         Retorna un préstamo específico por su slug (título convertido a URL amigable)
         """
         try:
-            # Buscar por slug (título convertido a slug)
+            # Búsqueda exacta por el slug almacenado (índice único)
             loan = Loan.objects.filter(
                 is_active=True,
-                title__icontains=slug.replace('-', ' ')
+                slug=slug
             ).first()
             
             if not loan:
+                redirect = get_slug_redirect(request, Loan, slug)
+                if redirect:
+                    return redirect
                 return Response(
                     {'error': f'Loan with slug "{slug}" not found'}, 
                     status=status.HTTP_404_NOT_FOUND
@@ -247,6 +287,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    @conditional_get('products.Loan', 'products.LoanType')
     def get_loan_by_id(self, request, pk=None):
         """
         Obtener préstamo por ID
@@ -274,6 +315,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='cards')
+    @conditional_get('products.Card', 'products.CardBenefit')
     def cards(self, request):
         """
         Obtener productos de tarjetas
@@ -301,6 +343,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=['products']
     )
     @action(detail=False, methods=['get'], url_path='cards/(?P<slug>[^/.]+)')
+    @conditional_get('products.Card', 'products.CardBenefit')
     def card_by_slug(self, request, slug=None):
         """
         Obtener tarjeta por slug
@@ -308,13 +351,16 @@ class ProductsViewSet(viewsets.ModelViewSet):
         Retorna una tarjeta específica por su slug (título convertido a URL amigable)
         """
         try:
-            # Buscar por slug (título convertido a slug)
+            # Búsqueda exacta por el slug almacenado (índice único)
             card = Card.objects.filter(
                 is_active=True,
-                title__icontains=slug.replace('-', ' ')
+                slug=slug
             ).first()
             
             if not card:
+                redirect = get_slug_redirect(request, Card, slug)
+                if redirect:
+                    return redirect
                 return Response(
                     {'error': f'Card with slug "{slug}" not found'}, 
                     status=status.HTTP_404_NOT_FOUND
@@ -328,6 +374,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    @conditional_get('products.Card', 'products.CardBenefit')
     def get_card_by_id(self, request, pk=None):
         """
         Obtener tarjeta por ID
@@ -355,6 +402,8 @@ class ProductsViewSet(viewsets.ModelViewSet):
             )
     
     @action(detail=False, methods=['get'], url_path='certificates')
+    @query_budget(11)
+    @conditional_get('products.Certificate', 'products.CertificateBenefit', 'products.CertificateRate', 'products.CertificateDepositRate', 'products.CertificateFAQ')
     def certificates(self, request):
         """
         Obtener certificados financieros
@@ -362,7 +411,9 @@ class ProductsViewSet(viewsets.ModelViewSet):
         Retorna todos los certificados financieros disponibles en ASOMAP
         """
         try:
-            certificates = Certificate.objects.filter(is_active=True).order_by('-created_at')
+            certificates = Certificate.objects.filter(is_active=True).prefetch_related(
+                *CERTIFICATE_PREFETCH
+            ).order_by('-created_at')
             page = self.paginate_queryset(certificates)
             if page is not None:
                 serializer = CertificateSerializer(page, many=True)
@@ -382,6 +433,8 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=['products']
     )
     @action(detail=False, methods=['get'], url_path='certificates/(?P<slug>[^/.]+)')
+    @query_budget(10)
+    @conditional_get('products.Certificate', 'products.CertificateBenefit', 'products.CertificateRate', 'products.CertificateDepositRate', 'products.CertificateFAQ')
     def certificate_by_slug(self, request, slug=None):
         """
         Obtener certificado por slug
@@ -389,13 +442,16 @@ class ProductsViewSet(viewsets.ModelViewSet):
         Retorna un certificado específico por su slug (título convertido a URL amigable)
         """
         try:
-            # Buscar por slug (título convertido a slug)
+            # Búsqueda exacta por el slug almacenado (índice único)
             certificate = Certificate.objects.filter(
                 is_active=True,
-                title__icontains=slug.replace('-', ' ')
-            ).first()
+                slug=slug
+            ).prefetch_related(*CERTIFICATE_PREFETCH).first()
             
             if not certificate:
+                redirect = get_slug_redirect(request, Certificate, slug)
+                if redirect:
+                    return redirect
                 return Response(
                     {'error': f'Certificate with slug "{slug}" not found'}, 
                     status=status.HTTP_404_NOT_FOUND
@@ -409,6 +465,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    @conditional_get('products.Certificate', 'products.CertificateBenefit', 'products.CertificateRate', 'products.CertificateDepositRate', 'products.CertificateFAQ')
     def get_certificate_by_id(self, request, pk=None):
         """
         Obtener certificado por ID
@@ -419,7 +476,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
             certificate = Certificate.objects.filter(
                 is_active=True,
                 id=pk
-            ).first()
+            ).prefetch_related(*CERTIFICATE_PREFETCH).first()
             
             if not certificate:
                 return Response(
@@ -447,7 +504,7 @@ class ProductsViewSet(viewsets.ModelViewSet):
         tags=["Banners"]
     )
 )
-class BannerViewSet(viewsets.ReadOnlyModelViewSet):
+class BannerViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar banners promocionales
     """
@@ -461,6 +518,7 @@ class BannerViewSet(viewsets.ReadOnlyModelViewSet):
         tags=["Banners"]
     )
     @action(detail=False, methods=["get"])
+    @conditional_get()
     def main(self, request):
         """
         Retorna el banner principal (el de mayor prioridad)
@@ -494,7 +552,7 @@ class BannerViewSet(viewsets.ReadOnlyModelViewSet):
         tags=["Tipos de Préstamos"]
     )
 )
-class LoanTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class LoanTypeViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar tipos de préstamos
     """
@@ -1,6 +1,8 @@
 from django.db import models
 from django.core.validators import FileExtensionValidator
 from django_prose_editor.fields import ProseEditorField
+
+from core.models import PdfPreviewModel
 from .widgets import TallProseEditorField
 
 
@@ -72,8 +74,9 @@ class AbandonedAccountsSection(models.Model):
         super().save(*args, **kwargs)
 
 
-class YearlyDocument(models.Model):
+class YearlyDocument(PdfPreviewModel):
     """Modelo para documentos anuales de cuentas abandonadas/inactivas"""
+    pdf_field = 'document'
     
     TYPE_CHOICES = [
         ('abandoned', 'Abandonadas'),
@@ -228,8 +231,10 @@ class AccountContractsSection(models.Model):
         super().save(*args, **kwargs)
 
 
-class Contract(models.Model):
+class Contract(PdfPreviewModel):
     """Modelo para contratos de adhesión"""
+    pdf_field = 'document'
+
     title = models.CharField(
         max_length=300,
         verbose_name="Título",
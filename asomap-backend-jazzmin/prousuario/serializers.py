@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from core.documents import preview_data
+from core.serializers import PdfPreviewField
 from .models import (
     AccountType, AbandonedAccountsSection, YearlyDocument,
     ContractCategory, AccountContractsSection, Contract, ClaimRequest, FraudReport,
@@ -15,10 +17,11 @@ class AccountTypeSerializer(serializers.ModelSerializer):
 
 class YearlyDocumentSerializer(serializers.ModelSerializer):
     document_url = serializers.SerializerMethodField()
+    preview = PdfPreviewField()
     
     class Meta:
         model = YearlyDocument
-        fields = ['title', 'document_url', 'date', 'type']
+        fields = ['title', 'document_url', 'preview', 'date', 'type']
     
     def get_document_url(self, obj):
         """Retorna la URL del documento"""
@@ -38,6 +41,7 @@ class YearDocumentsSerializer(serializers.Serializer):
             documents[account_type_id] = {
                 'title': doc.title,
                 'url': doc.document_url,
+                'preview': preview_data(doc),
                 'date': doc.formatted_date,
                 'type': doc.type
             }
@@ -78,6 +82,7 @@ class AbandonedAccountsSectionSerializer(serializers.ModelSerializer):
             years_data[year]['documents'][doc.account_type.id] = {
                 'title': doc.title,
                 'url': doc.document_url,
+                'preview': preview_data(doc),
                 'date': doc.formatted_date,
                 'type': doc.type
             }
@@ -95,10 +100,11 @@ class ContractCategorySerializer(serializers.ModelSerializer):
 class ContractSerializer(serializers.ModelSerializer):
     category = serializers.CharField(source='category.name', read_only=True)
     document_url = serializers.SerializerMethodField()
+    preview = PdfPreviewField()
     
     class Meta:
         model = Contract
-        fields = ['id', 'title', 'document_url', 'category', 'order']
+        fields = ['id', 'title', 'document_url', 'preview', 'category', 'order']
     
     def get_document_url(self, obj):
         """Retorna la URL del documento"""
@@ -127,6 +133,7 @@ class AccountContractsSectionSerializer(serializers.ModelSerializer):
             contracts_data.append({
                 'title': contract.title,
                 'url': contract.document_url,
+                'preview': preview_data(contract),
                 'category': contract.category.name
             })
         
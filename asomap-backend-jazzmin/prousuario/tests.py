@@ -1,3 +1,59 @@
-from django.test import TestCase
+from io import BytesIO
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+
+from core.jobs import claim_due_jobs, run_job
+from core.models import Job
+from core.testing import MediaTestCase
+
+from .models import Contract, ContractCategory
+
+
+@override_settings(JOBS_ASYNC=True)
+class ContractPdfPreviewTests(MediaTestCase):
+    """
+    Verifica que al guardar un contrato se encola la vista previa del PDF y
+    que, una vez ejecutada la tarea, la API expone miniatura, páginas y
+    tamaño sin que el frontend descargue el documento.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.category = ContractCategory.objects.create(name='Cuentas')
+
+    def pdf(self, pages):
+        # 595x842 px a 72 ppp = página A4 en puntos PDF
+        images = [Image.new('RGB', (595, 842), (255, 255, 255)) for _ in range(pages)]
+        buffer = BytesIO()
+        images[0].save(buffer, 'PDF', resolution=72, save_all=True, append_images=images[1:])
+        return SimpleUploadedFile('contrato.pdf', buffer.getvalue(), content_type='application/pdf')
+
+    def test_contract_preview(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            contract = Contract.objects.create(
+                title='Contrato de ahorro', category=self.category, document=self.pdf(pages=3)
+            )
+
+        self.assertEqual(
+            Job.objects.get(task='documents.generate_preview').payload,
+            {'model': 'prousuario.Contract', 'pk': contract.pk}
+        )
+        self.assertIsNone(self.client.get(f'/api/user-support/contracts/{contract.pk}/').json()['preview'])
+
+        for job in claim_due_jobs():
+            self.assertTrue(run_job(job))
+        preview = self.client.get(f'/api/user-support/contracts/{contract.pk}/').json()['preview']
+        grouped = self.client.get('/api/user-support/contracts/by_category/').json()['results']
+
+        self.assertEqual(preview['pages'], 3)
+        self.assertEqual(preview['page_size_mm'], [210, 297])
+        self.assertEqual((preview['width'], preview['height']), (320, 453))
+        self.assertTrue(preview['thumbnail'].endswith('.webp'))
+        self.assertEqual(grouped['Cuentas'][0]['preview'], preview)
+
+        # Guardar sin cambiar el PDF no vuelve a encolar la tarea
+        with self.captureOnCommitCallbacks(execute=True):
+            Contract.objects.get(pk=contract.pk).save()
+        self.assertEqual(Job.objects.filter(status='pending').count(), 0)
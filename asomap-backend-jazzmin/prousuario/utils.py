@@ -61,7 +61,7 @@ Equipo ASOMAP
         
         # Log del resultado
         if result:
-            logger.info(f"✅ Email enviado exitosamente a {claim_request.email} para reclamo #{claim_request.id}")
+            logger.info(f"📨 Email en cola para {claim_request.email} para reclamo #{claim_request.id}")
             return True
         else:
             logger.error(f"❌ Error enviando email a {claim_request.email} para reclamo #{claim_request.id}")
@@ -168,7 +168,7 @@ Equipo de Seguridad ASOMAP
         
         # Log del resultado
         if result:
-            logger.info(f"✅ Email enviado exitosamente a {fraud_report.email} para reporte #{fraud_report.id}")
+            logger.info(f"📨 Email en cola para {fraud_report.email} para reporte #{fraud_report.id}")
             return True
         else:
             logger.error(f"❌ Error enviando email a {fraud_report.email} para reporte #{fraud_report.id}")
@@ -232,7 +232,7 @@ Equipo ASOMAP
         
         # Log del resultado
         if result:
-            logger.info(f"✅ Email enviado exitosamente a {suggestion.email} para sugerencia #{suggestion.id}")
+            logger.info(f"📨 Email en cola para {suggestion.email} para sugerencia #{suggestion.id}")
             return True
         else:
             logger.error(f"❌ Error enviando email a {suggestion.email} para sugerencia #{suggestion.id}")
@@ -246,90 +246,33 @@ Equipo ASOMAP
 def send_suggestion_email_with_gmail_fix(subject, message, recipient_list, html_message=None, fail_silently=True, email_type='suggestion_confirmation'):
     """
     Función específica para enviar emails de sugerencias que maneja Gmail correctamente
+
+    El email queda en la cola de salida; lo envía el worker process_email_outbox.
     """
     try:
-        from django.core.mail import send_mail
-        from django.conf import settings
-        from core.models import EmailConfiguration, EmailLog
-        from django.utils import timezone
+        from core.email_utils import get_active_email_config
         
-        config = EmailConfiguration.objects.filter(is_active=True, is_default=True).first()
-        if not config:
-            config = EmailConfiguration.objects.filter(is_active=True).first()
+        config = get_active_email_config()
         
         if not config or not config.is_configured:
             logger.error("No hay configuración de email válida")
             return False
         
-        # Crear registro de email
-        email_log = EmailLog.objects.create(
-            email_type=email_type,
+        # Para Gmail, usar el username como from_email para evitar problemas de autenticación
+        if config.provider.lower() == 'gmail':
+            from_email = config.username
+        else:
+            from_email = config.from_email
+        
+        return send_email_with_db_config(
             subject=subject,
-            from_email=config.username if config.provider.lower() == 'gmail' else config.from_email,
-            to_email=', '.join(recipient_list),
             message=message,
+            recipient_list=recipient_list,
             html_message=html_message,
-            email_config=config,
-            status='pending'
+            fail_silently=fail_silently,
+            email_type=email_type,
+            from_email=from_email
         )
-        
-        try:
-            # Configurar temporalmente los settings de email
-            original_settings = {
-                'EMAIL_HOST': getattr(settings, 'EMAIL_HOST', ''),
-                'EMAIL_PORT': getattr(settings, 'EMAIL_PORT', 587),
-                'EMAIL_USE_TLS': getattr(settings, 'EMAIL_USE_TLS', True),
-                'EMAIL_HOST_USER': getattr(settings, 'EMAIL_HOST_USER', ''),
-                'EMAIL_HOST_PASSWORD': getattr(settings, 'EMAIL_HOST_PASSWORD', ''),
-                'DEFAULT_FROM_EMAIL': getattr(settings, 'DEFAULT_FROM_EMAIL', ''),
-            }
-            
-            # Aplicar configuración de la base de datos
-            settings.EMAIL_HOST = config.host
-            settings.EMAIL_PORT = config.port
-            settings.EMAIL_USE_TLS = config.use_tls
-            settings.EMAIL_HOST_USER = config.username
-            settings.EMAIL_HOST_PASSWORD = config.password
-            
-            # Para Gmail, usar el username como from_email para evitar problemas de autenticación
-            if config.provider.lower() == 'gmail':
-                from_email = config.username
-                settings.DEFAULT_FROM_EMAIL = config.username
-            else:
-                from_email = config.from_email
-                settings.DEFAULT_FROM_EMAIL = config.from_email
-            
-            # Enviar email
-            result = send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=recipient_list,
-                html_message=html_message,
-                fail_silently=fail_silently,
-            )
-            
-            # Actualizar registro
-            email_log.status = 'sent' if result else 'failed'
-            email_log.sent_at = timezone.now()
-            email_log.save()
-            
-            # Restaurar configuración original
-            for key, value in original_settings.items():
-                setattr(settings, key, value)
-            
-            return result
-            
-        except Exception as e:
-            # Actualizar registro con error
-            email_log.status = 'failed'
-            email_log.error_message = str(e)
-            email_log.save()
-            
-            logger.error(f"Error enviando email de sugerencia: {str(e)}")
-            if not fail_silently:
-                raise
-            return False
             
     except Exception as e:
         logger.error(f"Error en send_suggestion_email_with_gmail_fix: {str(e)}")
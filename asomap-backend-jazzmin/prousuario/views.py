@@ -3,6 +3,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
+from core.documents import preview_data
+from core.mixins import ConditionalGetMixin, conditional_get
 from .models import (
     AbandonedAccountsSection, AccountType, YearlyDocument,
     ContractCategory, AccountContractsSection, Contract, ClaimRequest, FraudReport, RightsAndDutiesPage, ServiceRatesPage, ServiceCategory, SuggestionBox, Province, SuggestionBoxPage, FraudReportPage, ClaimRequestPage
@@ -34,12 +36,13 @@ class AbandonedAccountsPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class AbandonedAccountsSectionViewSet(viewsets.ReadOnlyModelViewSet):
+class AbandonedAccountsSectionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar las secciones de cuentas abandonadas e inactivas
     """
     queryset = AbandonedAccountsSection.objects.filter(is_active=True)
     serializer_class = AbandonedAccountsSectionSerializer
+    conditional_related_models = ('prousuario.AccountType', 'prousuario.YearlyDocument')
     pagination_class = AbandonedAccountsPagination
     
     def get_queryset(self):
@@ -50,7 +53,7 @@ class AbandonedAccountsSectionViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class AccountTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class AccountTypeViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar los tipos de cuenta
     """
@@ -58,18 +61,20 @@ class AccountTypeViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = AccountTypeSerializer
 
 
-class YearlyDocumentViewSet(viewsets.ReadOnlyModelViewSet):
+class YearlyDocumentViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar los documentos anuales
     """
     queryset = YearlyDocument.objects.filter(is_active=True)
     serializer_class = YearlyDocumentSerializer
+    conditional_related_models = ('prousuario.AccountType',)
     
     def get_queryset(self):
         """Optimiza las consultas con select_related"""
         return super().get_queryset().select_related('account_type')
     
     @action(detail=False, methods=['get'])
+    @conditional_get('prousuario.YearlyDocument', 'prousuario.AccountType')
     def by_year(self, request):
         """Obtiene documentos agrupados por año"""
         year = request.query_params.get('year')
@@ -96,6 +101,7 @@ class YearlyDocumentViewSet(viewsets.ReadOnlyModelViewSet):
             years_data[year]['documents'][doc.account_type.id] = {
                 'title': doc.title,
                 'url': doc.document_url,
+                'preview': preview_data(doc),
                 'date': doc.formatted_date,
                 'type': doc.type
             }
@@ -109,7 +115,7 @@ class YearlyDocumentViewSet(viewsets.ReadOnlyModelViewSet):
         })
 
 
-class ContractCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class ContractCategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar las categorías de contratos
     """
@@ -117,27 +123,30 @@ class ContractCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ContractCategorySerializer
 
 
-class AccountContractsSectionViewSet(viewsets.ReadOnlyModelViewSet):
+class AccountContractsSectionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar las secciones de contratos de adhesión
     """
     queryset = AccountContractsSection.objects.filter(is_active=True)
     serializer_class = AccountContractsSectionSerializer
+    conditional_related_models = ('prousuario.Contract', 'prousuario.ContractCategory')
     pagination_class = AbandonedAccountsPagination
 
 
-class ContractViewSet(viewsets.ReadOnlyModelViewSet):
+class ContractViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar los contratos individuales
     """
     queryset = Contract.objects.filter(is_active=True)
     serializer_class = ContractSerializer
+    conditional_related_models = ('prousuario.ContractCategory',)
     
     def get_queryset(self):
         """Optimiza las consultas con select_related"""
         return super().get_queryset().select_related('category')
     
     @action(detail=False, methods=['get'])
+    @conditional_get('prousuario.Contract', 'prousuario.ContractCategory')
     def by_category(self, request):
         """Obtiene contratos agrupados por categoría"""
         category_name = request.query_params.get('category')
@@ -157,6 +166,7 @@ class ContractViewSet(viewsets.ReadOnlyModelViewSet):
             categories_data[category_name].append({
                 'title': contract.title,
                 'url': contract.document_url,
+                'preview': preview_data(contract),
                 'category': contract.category.name
             })
         
@@ -317,26 +327,28 @@ class FraudReportViewSet(viewsets.ModelViewSet):
         )
 
 
-class RightsAndDutiesPageViewSet(viewsets.ReadOnlyModelViewSet):
+class RightsAndDutiesPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página de derechos y deberes
     Solo permite lectura (GET)
     """
     queryset = RightsAndDutiesPage.objects.filter(is_active=True)
     serializer_class = RightsAndDutiesPageSerializer
+    conditional_related_models = ('prousuario.RightsAndDutiesSection', 'prousuario.RightsAndDutiesImage')
     
     def get_queryset(self):
         """Retorna solo la página activa"""
         return RightsAndDutiesPage.objects.filter(is_active=True)
 
 
-class ServiceRatesPageViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceRatesPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página de tarifas de servicios
     Solo permite lectura (GET)
     """
     queryset = ServiceRatesPage.objects.filter(is_active=True)
     serializer_class = ServiceRatesPageSerializer
+    conditional_related_models = ('prousuario.ServiceCategory', 'prousuario.ServiceRate')
     
     def get_queryset(self):
         """Retorna solo la página activa"""
@@ -345,13 +357,14 @@ class ServiceRatesPageViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class ServiceCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceCategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar categorías de servicios
     Solo permite lectura (GET)
     """
     queryset = ServiceCategory.objects.filter(is_active=True).prefetch_related('rates')
     serializer_class = ServiceCategorySerializer
+    conditional_related_models = ('prousuario.ServiceRate',)
     
     def get_queryset(self):
         """Retorna solo categorías activas con sus tarifas"""
@@ -363,7 +376,7 @@ class ServiceCategoryViewSet(viewsets.ReadOnlyModelViewSet):
         ).distinct()
 
 
-class ProvinceViewSet(viewsets.ReadOnlyModelViewSet):
+class ProvinceViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar provincias
     Solo permite lectura (GET)
@@ -423,7 +436,7 @@ class SuggestionBoxViewSet(viewsets.ModelViewSet):
         )
 
 
-class SuggestionBoxPageViewSet(viewsets.ReadOnlyModelViewSet):
+class SuggestionBoxPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página del buzón de sugerencias
     Solo permite lectura (GET)
@@ -436,7 +449,7 @@ class SuggestionBoxPageViewSet(viewsets.ReadOnlyModelViewSet):
         return SuggestionBoxPage.objects.filter(is_active=True)
 
 
-class FraudReportPageViewSet(viewsets.ReadOnlyModelViewSet):
+class FraudReportPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página de reportes de fraude
     Solo permite lectura (GET)
@@ -449,7 +462,7 @@ class FraudReportPageViewSet(viewsets.ReadOnlyModelViewSet):
         return FraudReportPage.objects.filter(is_active=True)
 
 
-class ClaimRequestPageViewSet(viewsets.ReadOnlyModelViewSet):
+class ClaimRequestPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página de solicitudes de reclamaciones
     Solo permite lectura (GET)
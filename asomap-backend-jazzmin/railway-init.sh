@@ -15,6 +15,10 @@ if [ "$RAILWAY_ENVIRONMENT" = "production" ]; then
     echo "🗄️  Aplicando migraciones..."
     python manage.py migrate --noinput
     
+    # Construir el índice de búsqueda si está vacío
+    echo "🔎 Construyendo índice de búsqueda..."
+    python manage.py rebuild_search_index --if-empty
+    
     # Crear directorios necesarios
     echo "📁 Creando directorios necesarios..."
     mkdir -p media
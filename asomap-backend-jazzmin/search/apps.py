@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+    verbose_name = 'Búsqueda'
+
+    def ready(self):
+        """Conecta las señales que mantienen el índice actualizado"""
+        from .signals import connect_signals
+        connect_signals()
@@ -0,0 +1,204 @@
+"""
+Construcción de los documentos del índice de búsqueda
+
+Cada modelo indexado tiene una función que arma su documento (título, texto
+plano y slug) o retorna None si el objeto no debe aparecer en la búsqueda
+(inactivo). search.signals llama a index_instance/remove_instance al guardar
+o eliminar, y el comando rebuild_search_index reconstruye todo el índice.
+"""
+import html
+import logging
+import re
+
+from django.apps import apps
+from django.utils.html import strip_tags
+
+from .models import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def plain_text(*parts):
+    """Une los textos sin HTML ni espacios repetidos"""
+    texts = []
+    for part in parts:
+        if not part:
+            continue
+        text = WHITESPACE_RE.sub(' ', html.unescape(strip_tags(str(part)))).strip()
+        if text:
+            texts.append(text)
+    return '\n'.join(texts)
+
+
+def account_document(account):
+    if not account.is_active:
+        return None
+    return {
+        'title': account.title,
+        'body': plain_text(account.description, account.get_category_display(), account.features, account.requirements),
+        'slug': account.slug,
+    }
+
+
+def loan_document(loan):
+    if not loan.is_active:
+        return None
+    return {
+        'title': loan.title,
+        'body': plain_text(loan.description, loan.loan_type, loan.details, loan.requirements),
+        'slug': loan.slug,
+    }
+
+
+def card_document(card):
+    if not card.is_active:
+        return None
+    return {
+        'title': card.title,
+        'body': plain_text(card.description, card.get_card_type_display(), card.features, card.requirements),
+        'slug': card.slug,
+    }
+
+
+def certificate_document(certificate):
+    if not certificate.is_active:
+        return None
+    return {
+        'title': certificate.title,
+        'body': plain_text(
+            certificate.subtitle, certificate.description, certificate.get_certificate_type_display(),
+            certificate.investment_details, certificate.requirements
+        ),
+        'slug': certificate.slug,
+    }
+
+
+def certificate_faq_document(faq):
+    certificate = faq.certificate
+    if not certificate.is_active:
+        return None
+    return {
+        'title': plain_text(faq.question),
+        'body': plain_text(faq.answer, certificate.title),
+        'slug': certificate.slug,
+    }
+
+
+def news_document(news):
+    if not news.is_active:
+        return None
+    return {
+        'title': news.title,
+        'body': plain_text(news.description, news.category, news.tags, news.full_content),
+        'slug': '',
+    }
+
+
+def promotion_document(promotion):
+    if not promotion.is_active:
+        return None
+    return {
+        'title': promotion.title,
+        'body': plain_text(promotion.description, promotion.category, promotion.tags, promotion.full_content),
+        'slug': '',
+    }
+
+
+def faq_document(faq):
+    if not faq.is_active:
+        return None
+    return {
+        'title': plain_text(faq.question),
+        'body': plain_text(faq.answer),
+        'slug': '',
+    }
+
+
+def saving_tip_document(tip):
+    if not tip.is_active:
+        return None
+    return {
+        'title': tip.title,
+        'body': plain_text(tip.description, tip.content),
+        'slug': '',
+    }
+
+
+def certificate_faqs(certificate):
+    """Las FAQ dependen del estado y el slug de su certificado"""
+    return certificate.certificate_faqs.select_related('certificate')
+
+
+# Modelo -> (tipo, función del documento, select_related para la reconstrucción, dependientes)
+SOURCES = {
+    'products.Account': ('account', account_document, (), None),
+    'products.Loan': ('loan', loan_document, ('loan_type',), None),
+    'products.Card': ('card', card_document, (), None),
+    'products.Certificate': ('certificate', certificate_document, (), certificate_faqs),
+    'products.CertificateFAQ': ('certificate_faq', certificate_faq_document, ('certificate',), None),
+    'news.News': ('news', news_document, (), None),
+    'news.Promotion': ('promotion', promotion_document, (), None),
+    'educacionfinanciera.FAQItem': ('faq', faq_document, (), None),
+    'educacionfinanciera.SavingTip': ('saving_tip', saving_tip_document, (), None),
+}
+
+
+def source_models():
+    """Modelos indexados"""
+    return [apps.get_model(label) for label in SOURCES]
+
+
+def index_instance(instance):
+    """Crea, actualiza o elimina el documento de un objeto según su estado"""
+    source = SOURCES.get(instance._meta.label)
+    if source is None:
+        return
+    kind, build_document, _select_related, dependents = source
+
+    document = build_document(instance)
+    if document is None:
+        SearchDocument.objects.filter(kind=kind, object_id=instance.pk).delete()
+    else:
+        SearchDocument.objects.update_or_create(kind=kind, object_id=instance.pk, defaults=document)
+
+    if dependents is not None:
+        for dependent in dependents(instance):
+            index_instance(dependent)
+
+
+def remove_instance(instance):
+    """Elimina el documento de un objeto borrado"""
+    source = SOURCES.get(instance._meta.label)
+    if source is not None:
+        SearchDocument.objects.filter(kind=source[0], object_id=instance.pk).delete()
+
+
+def rebuild_index(batch_size=500):
+    """
+    Reconstruye el índice completo
+
+    Returns:
+        dict: {tipo: documentos indexados}
+    """
+    SearchDocument.objects.all().delete()
+    counts = {}
+    for label, (kind, build_document, select_related, _dependents) in SOURCES.items():
+        queryset = apps.get_model(label)._default_manager.select_related(*select_related).order_by('pk')
+        batch = []
+        counts[kind] = 0
+        for instance in queryset.iterator(chunk_size=batch_size):
+            document = build_document(instance)
+            if document is None:
+                continue
+            batch.append(SearchDocument(kind=kind, object_id=instance.pk, **document))
+            if len(batch) >= batch_size:
+                SearchDocument.objects.bulk_create(batch)
+                counts[kind] += len(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+            counts[kind] += len(batch)
+    logger.info(f"🔎 Índice de búsqueda reconstruido: {sum(counts.values())} documentos")
+    return counts
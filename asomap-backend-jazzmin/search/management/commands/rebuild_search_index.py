@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from search.indexing import rebuild_index
+from search.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda de productos, noticias, promociones y preguntas frecuentes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--if-empty',
+            action='store_true',
+            help='Solo reconstruye si el índice está vacío (útil al iniciar el contenedor)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Documentos por INSERT (por defecto: 500)'
+        )
+
+    def handle(self, *args, **options):
+        if options['if_empty'] and SearchDocument.objects.exists():
+            self.stdout.write(self.style.WARNING('El índice de búsqueda ya tiene documentos, saltando...'))
+            return
+
+        self.stdout.write('🔎 Reconstruyendo índice de búsqueda...')
+        counts = rebuild_index(batch_size=options['batch_size'])
+        for kind, count in counts.items():
+            self.stdout.write(f'  📄 {kind}: {count}')
+        self.stdout.write(self.style.SUCCESS(f'✅ {sum(counts.values())} documentos indexados'))
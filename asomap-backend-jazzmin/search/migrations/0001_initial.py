@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-18 12:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('account', 'Cuenta'), ('loan', 'Préstamo'), ('card', 'Tarjeta'), ('certificate', 'Certificado'), ('certificate_faq', 'FAQ de Certificado'), ('news', 'Noticia'), ('promotion', 'Promoción'), ('faq', 'Pregunta Frecuente'), ('saving_tip', 'Consejo de Ahorro')], help_text='Tipo de contenido indexado', max_length=30, verbose_name='Tipo')),
+                ('object_id', models.PositiveBigIntegerField(help_text='ID del objeto indexado', verbose_name='ID del objeto')),
+                ('title', models.CharField(max_length=300, verbose_name='Título')),
+                ('body', models.TextField(blank=True, help_text='Texto plano indexado (sin HTML)', verbose_name='Texto')),
+                ('slug', models.CharField(blank=True, help_text='Slug del producto (o del certificado en las FAQ de certificado)', max_length=255, verbose_name='Slug')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Documento de búsqueda',
+                'verbose_name_plural': 'Documentos de búsqueda',
+                'ordering': ['kind', 'object_id'],
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
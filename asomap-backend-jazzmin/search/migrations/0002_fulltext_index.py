@@ -0,0 +1,112 @@
+"""
+Índice invertido sobre search_searchdocument según el motor de base de datos
+
+- SQLite: tabla virtual FTS5 con contenido externo y triggers que la
+  sincronizan con cada INSERT/UPDATE/DELETE de la tabla de documentos.
+- PostgreSQL: configuración de texto asomap_search (español; sin acentos si
+  se puede instalar la extensión unaccent), columna tsvector generada con el
+  título con mayor peso e índice GIN.
+"""
+from django.db import migrations, transaction
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE search_searchdocument_fts USING fts5(
+        title, body,
+        content='search_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_fts_insert AFTER INSERT ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_fts_delete AFTER DELETE ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_fts_update AFTER UPDATE ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_searchdocument_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    "INSERT INTO search_searchdocument_fts(search_searchdocument_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_searchdocument_fts_update",
+    "DROP TRIGGER IF EXISTS search_searchdocument_fts_delete",
+    "DROP TRIGGER IF EXISTS search_searchdocument_fts_insert",
+    "DROP TABLE IF EXISTS search_searchdocument_fts",
+]
+
+POSTGRESQL_UNACCENT = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE TEXT SEARCH CONFIGURATION asomap_search (COPY = spanish)",
+    """
+    ALTER TEXT SEARCH CONFIGURATION asomap_search
+        ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem
+    """,
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE search_searchdocument ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('asomap_search'::regconfig, coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('asomap_search'::regconfig, coalesce(body, '')), 'B')
+        ) STORED
+    """,
+    "CREATE INDEX search_searchdocument_vector_idx ON search_searchdocument USING GIN (search_vector)",
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX IF EXISTS search_searchdocument_vector_idx",
+    "ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS search_vector",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS asomap_search",
+]
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for statement in SQLITE_FORWARD:
+            schema_editor.execute(statement)
+    elif vendor == 'postgresql':
+        try:
+            # unaccent requiere permisos para crear extensiones
+            with transaction.atomic(using=schema_editor.connection.alias):
+                for statement in POSTGRESQL_UNACCENT:
+                    schema_editor.execute(statement)
+        except Exception:
+            schema_editor.execute("CREATE TEXT SEARCH CONFIGURATION asomap_search (COPY = spanish)")
+        for statement in POSTGRESQL_FORWARD:
+            schema_editor.execute(statement)
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        statements = SQLITE_BACKWARD
+    elif vendor == 'postgresql':
+        statements = POSTGRESQL_BACKWARD
+    else:
+        statements = []
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
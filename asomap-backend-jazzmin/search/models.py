@@ -0,0 +1,58 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    Documento del índice de búsqueda: una fila por objeto indexado
+
+    Guarda el texto plano que se busca y se muestra en los fragmentos. El
+    índice invertido (FTS5 en SQLite, tsvector con GIN en PostgreSQL) se crea
+    en la migración 0002 y se mantiene sobre esta tabla.
+    """
+    KIND_CHOICES = [
+        ('account', 'Cuenta'),
+        ('loan', 'Préstamo'),
+        ('card', 'Tarjeta'),
+        ('certificate', 'Certificado'),
+        ('certificate_faq', 'FAQ de Certificado'),
+        ('news', 'Noticia'),
+        ('promotion', 'Promoción'),
+        ('faq', 'Pregunta Frecuente'),
+        ('saving_tip', 'Consejo de Ahorro'),
+    ]
+
+    kind = models.CharField(
+        max_length=30,
+        choices=KIND_CHOICES,
+        verbose_name="Tipo",
+        help_text="Tipo de contenido indexado"
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name="ID del objeto",
+        help_text="ID del objeto indexado"
+    )
+    title = models.CharField(
+        max_length=300,
+        verbose_name="Título"
+    )
+    body = models.TextField(
+        blank=True,
+        verbose_name="Texto",
+        help_text="Texto plano indexado (sin HTML)"
+    )
+    slug = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name="Slug",
+        help_text="Slug del producto (o del certificado en las FAQ de certificado)"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Documento de búsqueda"
+        verbose_name_plural = "Documentos de búsqueda"
+        unique_together = ['kind', 'object_id']
+        ordering = ['kind', 'object_id']
+
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.object_id} - {self.title[:50]}"
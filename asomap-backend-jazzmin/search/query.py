@@ -0,0 +1,143 @@
+"""
+Consultas al índice de búsqueda
+
+- SQLite: tabla virtual FTS5 search_searchdocument_fts, ordenada con bm25
+  (el título pesa más que el texto) y fragmentos con snippet().
+- PostgreSQL: columna search_vector (tsvector generado, índice GIN) con la
+  configuración asomap_search (español sin acentos si la extensión unaccent
+  está disponible), ordenada con ts_rank_cd y fragmentos con ts_headline.
+- Otros motores: icontains sin ranking.
+
+Cada palabra de la consulta se busca como prefijo y deben aparecer todas.
+Los fragmentos se devuelven con HTML escapado y las coincidencias entre
+<mark></mark>.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+
+from .models import SearchDocument
+
+FTS_TABLE = 'search_searchdocument_fts'
+TS_CONFIG = 'asomap_search'
+MAX_TERMS = 8
+SNIPPET_TOKENS = 24
+FALLBACK_SNIPPET_CHARS = 200
+
+# Marcadores temporales (Unicode de uso privado) que se reemplazan por <mark>
+# después de escapar el HTML del fragmento
+MARK_START = '\ue000'
+MARK_END = '\ue001'
+
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def parse_terms(query):
+    """Palabras de la consulta, en minúsculas y sin operadores (se ignoran las de una letra)"""
+    return [term for term in TERM_RE.findall(query.lower()) if len(term) > 1][:MAX_TERMS]
+
+
+def highlight(text):
+    """Escapa el texto y convierte los marcadores en <mark>"""
+    return escape(text or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def _kind_filter(kinds, params, column='d.kind'):
+    if not kinds:
+        return ''
+    params.extend(kinds)
+    return f" AND {column} IN ({', '.join(['%s'] * len(kinds))})"
+
+
+def _search_sqlite(terms, kinds, limit):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    params = [MARK_START, MARK_END, MARK_START, MARK_END, match]
+    sql = (
+        f"SELECT d.kind, d.object_id, d.slug, "
+        f"highlight({FTS_TABLE}, 0, %s, %s), "
+        f"snippet({FTS_TABLE}, 1, %s, %s, '…', {SNIPPET_TOKENS}), "
+        f"-bm25({FTS_TABLE}, 10.0, 1.0) AS score "
+        f"FROM {FTS_TABLE} JOIN search_searchdocument d ON d.id = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH %s"
+    )
+    sql += _kind_filter(kinds, params)
+    sql += " ORDER BY score DESC LIMIT %s"
+    params.append(limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_postgresql(terms, kinds, limit):
+    tsquery = ' & '.join(f'{term}:*' for term in terms)
+    title_options = f'StartSel={MARK_START}, StopSel={MARK_END}, HighlightAll=true'
+    body_options = (
+        f'StartSel={MARK_START}, StopSel={MARK_END}, '
+        f'MaxWords={SNIPPET_TOKENS}, MinWords=10, MaxFragments=2, FragmentDelimiter=" … "'
+    )
+    params = [TS_CONFIG, title_options, TS_CONFIG, body_options, TS_CONFIG, tsquery]
+    sql = (
+        "SELECT d.kind, d.object_id, d.slug, "
+        "ts_headline(%s::regconfig, d.title, q, %s), "
+        "ts_headline(%s::regconfig, d.body, q, %s), "
+        "ts_rank_cd(d.search_vector, q) AS score "
+        "FROM search_searchdocument d, to_tsquery(%s::regconfig, %s) q "
+        "WHERE d.search_vector @@ q"
+    )
+    sql += _kind_filter(kinds, params)
+    sql += " ORDER BY score DESC LIMIT %s"
+    params.append(limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _search_fallback(terms, kinds, limit):
+    documents = SearchDocument.objects.all()
+    for term in terms:
+        documents = documents.filter(Q(title__icontains=term) | Q(body__icontains=term))
+    if kinds:
+        documents = documents.filter(kind__in=kinds)
+    return [
+        (document.kind, document.object_id, document.slug, document.title,
+         document.body[:FALLBACK_SNIPPET_CHARS], 0.0)
+        for document in documents[:limit]
+    ]
+
+
+def search(query, kinds=None, limit=20):
+    """
+    Busca en el índice
+
+    Args:
+        query: Texto ingresado por el usuario
+        kinds: Tipos de SearchDocument a incluir (todos si es None)
+        limit: Cantidad máxima de resultados
+
+    Returns:
+        list: Resultados ordenados por relevancia
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return []
+
+    if connection.vendor == 'sqlite':
+        rows = _search_sqlite(terms, kinds, limit)
+    elif connection.vendor == 'postgresql':
+        rows = _search_postgresql(terms, kinds, limit)
+    else:
+        rows = _search_fallback(terms, kinds, limit)
+
+    return [
+        {
+            'type': kind,
+            'id': object_id,
+            'slug': slug,
+            'title': highlight(title),
+            'snippet': highlight(snippet),
+            'score': round(float(score or 0), 4),
+        }
+        for kind, object_id, slug, title, snippet, score in rows
+    ]
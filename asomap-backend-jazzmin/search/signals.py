@@ -0,0 +1,30 @@
+"""
+Señales de search
+
+Mantienen el índice de búsqueda al día: al guardar un objeto indexado se
+actualiza (o elimina, si quedó inactivo) su documento, y al eliminarlo se
+borra. Las cargas masivas con bulk_create no disparan señales; después de
+ellas se ejecuta manage.py rebuild_search_index.
+"""
+from django.db.models.signals import post_delete, post_save
+
+from .indexing import SOURCES, index_instance, remove_instance, source_models
+
+
+def update_search_document(sender, instance, raw=False, **kwargs):
+    """Actualiza el documento del objeto guardado"""
+    if raw:
+        return
+    index_instance(instance)
+
+
+def delete_search_document(sender, instance, **kwargs):
+    """Elimina el documento del objeto borrado"""
+    remove_instance(instance)
+
+
+def connect_signals():
+    """Conecta las señales para cada modelo de search.indexing.SOURCES"""
+    for label, model in zip(SOURCES, source_models()):
+        post_save.connect(update_search_document, sender=model, dispatch_uid=f'search_index_save_{label}')
+        post_delete.connect(delete_search_document, sender=model, dispatch_uid=f'search_index_delete_{label}')
@@ -0,0 +1,51 @@
+from django.test import TestCase
+
+from educacionfinanciera.models import FAQItem, SavingTip
+
+
+class SearchApiTests(TestCase):
+    """
+    Verifica que las señales mantienen el índice al día y que /api/search/
+    ordena por relevancia y resalta las coincidencias sin HTML del usuario.
+    """
+
+    def setUp(self):
+        self.tip = SavingTip.objects.create(
+            title='Ahorro programado',
+            description='Separe una parte fija de su salario cada mes',
+            content='<p>El <strong>ahorro programado</strong> evita gastos impulsivos.</p>',
+            link='https://asomap.com.do'
+        )
+        self.faq = FAQItem.objects.create(
+            question='¿Cuánto debo guardar?',
+            answer='Se recomienda destinar al ahorro el 20% de los ingresos.'
+        )
+
+    def search(self, **params):
+        response = self.client.get('/api/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_ranks_title_matches_and_highlights(self):
+        results = self.search(q='ahorro')
+
+        self.assertEqual([result['type'] for result in results], ['saving_tip', 'faq'])
+        self.assertEqual(results[0]['title'], '<mark>Ahorro</mark> programado')
+        self.assertIn('<mark>ahorro</mark>', results[1]['snippet'])
+        self.assertNotIn('<strong>', results[0]['snippet'])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.tip.is_active = False
+        self.tip.save()
+        self.assertEqual([result['type'] for result in self.search(q='ahorro')], ['faq'])
+
+        self.faq.answer = 'Depende de sus ingresos.'
+        self.faq.save()
+        self.assertEqual(self.search(q='ahorro'), [])
+
+        self.faq.delete()
+        self.assertEqual(self.search(q='ingresos'), [])
+
+    def test_requires_query(self):
+        self.assertEqual(self.client.get('/api/search/').status_code, 400)
+        self.assertEqual(self.client.get('/api/search/', {'q': 'ahorro', 'type': 'otro'}).status_code, 400)
@@ -0,0 +1,70 @@
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from core.query_budget import query_budget
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .models import SearchDocument
+from .query import search
+
+SEARCH_MIN_LENGTH = 2
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+SEARCH_TYPES = [kind for kind, _label in SearchDocument.KIND_CHOICES]
+
+
+class SearchViewSet(viewsets.ViewSet):
+    """
+    ViewSet para la búsqueda de texto completo en productos, noticias,
+    promociones y preguntas frecuentes
+    """
+
+    @extend_schema(
+        summary="Buscar contenido",
+        description="Busca en cuentas, préstamos, tarjetas, certificados, noticias, promociones, "
+                    "preguntas frecuentes y consejos de ahorro. Los resultados se ordenan por "
+                    "relevancia e incluyen un fragmento con las coincidencias entre <mark></mark>.",
+        parameters=[
+            OpenApiParameter('q', str, required=True, description=f'Texto a buscar (mínimo {SEARCH_MIN_LENGTH} caracteres)'),
+            OpenApiParameter('type', str, description=f"Tipos separados por comas: {', '.join(SEARCH_TYPES)}"),
+            OpenApiParameter('limit', int, description=f'Cantidad máxima de resultados (por defecto {SEARCH_DEFAULT_LIMIT}, máximo {SEARCH_MAX_LIMIT})'),
+        ],
+        responses={200: None, 400: None},
+        tags=['search']
+    )
+    @query_budget(1)
+    def list(self, request):
+        """
+        Buscar contenido
+
+        Consulta el índice invertido (ver search.query); una sola consulta SQL
+        por búsqueda.
+        """
+        query = request.query_params.get('q', '').strip()
+        if len(query) < SEARCH_MIN_LENGTH:
+            return Response(
+                {'error': f'El parámetro q es requerido (mínimo {SEARCH_MIN_LENGTH} caracteres)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        kinds = [kind for kind in request.query_params.get('type', '').split(',') if kind]
+        invalid = [kind for kind in kinds if kind not in SEARCH_TYPES]
+        if invalid:
+            return Response(
+                {'error': f"Tipo de contenido inválido: {', '.join(invalid)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get('limit', SEARCH_DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {'error': 'El parámetro limit debe ser numérico'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+
+        results = search(query, kinds=kinds or None, limit=limit)
+        return Response({
+            'query': query,
+            'count': len(results),
+            'results': results
+        })
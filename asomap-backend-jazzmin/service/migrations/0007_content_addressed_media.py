@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:10
+
+import core.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('service', '0006_change_steps_to_prose_editor'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='serviceinfo',
+            name='image',
+            field=models.ImageField(blank=True, help_text='Imagen representativa del servicio', null=True, storage=core.storage.media_storage, upload_to='services/', verbose_name='Imagen'),
+        ),
+        migrations.AlterField(
+            model_name='serviceinfo',
+            name='pdf_file',
+            field=models.FileField(blank=True, help_text='Archivo PDF relacionado con el servicio', null=True, storage=core.storage.media_storage, upload_to='services/pdfs/', verbose_name='Archivo PDF'),
+        ),
+    ]
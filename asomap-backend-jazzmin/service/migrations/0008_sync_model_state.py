@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('service', '0007_content_addressed_media'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='serviceinfo',
+            name='steps',
+            field=models.TextField(help_text='Pasos para usar el servicio (puedes usar listas con viñetas)', verbose_name='Pasos'),
+        ),
+    ]
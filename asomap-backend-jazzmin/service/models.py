@@ -1,5 +1,6 @@
 from django.db import models
 from django_prose_editor.fields import ProseEditorField
+from core.storage import media_storage
 
 
 class ServicesPage(models.Model):
@@ -94,6 +95,7 @@ class ServiceInfo(models.Model):
     )
     image = models.ImageField(
         upload_to='services/',
+        storage=media_storage,
         blank=True,
         null=True,
         verbose_name="Imagen",
@@ -108,6 +110,7 @@ class ServiceInfo(models.Model):
     )
     pdf_file = models.FileField(
         upload_to='services/pdfs/',
+        storage=media_storage,
         blank=True,
         null=True,
         verbose_name="Archivo PDF",
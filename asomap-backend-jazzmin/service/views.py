@@ -1,15 +1,17 @@
 from rest_framework import viewsets
+from core.mixins import ConditionalGetMixin
 from .models import ServicesPage, ServiceInfo
 from .serializers import ServicesPageSerializer, ServiceInfoSerializer
 
 
-class ServicesPageViewSet(viewsets.ReadOnlyModelViewSet):
+class ServicesPageViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar la página de servicios bancarios
     Solo permite lectura (GET)
     """
     queryset = ServicesPage.objects.filter(is_active=True)
     serializer_class = ServicesPageSerializer
+    conditional_related_models = ('service.ServiceInfo',)
     
     def get_queryset(self):
         """Retorna solo la página activa con sus servicios"""
@@ -21,7 +23,7 @@ class ServicesPageViewSet(viewsets.ReadOnlyModelViewSet):
         ).distinct()
 
 
-class ServiceInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceInfoViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para manejar información detallada de servicios
     Solo permite lectura (GET)
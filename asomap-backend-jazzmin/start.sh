@@ -146,6 +146,9 @@ create_superuser
 # Crear datos iniciales si no existen
 create_initial_data
 
+# Construir el índice de búsqueda si está vacío
+python manage.py rebuild_search_index --if-empty || echo "⚠️  Error en rebuild_search_index"
+
 echo "🎉 Backend Django iniciado correctamente!"
 echo "🌐 Servidor disponible en http://0.0.0.0:8000"
 
@@ -0,0 +1,49 @@
+from django.contrib import admin
+
+from .chunks import discard_temp_file
+from .models import ChunkedUpload
+
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    """Admin para las subidas por partes - Solo lectura"""
+
+    list_display = [
+        'filename', 'target', 'object_id', 'progress_display', 'status',
+        'created_by', 'created_at', 'completed_at'
+    ]
+
+    list_filter = ['status', 'target', 'created_at']
+
+    search_fields = ['filename', 'file', 'checksum']
+
+    readonly_fields = [
+        'id', 'target', 'object_id', 'filename', 'size', 'offset', 'checksum',
+        'status', 'file', 'error_message', 'created_by', 'created_at',
+        'updated_at', 'completed_at'
+    ]
+
+    ordering = ['-created_at']
+
+    def has_add_permission(self, request):
+        """Las subidas se crean desde /api/uploads/"""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """No permitir editar subidas desde el admin"""
+        return False
+
+    def delete_model(self, request, obj):
+        """Elimina también los fragmentos recibidos"""
+        discard_temp_file(obj)
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        for upload in queryset:
+            discard_temp_file(upload)
+        super().delete_queryset(request, queryset)
+
+    def progress_display(self, obj):
+        """Muestra el porcentaje recibido"""
+        return f"{obj.progress}%"
+    progress_display.short_description = 'Progreso'
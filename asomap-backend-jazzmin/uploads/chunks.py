@@ -0,0 +1,208 @@
+"""
+Escritura de fragmentos y ensamblado de las subidas por partes
+
+Cada petición escribe un solo fragmento directamente en su posición del
+archivo temporal (sin ensamblar partes al final), así que un worker de
+gunicorn solo queda ocupado mientras llega ese fragmento. Un bloqueo
+flock por subida evita que dos peticiones escriban a la vez el mismo
+archivo.
+"""
+import base64
+import binascii
+import fcntl
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from core.jobs import enqueue
+
+from .models import ChunkedUpload
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 64 * 1024
+PDF_SIGNATURE = b'%PDF-'
+
+
+class UploadError(Exception):
+    """Error de una subida por partes, con el código HTTP a devolver"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class AssembledFile(File):
+    """
+    Archivo temporal ya completo
+
+    FileSystemStorage mueve (rename) los archivos que exponen
+    temporary_file_path() en lugar de copiarlos byte a byte.
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def parse_checksum_header(value):
+    """
+    Interpreta la cabecera Upload-Checksum ('sha256 <base64>')
+
+    Returns:
+        bytes | None: Digest esperado del fragmento
+    """
+    if not value:
+        return None
+    algorithm, _, encoded = value.strip().partition(' ')
+    if algorithm.lower() != 'sha256':
+        raise UploadError('Upload-Checksum solo admite sha256')
+    try:
+        return base64.b64decode(encoded, validate=True)
+    except (binascii.Error, ValueError):
+        raise UploadError('Upload-Checksum no es base64 válido')
+
+
+def file_checksum(path):
+    """Suma SHA-256 (hexadecimal) de un archivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_chunk(upload, stream, offset, length, chunk_digest=None):
+    """
+    Escribe un fragmento en el archivo temporal y avanza el offset
+
+    Args:
+        stream: Cuerpo de la petición (se lee en bloques, sin cargarlo en memoria)
+        offset: Cabecera Upload-Offset enviada por el cliente
+        length: Content-Length del fragmento
+        chunk_digest: SHA-256 esperado del fragmento (opcional)
+
+    Raises:
+        UploadError: Si el fragmento no corresponde al estado de la subida
+    """
+    if upload.status != 'uploading':
+        raise UploadError('La subida ya terminó', status=409)
+    if offset != upload.offset:
+        raise UploadError(f'Offset inválido: se esperaba {upload.offset}', status=409)
+    if length is None:
+        raise UploadError('Se requiere Content-Length', status=411)
+
+    chunk_size = settings.CHUNKED_UPLOAD_CHUNK_SIZE
+    if offset + length > upload.size:
+        raise UploadError('El fragmento excede el tamaño declarado de la subida')
+    if length == 0 or length > chunk_size or (length != chunk_size and offset + length != upload.size):
+        raise UploadError(f'Los fragmentos deben medir {chunk_size} bytes (salvo el último)')
+
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+    fd = os.open(upload.temp_path, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, 'r+b') as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadError('Ya se está recibiendo otro fragmento de esta subida', status=409)
+
+        # Otro proceso pudo avanzar la subida antes de obtener el bloqueo
+        current = ChunkedUpload.objects.filter(pk=upload.pk).values_list('offset', flat=True).first()
+        if current != offset:
+            raise UploadError(f'Offset inválido: se esperaba {current}', status=409)
+
+        digest = hashlib.sha256()
+        handle.seek(offset)
+        remaining = length
+        while remaining:
+            block = stream.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            handle.write(block)
+            digest.update(block)
+            remaining -= len(block)
+
+        if remaining:
+            raise UploadError('El fragmento llegó incompleto; reenvíelo desde el mismo offset')
+        if chunk_digest is not None and digest.digest() != chunk_digest:
+            raise UploadError('La suma de verificación del fragmento no coincide')
+
+        handle.flush()
+        os.fsync(handle.fileno())
+        upload.offset = offset + length
+        upload.updated_at = timezone.now()
+        ChunkedUpload.objects.filter(pk=upload.pk).update(offset=upload.offset, updated_at=upload.updated_at)
+
+
+def fail(upload, message):
+    """
+    Marca la subida como fallida y elimina el archivo temporal
+
+    Returns:
+        UploadError: Error a lanzar por quien llama
+    """
+    upload.status = 'failed'
+    upload.error_message = message
+    upload.save(update_fields=['status', 'error_message', 'updated_at'])
+    discard_temp_file(upload)
+    logger.warning(f"⚠️ Subida {upload.pk} ({upload.filename}) fallida: {message}")
+    return UploadError(message)
+
+
+def request_verification(upload):
+    """
+    Encola la verificación de una subida que ya recibió todos sus fragmentos
+
+    Calcular la suma SHA-256 de un archivo de cientos de MB ocuparía al
+    worker de gunicorn; la tarea uploads.verify_checksum la hace en run_jobs.
+    """
+    upload.status = 'verifying'
+    upload.save(update_fields=['status', 'updated_at'])
+    enqueue('uploads.verify_checksum', upload_id=str(upload.pk))
+
+
+def complete(upload):
+    """
+    Verifica el archivo completo y lo asigna al registro destino
+
+    El registro se guarda con el archivo nuevo, lo que dispara las tareas
+    en segundo plano habituales (ver core.jobs).
+    """
+    path = upload.temp_path
+    if file_checksum(path) != upload.checksum:
+        raise fail(upload, 'La suma SHA-256 del archivo no coincide con la declarada')
+    with open(path, 'rb') as handle:
+        if handle.read(len(PDF_SIGNATURE)) != PDF_SIGNATURE:
+            raise fail(upload, 'El archivo no es un PDF válido')
+
+    instance = upload.target_model._default_manager.filter(pk=upload.object_id).first()
+    if instance is None:
+        raise fail(upload, 'El registro destino ya no existe')
+
+    field_file = getattr(instance, upload.field_name)
+    try:
+        with transaction.atomic(), open(path, 'rb') as handle:
+            field_file.save(upload.filename, AssembledFile(handle, name=upload.filename))
+    except ValidationError as e:
+        if field_file.name and field_file.storage.exists(field_file.name):
+            field_file.storage.delete(field_file.name)
+        raise fail(upload, '; '.join(e.messages))
+
+    upload.status = 'complete'
+    upload.file = field_file.name
+    upload.completed_at = timezone.now()
+    upload.save(update_fields=['status', 'file', 'completed_at', 'updated_at'])
+    discard_temp_file(upload)
+    logger.info(f"✅ Subida {upload.pk} completada: {upload.file} ({upload.size / (1024*1024):.2f} MB)")
+
+
+def discard_temp_file(upload):
+    try:
+        os.remove(upload.temp_path)
+    except FileNotFoundError:
+        pass
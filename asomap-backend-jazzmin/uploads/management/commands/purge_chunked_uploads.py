@@ -0,0 +1,47 @@
+"""
+Elimina las subidas por partes abandonadas
+
+Borra los registros 'uploading' sin fragmentos nuevos desde hace más de
+CHUNKED_UPLOAD_EXPIRATION horas, los 'failed' y los 'verifying' cuya tarea
+nunca terminó con la misma antigüedad y los
+archivos de CHUNKED_UPLOAD_DIR que ya no pertenecen a ninguna subida.
+Pensado para ejecutarse periódicamente (cron).
+"""
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from uploads.chunks import discard_temp_file
+from uploads.models import ChunkedUpload
+
+
+class Command(BaseCommand):
+    help = 'Elimina las subidas por partes abandonadas y sus fragmentos temporales'
+
+    def handle(self, *args, **options):
+        limit = timezone.now() - timedelta(hours=settings.CHUNKED_UPLOAD_EXPIRATION)
+        expired = ChunkedUpload.objects.filter(status__in=['uploading', 'verifying', 'failed'], updated_at__lt=limit)
+
+        count = 0
+        for upload in expired.iterator():
+            discard_temp_file(upload)
+            count += 1
+        expired.delete()
+
+        orphans = 0
+        if os.path.isdir(settings.CHUNKED_UPLOAD_DIR):
+            active = {
+                str(pk) for pk in
+                ChunkedUpload.objects.filter(status__in=['uploading', 'verifying']).values_list('pk', flat=True)
+            }
+            for name in os.listdir(settings.CHUNKED_UPLOAD_DIR):
+                if name.endswith('.part') and name[:-len('.part')] not in active:
+                    os.remove(os.path.join(settings.CHUNKED_UPLOAD_DIR, name))
+                    orphans += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ {count} subidas abandonadas eliminadas, {orphans} archivos huérfanos')
+        )
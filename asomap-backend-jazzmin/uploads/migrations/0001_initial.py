@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('target', models.CharField(choices=[('about.FinancialDocument', 'Documento Financiero'), ('about.MemoryDocument', 'Documento de Memoria'), ('about.PolicyDocument', 'Documento de Política'), ('prousuario.YearlyDocument', 'Documento Anual'), ('prousuario.Contract', 'Contrato')], help_text='Modelo al que se asigna el archivo', max_length=100, verbose_name='Destino')),
+                ('object_id', models.PositiveIntegerField(help_text='Registro del modelo destino que recibe el archivo', verbose_name='ID del registro')),
+                ('filename', models.CharField(max_length=255, verbose_name='Nombre del archivo')),
+                ('size', models.PositiveBigIntegerField(verbose_name='Tamaño (bytes)')),
+                ('offset', models.PositiveBigIntegerField(default=0, help_text='Posición desde la que se espera el próximo fragmento', verbose_name='Bytes recibidos')),
+                ('checksum', models.CharField(help_text='Suma SHA-256 (hexadecimal) del archivo completo', max_length=64, verbose_name='SHA-256')),
+                ('status', models.CharField(choices=[('uploading', 'Subiendo'), ('complete', 'Completada'), ('failed', 'Fallida')], default='uploading', max_length=20, verbose_name='Estado')),
+                ('file', models.CharField(blank=True, help_text='Nombre del archivo en el storage una vez completada', max_length=255, verbose_name='Archivo guardado')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='Mensaje de Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Último fragmento')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de finalización')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='chunked_uploads', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Subida por Partes',
+                'verbose_name_plural': 'Subidas por Partes',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='uploads_chu_status_26d7cd_idx')],
+            },
+        ),
+    ]
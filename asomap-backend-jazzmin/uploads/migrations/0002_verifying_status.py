@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chunkedupload',
+            name='status',
+            field=models.CharField(choices=[('uploading', 'Subiendo'), ('verifying', 'Verificando'), ('complete', 'Completada'), ('failed', 'Fallida')], default='uploading', max_length=20, verbose_name='Estado'),
+        ),
+    ]
@@ -0,0 +1,125 @@
+import os
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+
+# Campos de archivo que admiten subida por partes (modelo -> campo)
+UPLOAD_TARGETS = {
+    'about.FinancialDocument': 'file',
+    'about.MemoryDocument': 'file',
+    'about.PolicyDocument': 'file',
+    'prousuario.YearlyDocument': 'document',
+    'prousuario.Contract': 'document',
+}
+
+TARGET_CHOICES = [
+    ('about.FinancialDocument', 'Documento Financiero'),
+    ('about.MemoryDocument', 'Documento de Memoria'),
+    ('about.PolicyDocument', 'Documento de Política'),
+    ('prousuario.YearlyDocument', 'Documento Anual'),
+    ('prousuario.Contract', 'Contrato'),
+]
+
+
+class ChunkedUpload(models.Model):
+    """
+    Subida reanudable de un documento por fragmentos (estilo tus)
+
+    Los fragmentos se escriben en CHUNKED_UPLOAD_DIR en la posición indicada
+    por `offset`; al recibir el último la subida pasa a 'verifying' y la
+    tarea uploads.verify_checksum verifica la suma SHA-256 y asigna el
+    archivo al campo del registro destino.
+    """
+
+    STATUS_CHOICES = [
+        ('uploading', 'Subiendo'),
+        ('verifying', 'Verificando'),
+        ('complete', 'Completada'),
+        ('failed', 'Fallida'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    target = models.CharField(
+        max_length=100,
+        choices=TARGET_CHOICES,
+        verbose_name="Destino",
+        help_text="Modelo al que se asigna el archivo"
+    )
+    object_id = models.PositiveIntegerField(
+        verbose_name="ID del registro",
+        help_text="Registro del modelo destino que recibe el archivo"
+    )
+    filename = models.CharField(max_length=255, verbose_name="Nombre del archivo")
+    size = models.PositiveBigIntegerField(verbose_name="Tamaño (bytes)")
+    offset = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name="Bytes recibidos",
+        help_text="Posición desde la que se espera el próximo fragmento"
+    )
+    checksum = models.CharField(
+        max_length=64,
+        verbose_name="SHA-256",
+        help_text="Suma SHA-256 (hexadecimal) del archivo completo"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='uploading',
+        verbose_name="Estado"
+    )
+    file = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name="Archivo guardado",
+        help_text="Nombre del archivo en el storage una vez completada"
+    )
+    error_message = models.TextField(blank=True, null=True, verbose_name="Mensaje de Error")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='chunked_uploads',
+        verbose_name="Usuario"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de creación")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Último fragmento")
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name="Fecha de finalización")
+
+    class Meta:
+        verbose_name = "Subida por Partes"
+        verbose_name_plural = "Subidas por Partes"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} ({self.get_status_display()})"
+
+    @property
+    def field_name(self):
+        return UPLOAD_TARGETS[self.target]
+
+    @property
+    def target_model(self):
+        return apps.get_model(self.target)
+
+    @property
+    def temp_path(self):
+        """Archivo temporal donde se acumulan los fragmentos"""
+        return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{self.pk}.part')
+
+    @property
+    def expires_at(self):
+        """Momento a partir del cual una subida sin terminar se descarta"""
+        if self.status != 'uploading' or not self.updated_at:
+            return None
+        return self.updated_at + timedelta(hours=settings.CHUNKED_UPLOAD_EXPIRATION)
+
+    @property
+    def progress(self):
+        return round(self.offset * 100 / self.size, 1) if self.size else 0
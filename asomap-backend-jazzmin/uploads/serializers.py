@@ -0,0 +1,66 @@
+import os
+import re
+from typing import Optional
+
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import ChunkedUpload
+
+SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    """Estado de una subida por partes"""
+    progress = serializers.FloatField(read_only=True)
+    chunk_size = serializers.SerializerMethodField()
+    expires_at = serializers.DateTimeField(read_only=True)
+    file_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ChunkedUpload
+        fields = [
+            'id', 'target', 'object_id', 'filename', 'size', 'offset', 'progress',
+            'chunk_size', 'checksum', 'status', 'file_url', 'error_message',
+            'created_at', 'expires_at'
+        ]
+
+    def get_chunk_size(self, obj) -> int:
+        return settings.CHUNKED_UPLOAD_CHUNK_SIZE
+
+    def get_file_url(self, obj) -> Optional[str]:
+        if not obj.file:
+            return None
+        return obj.target_model._meta.get_field(obj.field_name).storage.url(obj.file)
+
+
+class ChunkedUploadCreateSerializer(serializers.ModelSerializer):
+    """Datos para iniciar una subida por partes"""
+
+    class Meta:
+        model = ChunkedUpload
+        fields = ['target', 'object_id', 'filename', 'size', 'checksum']
+
+    def validate_filename(self, value):
+        value = os.path.basename(value.replace('\\', '/')).strip()
+        if not value.lower().endswith('.pdf'):
+            raise serializers.ValidationError('Solo se admiten archivos PDF')
+        return value
+
+    def validate_size(self, value):
+        if value < 1 or value > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            max_mb = settings.CHUNKED_UPLOAD_MAX_SIZE / (1024 * 1024)
+            raise serializers.ValidationError(f'El tamaño debe estar entre 1 byte y {max_mb:.0f} MB')
+        return value
+
+    def validate_checksum(self, value):
+        value = value.lower()
+        if not SHA256_PATTERN.match(value):
+            raise serializers.ValidationError('Debe ser la suma SHA-256 en hexadecimal (64 caracteres)')
+        return value
+
+    def validate(self, attrs):
+        model = ChunkedUpload(target=attrs['target']).target_model
+        if not model._default_manager.filter(pk=attrs['object_id']).exists():
+            raise serializers.ValidationError({'object_id': f'No existe {model._meta.verbose_name} con ese ID'})
+        return attrs
@@ -0,0 +1,28 @@
+"""
+Tareas en segundo plano de uploads (ver core.jobs)
+"""
+from core.jobs import task
+
+from .chunks import UploadError, complete
+from .models import ChunkedUpload
+
+
+@task('uploads.verify_checksum')
+def verify_checksum(upload_id):
+    """
+    Verifica la suma SHA-256 de una subida por partes y asigna el archivo
+
+    Un archivo que no coincide no se reintenta: la subida queda 'failed'
+    con el motivo en error_message.
+
+    Returns:
+        str: Estado final de la subida
+    """
+    upload = ChunkedUpload.objects.filter(pk=upload_id, status='verifying').first()
+    if upload is None:
+        return None
+    try:
+        complete(upload)
+    except UploadError:
+        pass
+    return upload.status
@@ -0,0 +1,130 @@
+import hashlib
+import os
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+from about.models import MemoryDocument
+from core.jobs import claim_due_jobs, run_job
+from core.models import Job
+from core.testing import MediaTestCase
+
+from .models import ChunkedUpload
+
+CHUNK_CONTENT_TYPE = 'application/offset+octet-stream'
+
+
+@override_settings(JOBS_ASYNC=True)
+class ChunkedUploadApiTests(MediaTestCase):
+    """
+    Verifica que /api/uploads/ acepta fragmentos de tamaño fijo en orden,
+    permite reanudar desde el offset guardado y asigna el PDF al registro
+    solo si la suma SHA-256 coincide (verificada por la tarea
+    uploads.verify_checksum).
+    """
+
+    def extra_settings(self):
+        return {
+            'CHUNKED_UPLOAD_DIR': os.path.join(self.tmp, 'chunks'),
+            'CHUNKED_UPLOAD_CHUNK_SIZE': 1024,
+        }
+
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_superuser('admin', 'admin@asomap.com', 'clave-segura')
+        self.client.force_login(self.admin)
+        self.document = MemoryDocument.objects.create(year='2024')
+        self.content = b'%PDF-1.4\n' + os.urandom(2500)
+
+    def start(self, checksum=None):
+        response = self.client.post('/api/uploads/', {
+            'target': 'about.MemoryDocument',
+            'object_id': self.document.pk,
+            'filename': 'memoria-2024.pdf',
+            'size': len(self.content),
+            'checksum': checksum or hashlib.sha256(self.content).hexdigest(),
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        return response['Location']
+
+    def finish(self, url, offset):
+        """Envía el último fragmento y ejecuta la verificación encolada"""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.send(url, offset)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], 'verifying')
+        for job in claim_due_jobs():
+            self.assertTrue(run_job(job))
+        return self.client.get(url)
+
+    def send(self, url, offset, size=1024):
+        return self.client.patch(
+            url, self.content[offset:offset + size],
+            content_type=CHUNK_CONTENT_TYPE, HTTP_UPLOAD_OFFSET=str(offset)
+        )
+
+    def test_resumable_upload_attaches_file(self):
+        url = self.start()
+
+        self.assertEqual(self.send(url, 0).json()['offset'], 1024)
+        # Un fragmento repetido (ej. reintento tras un corte) no avanza la subida
+        self.assertEqual(self.send(url, 0).status_code, 409)
+        self.assertEqual(self.send(url, 1024, size=100).status_code, 400)
+
+        response = self.client.head(url)
+        self.assertEqual(response['Upload-Offset'], '1024')
+
+        self.send(url, 1024)
+        response = self.finish(url, 2048)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'complete')
+
+        self.document.refresh_from_db()
+        self.assertTrue(self.document.file.name.startswith('memory_documents/memoria-2024'))
+        with self.document.file.open('rb') as handle:
+            self.assertEqual(handle.read(), self.content)
+        self.assertEqual(os.listdir(os.path.join(self.tmp, 'chunks')), [])
+
+    @override_settings(JOBS_ASYNC=False)
+    def test_inline_verification_without_worker(self):
+        url = self.start()
+        self.send(url, 0)
+        self.send(url, 1024)
+
+        # Sin worker la verificación se ejecuta al confirmar la transacción
+        with self.captureOnCommitCallbacks(execute=True):
+            self.send(url, 2048)
+
+        self.assertEqual(claim_due_jobs(), [])
+        response = self.client.get(url)
+        self.assertEqual(response.json()['status'], 'complete')
+        self.assertEqual(Job.objects.get(task='uploads.verify_checksum').status, 'done')
+        self.document.refresh_from_db()
+        with self.document.file.open('rb') as handle:
+            self.assertEqual(handle.read(), self.content)
+
+    def test_checksum_mismatch_fails_upload(self):
+        url = self.start(checksum='0' * 64)
+        for offset in (0, 1024):
+            self.send(url, offset)
+
+        response = self.finish(url, 2048)
+
+        self.assertEqual(response.json()['status'], 'failed')
+        upload = ChunkedUpload.objects.get()
+        self.assertIn('SHA-256', upload.error_message)
+        self.document.refresh_from_db()
+        self.assertFalse(self.document.file)
+        self.assertEqual(os.listdir(os.path.join(self.tmp, 'chunks')), [])
+
+    def test_requires_change_permission(self):
+        staff = User.objects.create_user('editor', 'editor@asomap.com', 'clave-segura', is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.post('/api/uploads/', {
+            'target': 'about.MemoryDocument', 'object_id': self.document.pk,
+            'filename': 'memoria.pdf', 'size': 10, 'checksum': '0' * 64,
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+
+        self.client.logout()
+        self.assertEqual(self.client.post('/api/uploads/', {}).status_code, 401)
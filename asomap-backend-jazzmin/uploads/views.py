@@ -0,0 +1,155 @@
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import permissions, status, viewsets
+from rest_framework.response import Response
+
+from .chunks import UploadError, discard_temp_file, parse_checksum_header, request_verification, write_chunk
+from .models import ChunkedUpload
+from .serializers import ChunkedUploadCreateSerializer, ChunkedUploadSerializer
+
+CHUNK_CONTENT_TYPE = 'application/offset+octet-stream'
+
+
+class ChunkedUploadViewSet(viewsets.ViewSet):
+    """
+    ViewSet para subir documentos grandes por fragmentos (estilo tus)
+
+    1. POST /api/uploads/ con el destino, el tamaño y la suma SHA-256.
+    2. PATCH /api/uploads/{id}/ por cada fragmento, con la cabecera
+       Upload-Offset y el cuerpo en application/offset+octet-stream.
+    3. Si la conexión se corta, HEAD/GET /api/uploads/{id}/ devuelve el
+       offset desde el que continuar.
+    4. El último fragmento responde 202 con status 'verifying'; GET
+       /api/uploads/{id}/ indica cuándo pasa a 'complete' o 'failed'.
+
+    Solo para usuarios staff con permiso de modificación sobre el modelo destino.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    lookup_value_regex = '[0-9a-f-]{36}'
+
+    def get_upload(self, request, pk):
+        queryset = ChunkedUpload.objects.all()
+        if not request.user.is_superuser:
+            queryset = queryset.filter(created_by=request.user)
+        return get_object_or_404(queryset, pk=pk)
+
+    def upload_response(self, upload, status_code=status.HTTP_200_OK):
+        response = Response(ChunkedUploadSerializer(upload).data, status=status_code)
+        response['Upload-Offset'] = str(upload.offset)
+        response['Upload-Length'] = str(upload.size)
+        response['Cache-Control'] = 'no-store'
+        return response
+
+    @extend_schema(
+        summary="Iniciar subida por partes",
+        description="Registra una subida reanudable de un PDF para FinancialDocument, MemoryDocument, "
+                    "PolicyDocument, YearlyDocument o Contract. La respuesta indica el tamaño de "
+                    "fragmento (chunk_size) que se debe usar.",
+        request=ChunkedUploadCreateSerializer,
+        responses={201: ChunkedUploadSerializer, 400: None, 403: None},
+        tags=['uploads']
+    )
+    def create(self, request):
+        """Iniciar subida por partes"""
+        serializer = ChunkedUploadCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        model = ChunkedUpload(target=serializer.validated_data['target']).target_model
+        if not request.user.has_perm(f'{model._meta.app_label}.change_{model._meta.model_name}'):
+            return Response(
+                {'error': f'No tiene permiso para modificar {model._meta.verbose_name_plural}'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        upload = serializer.save(created_by=request.user)
+        response = self.upload_response(upload, status.HTTP_201_CREATED)
+        response['Location'] = reverse('chunked-upload-detail', args=[upload.pk])
+        return response
+
+    @extend_schema(
+        summary="Estado de una subida por partes",
+        description="Devuelve el offset recibido (también en la cabecera Upload-Offset) para reanudar la subida.",
+        responses={200: ChunkedUploadSerializer, 404: None},
+        tags=['uploads']
+    )
+    def retrieve(self, request, pk=None):
+        """Estado de una subida por partes"""
+        return self.upload_response(self.get_upload(request, pk))
+
+    @extend_schema(
+        summary="Enviar un fragmento",
+        description="Escribe un fragmento de chunk_size bytes (el último puede ser menor) en la posición "
+                    "Upload-Offset. Al recibir el último se responde 202 y la suma SHA-256 se verifica "
+                    "en segundo plano antes de asignar el archivo al registro destino.",
+        parameters=[
+            OpenApiParameter('Upload-Offset', int, OpenApiParameter.HEADER, required=True,
+                             description='Posición del fragmento; debe coincidir con el offset actual'),
+            OpenApiParameter('Upload-Checksum', str, OpenApiParameter.HEADER,
+                             description="Suma del fragmento: 'sha256 <base64>' (opcional)"),
+        ],
+        request={CHUNK_CONTENT_TYPE: OpenApiTypes.BINARY},
+        responses={200: ChunkedUploadSerializer, 202: ChunkedUploadSerializer, 400: None, 409: None, 415: None},
+        tags=['uploads']
+    )
+    def partial_update(self, request, pk=None):
+        """
+        Enviar un fragmento
+
+        El cuerpo se lee en bloques directamente al archivo temporal; nunca
+        se carga el fragmento completo en memoria.
+        """
+        upload = self.get_upload(request, pk)
+        if request.content_type != CHUNK_CONTENT_TYPE:
+            return Response(
+                {'error': f'El fragmento debe enviarse como {CHUNK_CONTENT_TYPE}'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.META['CONTENT_LENGTH']) if request.META.get('CONTENT_LENGTH') else None
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'Se requiere la cabecera Upload-Offset numérica'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            chunk_digest = parse_checksum_header(request.headers.get('Upload-Checksum'))
+            write_chunk(upload, request.stream, offset, length, chunk_digest)
+        except UploadError as e:
+            response = Response({'error': str(e), 'offset': upload.offset}, status=e.status)
+            response['Upload-Offset'] = str(upload.offset)
+            return response
+
+        if upload.offset < upload.size:
+            return self.upload_response(upload)
+
+        request_verification(upload)
+        # Con JOBS_ASYNC=False la verificación ya se ejecutó
+        upload.refresh_from_db()
+        if upload.status == 'failed':
+            response = Response(
+                {'error': upload.error_message, 'offset': upload.offset},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+            response['Upload-Offset'] = str(upload.offset)
+            return response
+        return self.upload_response(
+            upload, status.HTTP_202_ACCEPTED if upload.status == 'verifying' else status.HTTP_200_OK
+        )
+
+    @extend_schema(
+        summary="Cancelar una subida por partes",
+        description="Descarta los fragmentos recibidos. Una subida completada solo elimina su registro.",
+        responses={204: None, 404: None},
+        tags=['uploads']
+    )
+    def destroy(self, request, pk=None):
+        """Cancelar una subida por partes"""
+        upload = self.get_upload(request, pk)
+        discard_temp_file(upload)
+        upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
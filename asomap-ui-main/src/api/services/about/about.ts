@@ -2,92 +2,28 @@ import { ENDPOINTS } from '@/constants';
 import { AboutResponse } from '@/interfaces';
 import { debugLog, errorLog, getApiUrl, getImageUrl } from '@/utils/environment';
 
-// Función helper para extraer datos de respuesta paginada
-const extractData = (response: any): any => {
-    // Si la respuesta tiene estructura paginada (count, results, etc.)
-    if (response && typeof response === 'object' && 'results' in response) {
-        // Si results es un array, devolver el array completo
-        if (Array.isArray(response.results)) {
-            return response.results;
-        }
-        // Si results es un objeto directo
-        return response.results;
-    }
-    // Si la respuesta es directa (sin paginación)
-    return response;
-};
-
 export const aboutService = {
     getAbout: async (): Promise<AboutResponse> => {
             try {
-        const [
-            heroResponse,
-            quienesSomosResponse,
-            historiaResponse,
-            misionResponse,
-            visionResponse,
-            valoresResponse,
-        ] = await Promise.all([
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.HERO)),
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.ABOUT_US)),
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.OUR_HISTORY)),
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.MISION)),
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.VISION)),
-            fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.VALUES)),
-        ]);
-
-        // Obtener todas las páginas del consejo de directores
-        const getAllConsejoDirectores = async () => {
-            const allDirectores = [];
-            let nextUrl = getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.DIRECTOR_BOARD);
-            
-            while (nextUrl) {
-                const response = await fetch(nextUrl);
-                const data = await response.json();
-                
-                if (data.results && Array.isArray(data.results)) {
-                    allDirectores.push(...data.results);
-                }
-                
-                nextUrl = data.next || null;
-            }
-            
-            // Ordenar por ID para mantener el orden correcto
-            return allDirectores.sort((a, b) => a.id - b.id);
-        };
-
-        const consejo = await getAllConsejoDirectores();
-
-                    const [heroRaw, quienesSomosRaw, historiaRaw, misionRaw, visionRaw, valoresRaw] = await Promise.all([
-            heroResponse.json(),
-            quienesSomosResponse.json(),
-            historiaResponse.json(),
-            misionResponse.json(),
-            visionResponse.json(),
-            valoresResponse.json(),
-        ]);
-
-            // Debug logs
-            debugLog('[AboutService] Raw historia response:', historiaRaw);
-            debugLog('[AboutService] Raw quienesSomos response:', quienesSomosRaw);
+        // Todas las secciones en una sola petición (hero, quiénes somos, historia,
+        // misión, visión, valores y consejo de directores)
+        const bundleResponse = await fetch(getApiUrl(ENDPOINTS.COLLECTIONS.ABOUT.BUNDLE));
+        if (!bundleResponse.ok) {
+            throw new Error(`HTTP error! status: ${bundleResponse.status}`);
+        }
+        const bundle = await bundleResponse.json();
 
-            // Extraer datos de las respuestas paginadas
-            const hero = extractData(heroRaw);
-            const quienesSomos = extractData(quienesSomosRaw);
-            const historia = extractData(historiaRaw);
-            const mision = extractData(misionRaw);
-            const vision = extractData(visionRaw);
-            const valores = extractData(valoresRaw);
-            // consejo ya está procesado y ordenado arriba
+            debugLog('[AboutService] Raw bundle response:', bundle);
 
-            // Para endpoints que devuelven un solo elemento, tomar el primero
-            const heroData = Array.isArray(hero) ? hero[0] : hero;
-            const quienesSomosData = Array.isArray(quienesSomos) ? quienesSomos[0] : quienesSomos;
-            const historiaData = Array.isArray(historia) ? historia[0] : historia;
-            const misionData = Array.isArray(mision) ? mision[0] : mision;
-            const visionData = Array.isArray(vision) ? vision[0] : vision;
-            // Para valores, usar el array completo
-            const valoresData = valores; // Mantener el array completo
+            const heroData = bundle.hero;
+            const quienesSomosData = bundle.quienesSomos;
+            // Historia y valores llegan ordenados del más reciente al más antiguo
+            const historiaData = Array.isArray(bundle.nuestraHistoria) ? bundle.nuestraHistoria[0] : bundle.nuestraHistoria;
+            const misionData = bundle.mision;
+            const visionData = bundle.vision;
+            const valoresData = bundle.valores || [];
+            // Ordenar por ID para mantener el orden correcto
+            const consejo: any[] = [...(bundle.consejoDirectores || [])].sort((a: any, b: any) => a.id - b.id);
 
             // Debug logs
             debugLog('[AboutService] Extracted historia:', historiaData);
@@ -2,6 +2,7 @@ export const ENDPOINTS = {
     COLLECTIONS: {
         ABOUT: {
             // Implemented API endpoints
+            BUNDLE: '/about/bundle/',
             HERO: '/about/hero/',
             ABOUT_US: '/about/quienes-somos/',
             OUR_HISTORY: '/about/nuestra-historia/',